@@ -1,2 +1,3 @@
 """Odds API helpers used by report generation."""
 
+ALT_LINES_TOKEN = " || ALT: "
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence
+
+from mlb_pitcher_report.shared.response_cache import env_flag_enabled
+
+ODDS_KEY_POOL_PATH = Path("report_state") / "odds-key-quota.json"
+ODDS_KEY_POOL_PATH_ENV = "MLB_REPORT_ODDS_KEY_POOL_PATH"
+ODDS_KEY_POOL_DISABLE_ENV = "MLB_REPORT_DISABLE_ODDS_KEY_POOL"
+ODDS_KEY_QUOTA_STALE_SECONDS = 24 * 3600
+REQUESTS_REMAINING_HEADER = "X-Requests-Remaining"
+REQUESTS_USED_HEADER = "X-Requests-Used"
+
+
+def key_fingerprint(api_key: str) -> str:
+    return hashlib.sha256(str(api_key).encode("utf-8")).hexdigest()[:16]
+
+
+def _header_count(headers: Mapping[str, Any], name: str) -> Optional[int]:
+    value = headers.get(name)
+    if value is None or value == "":
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def key_pool_persistence_enabled() -> bool:
+    return not env_flag_enabled(ODDS_KEY_POOL_DISABLE_ENV)
+
+
+class ApiKeyPool:
+    def __init__(
+        self,
+        api_keys: Sequence[str],
+        *,
+        min_remaining: int,
+        path: Optional[Path | str] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.keys = list(dict.fromkeys(key for key in api_keys if key))
+        self.min_remaining = int(min_remaining)
+        self.path = Path(path) if path is not None else None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self.quota: Dict[str, Dict[str, Any]] = self._load()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            return {str(fingerprint): dict(entry) for fingerprint, entry in payload["keys"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+
+    def flush(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps({"keys": self.quota}, sort_keys=True)
+            self._dirty = False
+        with self._save_lock:
+            self._write(payload)
+
+    def _write(self, payload: str) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f"{self.path.name}.tmp")
+            temp_path.write_text(payload, encoding="utf-8")
+            temp_path.replace(self.path)
+        except OSError as exc:
+            print(f"\033[93mCould not persist Odds API key quota to {self.path}: {exc}\033[0m")
+
+    def remaining(self, api_key: str) -> Optional[int]:
+        with self._lock:
+            return self._remaining(api_key)
+
+    def _remaining(self, api_key: str) -> Optional[int]:
+        entry = self.quota.get(key_fingerprint(api_key))
+        if not entry or entry.get("remaining") is None:
+            return None
+        if self._clock() - float(entry.get("updated_at") or 0.0) > ODDS_KEY_QUOTA_STALE_SECONDS:
+            return None
+        return int(entry["remaining"])
+
+    def has_headroom(self, api_key: str) -> bool:
+        remaining = self.remaining(api_key)
+        return remaining is None or remaining > self.min_remaining
+
+    def choose(self, exclude: Optional[str] = None) -> Optional[str]:
+        with self._lock:
+            ranked = []
+            for index, api_key in enumerate(self.keys):
+                remaining = self._remaining(api_key)
+                if remaining is not None and remaining <= self.min_remaining:
+                    continue
+                headroom = float("inf") if remaining is None else float(remaining)
+                ranked.append((api_key == exclude, -headroom, index, api_key))
+        if not ranked:
+            return None
+        return min(ranked)[3]
+
+    def record_response(self, api_key: str, headers: Mapping[str, Any]) -> None:
+        remaining = _header_count(headers, REQUESTS_REMAINING_HEADER)
+        used = _header_count(headers, REQUESTS_USED_HEADER)
+        if remaining is None and used is None:
+            return
+        with self._lock:
+            had_headroom = self._remaining(api_key) is None or self._remaining(api_key) > self.min_remaining
+            entry = self.quota.setdefault(key_fingerprint(api_key), {})
+            if remaining is not None:
+                entry["remaining"] = remaining
+            if used is not None:
+                entry["used"] = used
+            entry["updated_at"] = self._clock()
+            self._dirty = True
+            rotated = had_headroom and remaining is not None and remaining <= self.min_remaining
+        # Counters stay live in memory; the file is only rewritten when a key drops out of rotation
+        # or when the run flushes, so the slate fan-out does not hit the disk on every response.
+        if rotated:
+            self.flush()
+
+    def mark_exhausted(self, api_key: str) -> None:
+        with self._lock:
+            entry = self.quota.setdefault(key_fingerprint(api_key), {})
+            entry["remaining"] = 0
+            entry["updated_at"] = self._clock()
+            self._dirty = True
+        self.flush()
+
+    def describe(self, api_key: str) -> str:
+        remaining = self.remaining(api_key)
+        return f"{key_fingerprint(api_key)[:8]} | Requests remaining: {'unknown' if remaining is None else remaining}"
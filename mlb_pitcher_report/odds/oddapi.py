@@ -1,36 +1,60 @@
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import threading
 import time
 from collections import Counter
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date as Date, datetime, timezone
 from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+from zoneinfo import ZoneInfo
 
 import pandas as pd
 import requests
 import statsapi
 from unidecode import unidecode
 
+from mlb_pitcher_report.odds import ALT_LINES_TOKEN
+from mlb_pitcher_report.odds.key_pool import (
+    ODDS_KEY_POOL_PATH,
+    ODDS_KEY_POOL_PATH_ENV,
+    ApiKeyPool,
+    key_pool_persistence_enabled,
+)
+from mlb_pitcher_report.odds.odds_history import get_odds_history_store
+from mlb_pitcher_report.shared.http_client import http_get
+from mlb_pitcher_report.shared.player_directory import get_player_directory
+
 ODDS_API_BASE_URL = "https://api.the-odds-api.com/v4"
 KEYS_FILE = Path("keys.json")
 MIN_REQUESTS_REMAINING = 30
 REQUEST_TIMEOUT_SECONDS = 12
 IGNORED_BOOKMAKERS = {"mybookieag", "betmgm", "superbook", "bovada"}
 BOOKMAKER_TITLE_OVERRIDES = {"betonlineag": "BetOnline.ag"}
-MIN_REQUEST_INTERVAL_SECONDS = 0.35
 MAX_429_RETRIES = 4
 MAX_BACKOFF_SECONDS = 12.0
+SLATE_TIMEZONE = ZoneInfo("America/New_York")
+SCHEDULE_EVENT_MAX_OFFSET_SECONDS = 6 * 3600
+ODDS_FETCH_WORKERS = int(os.environ.get("MLB_REPORT_ODDS_FETCH_WORKERS") or 4)
+ODDS_REQUESTS_PER_SECOND = float(os.environ.get("MLB_REPORT_ODDS_REQUESTS_PER_SECOND") or 3.0)
+ODDS_REQUEST_BURST = int(os.environ.get("MLB_REPORT_ODDS_REQUEST_BURST") or ODDS_FETCH_WORKERS)
+
+PitcherBookLines = Dict[str, Dict[str, str]]
+T = TypeVar("T")
 
 _cached_api_key: Optional[str] = None
-_last_request_ts = 0.0
+_key_pool: Optional[ApiKeyPool] = None
+_key_pool_lock = threading.Lock()
 _events_cache: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
 _event_id_cache: Dict[Tuple[str, str, str], Optional[str]] = {}
 _event_data_cache: Dict[str, Dict[str, Any]] = {}
-_event_pitcher_odds_cache: Dict[str, pd.DataFrame] = {}
+_event_pitcher_lines_cache: Dict[str, PitcherBookLines] = {}
 _pitcher_team_cache: Dict[str, Optional[str]] = {}
-ALT_LINES_TOKEN = " || ALT: "
 TEAM_NAME_ALIASES: Dict[str, Tuple[str, ...]] = {
     "athletics": ("athletics", "oakland athletics"),
     "oakland athletics": ("athletics", "oakland athletics"),
@@ -80,11 +104,11 @@ def _choose_best_player_match(players: List[Dict[str, Any]], pitcher_name: str)
     return players[0]
 
 
-def _is_429_error(exc: requests.exceptions.RequestException) -> bool:
+def _is_key_refresh_error(exc: requests.exceptions.RequestException) -> bool:
     return bool(
         isinstance(exc, requests.exceptions.HTTPError)
         and exc.response is not None
-        and exc.response.status_code == 429
+        and exc.response.status_code in {401, 429}
     )
 
 
@@ -105,22 +129,102 @@ def _safe_parse_retry_after(header_value: Optional[str]) -> Optional[float]:
         return None
 
 
-def _throttle_requests() -> None:
-    global _last_request_ts
-    now = time.monotonic()
-    wait = MIN_REQUEST_INTERVAL_SECONDS - (now - _last_request_ts)
-    if wait > 0:
-        time.sleep(wait)
-    _last_request_ts = time.monotonic()
+class TokenBucketRateLimiter:
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        max_in_flight: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = max(float(rate), 1e-6)
+        self.capacity = max(float(capacity), 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max(int(max_in_flight), 1))
+        self._tokens = self.capacity
+        self._updated = clock()
+        self.requests = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.rate_limited = 0
+        self.retries = 0
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = self._clock()
+            if now > self._updated:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= 1.0
+            wait = (self._updated - now) + max(-self._tokens, 0.0) / self.rate
+            self.requests += 1
+            if wait > 0:
+                self.waits += 1
+                self.wait_seconds += wait
+            return wait
+
+    def block_for(self, seconds: float) -> None:
+        with self._lock:
+            now = self._clock()
+            if now > self._updated:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            resume_at = now + max(float(seconds), 0.0)
+            if resume_at > self._updated:
+                self._tokens = 1.0
+                self._updated = resume_at
+
+    def record_rate_limited(self, retry_after: float) -> None:
+        with self._lock:
+            self.rate_limited += 1
+        self.block_for(retry_after)
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self._in_flight.acquire()
+        try:
+            wait = self.reserve()
+            if wait > 0:
+                self._sleep(wait)
+            yield
+        finally:
+            self._in_flight.release()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "waits": self.waits,
+                "wait_seconds": round(self.wait_seconds, 3),
+                "rate_limited": self.rate_limited,
+                "retries": self.retries,
+            }
+
+
+_rate_limiter = TokenBucketRateLimiter(ODDS_REQUESTS_PER_SECOND, ODDS_REQUEST_BURST, ODDS_FETCH_WORKERS)
+
+
+def odds_rate_limiter_metrics() -> Dict[str, Any]:
+    return _rate_limiter.metrics()
 
 
 def _request_with_backoff(url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
     last_exc: Optional[requests.exceptions.RequestException] = None
 
     for attempt in range(MAX_429_RETRIES + 1):
-        _throttle_requests()
+        if attempt:
+            _rate_limiter.record_retry()
         try:
-            response = requests.get(url, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
+            with _rate_limiter.slot():
+                response = http_get(url, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
         except requests.exceptions.RequestException as exc:
             last_exc = exc
             if attempt >= MAX_429_RETRIES:
@@ -130,6 +234,13 @@ def _request_with_backoff(url: str, params: Optional[Dict[str, Any]] = None) ->
             time.sleep(delay)
             continue
 
+        api_key = (params or {}).get("apiKey")
+        if api_key:
+            key_pool = get_key_pool()
+            key_pool.record_response(api_key, response.headers)
+            if response.status_code == 401:
+                key_pool.mark_exhausted(api_key)
+
         if response.status_code != 429:
             response.raise_for_status()
             return response
@@ -138,11 +249,11 @@ def _request_with_backoff(url: str, params: Optional[Dict[str, Any]] = None) ->
         if delay is None:
             delay = min(1.5 * (2**attempt), MAX_BACKOFF_SECONDS)
         delay = min(max(delay, 1.0), MAX_BACKOFF_SECONDS)
+        _rate_limiter.record_rate_limited(delay)
 
         if attempt >= MAX_429_RETRIES:
             response.raise_for_status()
         print(f"\033[93mOdds API rate limited (429). Retrying in {delay:.1f}s...\033[0m")
-        time.sleep(delay)
 
     if last_exc is not None:
         raise last_exc
@@ -161,39 +272,33 @@ def load_api_keys(keys_file: Path = KEYS_FILE) -> List[str]:
     return [key for key in config.get("api_keys", []) if key]
 
 
-def check_api_requests_remaining() -> Optional[str]:
-    api_keys = load_api_keys()
-    if not api_keys:
-        print("\033[91mNo API keys found in keys.json.\033[0m")
-        return None
-
-    for key in api_keys:
-        url = f"{ODDS_API_BASE_URL}/sports/"
-        try:
-            response = _request_with_backoff(url, params={"apiKey": key})
-            requests_remaining = response.headers.get("X-Requests-Remaining")
-            if requests_remaining is None:
-                print(f"API Key: {key} | X-Requests-Remaining header not found.")
-                continue
-
-            remaining = int(requests_remaining)
-            if remaining > MIN_REQUESTS_REMAINING:
-                print(
-                    f"\033[92mUsing API Key: {key} | "
-                    f"Requests remaining: {remaining}\033[0m"
-                )
-                return key
-        except requests.exceptions.RequestException as exc:
-            print(f"An error occurred while checking API key {key}: {exc}")
-
-    print("No API keys with sufficient requests remaining.")
-    return None
+def get_key_pool() -> ApiKeyPool:
+    global _key_pool
+    with _key_pool_lock:
+        if _key_pool is None:
+            path = os.environ.get(ODDS_KEY_POOL_PATH_ENV) or ODDS_KEY_POOL_PATH
+            _key_pool = ApiKeyPool(
+                load_api_keys(),
+                min_remaining=MIN_REQUESTS_REMAINING,
+                path=path if key_pool_persistence_enabled() else None,
+            )
+            atexit.register(_key_pool.flush)
+        return _key_pool
 
 
 def get_api_key(force_refresh: bool = False) -> Optional[str]:
     global _cached_api_key
-    if force_refresh or _cached_api_key is None:
-        _cached_api_key = check_api_requests_remaining()
+    key_pool = get_key_pool()
+    if not key_pool:
+        print("\033[91mNo API keys found in keys.json.\033[0m")
+        return None
+    if force_refresh or _cached_api_key is None or not key_pool.has_headroom(_cached_api_key):
+        previous_key = _cached_api_key
+        _cached_api_key = key_pool.choose(exclude=previous_key if force_refresh else None)
+        if _cached_api_key is None:
+            print("No API keys with sufficient requests remaining.")
+        elif _cached_api_key != previous_key:
+            print(f"\033[92mUsing API Key: {key_pool.describe(_cached_api_key)}\033[0m")
     return _cached_api_key
 
 
@@ -222,7 +327,7 @@ def get_event_id_by_team(team_name: str, api_key: Optional[str], date: str) -> O
         return event_id
     except requests.exceptions.RequestException as exc:
         print(f"An error occurred while requesting the API: {exc}")
-        if _is_429_error(exc):
+        if _is_key_refresh_error(exc):
             refreshed_key = get_api_key(force_refresh=True)
             if refreshed_key and refreshed_key != api_key:
                 retry_cache_key = (refreshed_key, date, team_name)
@@ -252,10 +357,86 @@ def request_event_id(
     return None
 
 
+def _parse_iso_datetime(value: Any) -> Optional[datetime]:
+    text = str(value or "").strip()
+    if not text:
+        return None
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _parse_slate_date(value: Any) -> Optional[Date]:
+    text = str(value or "").strip()
+    for date_format in ("%Y-%m-%d", "%m/%d/%Y"):
+        try:
+            return datetime.strptime(text, date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _event_slate_date(event: Dict[str, Any]) -> Optional[Date]:
+    commence = _parse_iso_datetime(event.get("commence_time"))
+    if commence is None:
+        return None
+    if commence.tzinfo is None:
+        commence = commence.replace(tzinfo=timezone.utc)
+    return commence.astimezone(SLATE_TIMEZONE).date()
+
+
+def match_schedule_events(
+    schedule: List[Dict[str, Any]],
+    events: List[Dict[str, Any]],
+    slate_date: Optional[Date] = None,
+) -> Dict[Any, str]:
+    event_ids: Dict[Any, str] = {}
+    for game in schedule:
+        away_variants = _team_name_variants(game.get("away_name"))
+        home_variants = _team_name_variants(game.get("home_name"))
+        candidates = [
+            event
+            for event in events
+            if event.get("id")
+            and _normalize_team_name(event.get("away_team")) in away_variants
+            and _normalize_team_name(event.get("home_team")) in home_variants
+        ]
+        start = _parse_iso_datetime(game.get("game_datetime"))
+        if start is not None:
+            offsets = [
+                (abs((commence - start).total_seconds()), index)
+                for index, commence in enumerate(_parse_iso_datetime(event.get("commence_time")) for event in candidates)
+                if commence is not None
+            ]
+            offset, index = min(offsets, default=(None, None))
+            if offset is not None and offset <= SCHEDULE_EVENT_MAX_OFFSET_SECONDS:
+                event_ids[game.get("game_id")] = str(candidates[index]["id"])
+            continue
+
+        game_date = _parse_slate_date(game.get("game_date")) or slate_date
+        same_day = [event for event in candidates if game_date is not None and _event_slate_date(event) == game_date]
+        if len(same_day) == 1:
+            event_ids[game.get("game_id")] = str(same_day[0]["id"])
+    return event_ids
+
+
+def clear_event_odds_caches() -> None:
+    _event_data_cache.clear()
+    _event_pitcher_lines_cache.clear()
+
+
 def fetch_game_data(event_id: str, api_key: str) -> Dict[str, Any]:
     if event_id in _event_data_cache:
         return _event_data_cache[event_id]
 
+    history = get_odds_history_store()
+    if history is not None:
+        stored = history.latest_payload(event_id)
+        if stored is not None:
+            _event_data_cache[event_id] = stored
+            return stored
+
     url = f"{ODDS_API_BASE_URL}/sports/baseball_mlb/events/{event_id}/odds"
     params = {
         "apiKey": api_key,
@@ -265,6 +446,8 @@ def fetch_game_data(event_id: str, api_key: str) -> Dict[str, Any]:
     }
     response = _request_with_backoff(url, params=params)
     data = response.json()
+    if history is not None:
+        history.record_event(event_id, data)
     _event_data_cache[event_id] = data
     return data
 
@@ -412,35 +595,60 @@ def process_bookmaker_outcomes(
     return data
 
 
-def build_event_odds_dataframe(data: List[Dict[str, str]]) -> pd.DataFrame:
-    if not data:
-        return pd.DataFrame()
-    df = pd.DataFrame(data)
-    if df.empty or "pitcher" not in df.columns:
-        return pd.DataFrame()
-    return df.pivot_table(index="pitcher", aggfunc="first").reset_index()
+def build_pitcher_book_lines(data: List[Dict[str, str]]) -> PitcherBookLines:
+    lines: PitcherBookLines = {}
+    for entry in data:
+        pitcher = entry.get("pitcher")
+        if pitcher is None:
+            continue
+        book_lines = lines.setdefault(pitcher, {})
+        for book, line in entry.items():
+            if book != "pitcher" and line is not None:
+                book_lines.setdefault(book, line)
+    return lines
 
 
-def _filter_pitcher_from_event_df(event_df: pd.DataFrame, pitcher_name: str) -> pd.DataFrame:
-    if event_df.empty or "pitcher" not in event_df.columns:
+def pitcher_book_lines_frame(lines: PitcherBookLines) -> pd.DataFrame:
+    if not lines:
         return pd.DataFrame()
+    pitchers = sorted(lines)
+    books = sorted({book for book_lines in lines.values() for book in book_lines})
+    columns: Dict[str, List[Any]] = {"pitcher": pitchers}
+    for book in books:
+        columns[book] = [lines[pitcher].get(book) for pitcher in pitchers]
+    return pd.DataFrame(columns)
 
-    clean_pitcher_name = unidecode(pitcher_name)
-    if clean_pitcher_name:
-        df_filtered = event_df[event_df["pitcher"] == clean_pitcher_name].copy()
-    else:
-        df_filtered = event_df.copy()
 
-    if df_filtered.empty:
-        return pd.DataFrame()
+def build_event_odds_dataframe(data: List[Dict[str, str]]) -> pd.DataFrame:
+    return pitcher_book_lines_frame(build_pitcher_book_lines(data))
 
-    df_filtered.loc[:, "pitcher"] = pitcher_name
-    return df_filtered
+
+def _filter_pitcher_lines(lines: PitcherBookLines, pitcher_name: str) -> PitcherBookLines:
+    clean_pitcher_name = unidecode(pitcher_name)
+    if not clean_pitcher_name:
+        return lines
+    book_lines = lines.get(clean_pitcher_name)
+    return {pitcher_name: book_lines} if book_lines else {}
 
 
 def build_dataframe(data: List[Dict[str, str]], pitcher_name: str) -> pd.DataFrame:
-    event_df = build_event_odds_dataframe(data)
-    return _filter_pitcher_from_event_df(event_df, pitcher_name)
+    return pitcher_book_lines_frame(_filter_pitcher_lines(build_pitcher_book_lines(data), pitcher_name))
+
+
+def get_event_pitcher_lines(event_id: str, api_key: str) -> PitcherBookLines:
+    if event_id in _event_pitcher_lines_cache:
+        return _event_pitcher_lines_cache[event_id]
+
+    game_data = fetch_game_data(event_id, api_key)
+    if not game_data.get("bookmakers"):
+        return {}
+
+    data: List[Dict[str, str]] = []
+    for bookmaker in game_data.get("bookmakers", []):
+        data.extend(process_bookmaker_outcomes(bookmaker, IGNORED_BOOKMAKERS))
+    lines = build_pitcher_book_lines(data)
+    _event_pitcher_lines_cache[event_id] = lines
+    return lines
 
 
 def get_pitcher_odds(
@@ -450,23 +658,10 @@ def get_pitcher_odds(
     allow_key_refresh: bool = True,
 ) -> pd.DataFrame:
     try:
-        if event_id in _event_pitcher_odds_cache:
-            event_df = _event_pitcher_odds_cache[event_id]
-        else:
-            game_data = fetch_game_data(event_id, api_key)
-            if not game_data.get("bookmakers"):
-                return pd.DataFrame()
-
-            data: List[Dict[str, str]] = []
-            for bookmaker in game_data.get("bookmakers", []):
-                data.extend(process_bookmaker_outcomes(bookmaker, IGNORED_BOOKMAKERS))
-            event_df = build_event_odds_dataframe(data)
-            _event_pitcher_odds_cache[event_id] = event_df
-
-        return _filter_pitcher_from_event_df(event_df, pitcher_name)
+        return pitcher_book_lines_frame(_filter_pitcher_lines(get_event_pitcher_lines(event_id, api_key), pitcher_name))
     except requests.exceptions.RequestException as exc:
         print(f"\033[91mAn error occurred while requesting the API: {exc}\033[0m")
-        if allow_key_refresh and _is_429_error(exc):
+        if allow_key_refresh and _is_key_refresh_error(exc):
             refreshed_key = get_api_key(force_refresh=True)
             if refreshed_key and refreshed_key != api_key:
                 return get_pitcher_odds(event_id, refreshed_key, pitcher_name, allow_key_refresh=False)
@@ -478,14 +673,17 @@ def get_pitcher_team(pitcher_name: str) -> Optional[str]:
         return _pitcher_team_cache[pitcher_name]
 
     try:
-        players = statsapi.lookup_player(pitcher_name)
-        player = _choose_best_player_match(players or [], pitcher_name)
-        if not player:
-            _pitcher_team_cache[pitcher_name] = None
-            return None
-
-        current_team = player.get("currentTeam") or {}
-        team_id = current_team.get("id")
+        directory = get_player_directory()
+        entry = directory.find(pitcher_name, position_type="Pitcher") if directory is not None else None
+        if entry is not None:
+            team_id = entry.get("team_id")
+        else:
+            players = statsapi.lookup_player(pitcher_name)
+            player = _choose_best_player_match(players or [], pitcher_name)
+            if not player:
+                _pitcher_team_cache[pitcher_name] = None
+                return None
+            team_id = (player.get("currentTeam") or {}).get("id")
         if team_id is None:
             _pitcher_team_cache[pitcher_name] = None
             return None
@@ -526,6 +724,55 @@ def get_pitcher_odds_by_team(pitcher_name: str, date: str) -> Optional[pd.DataFr
         return None
 
 
+def _with_key_refresh(api_key: str, request: Callable[[str], T]) -> T:
+    try:
+        return request(api_key)
+    except requests.exceptions.RequestException as exc:
+        if not _is_key_refresh_error(exc):
+            raise
+        refreshed_key = get_api_key(force_refresh=True)
+        if not refreshed_key or refreshed_key == api_key:
+            raise
+        return request(refreshed_key)
+
+
+def get_slate_pitcher_lines(schedule: List[Dict[str, Any]], date: str) -> PitcherBookLines:
+    api_key = get_api_key()
+    if not api_key:
+        print("\033[91mNo valid Odds API key available.\033[0m")
+        return {}
+
+    try:
+        events = _with_key_refresh(api_key, lambda key: _fetch_events_for_date(key, date))
+    except requests.exceptions.RequestException as exc:
+        print(f"\033[91mAn error occurred while requesting the API: {exc}\033[0m")
+        return {}
+
+    event_ids = list(dict.fromkeys(match_schedule_events(schedule, events, _parse_slate_date(date)).values()))
+    if not event_ids:
+        return {}
+
+    failed_events: List[str] = []
+
+    def fetch_event(event_id: str) -> PitcherBookLines:
+        try:
+            return _with_key_refresh(get_api_key() or api_key, lambda key: get_event_pitcher_lines(event_id, key))
+        except requests.exceptions.RequestException as exc:
+            print(f"\033[91mOdds request failed for event {event_id}: {exc}\033[0m")
+            failed_events.append(event_id)
+            return {}
+
+    slate_lines: PitcherBookLines = {}
+    with ThreadPoolExecutor(max_workers=min(ODDS_FETCH_WORKERS, len(event_ids))) as executor:
+        for event_lines in executor.map(fetch_event, event_ids):
+            for pitcher, book_lines in sorted(event_lines.items()):
+                slate_lines.setdefault(_normalize_person_name(pitcher), book_lines)
+    get_key_pool().flush()
+    if failed_events:
+        print(f"\033[93mOdds unavailable for {len(failed_events)} of {len(event_ids)} events.\033[0m")
+    return slate_lines
+
+
 if __name__ == "__main__":
     import sys
 
@@ -536,3 +783,4 @@ if __name__ == "__main__":
         pitcher_odds = get_pitcher_odds_by_team(name, datetime.now().strftime("%Y-%m-%d"))
         if pitcher_odds is not None and not pitcher_odds.empty:
             print(pitcher_odds)
+        print(f"Odds API requests: {odds_rate_limiter_metrics()}")
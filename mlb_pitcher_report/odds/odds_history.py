@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import datetime as dt
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from mlb_pitcher_report.shared.response_cache import PersistentStoreSingleton
+
+ODDS_HISTORY_PATH = Path("report_state") / "odds-history.sqlite3"
+ODDS_HISTORY_PATH_ENV = "MLB_REPORT_ODDS_HISTORY_PATH"
+ODDS_HISTORY_DISABLE_ENV = "MLB_REPORT_DISABLE_ODDS_HISTORY"
+ODDS_SNAPSHOT_MAX_AGE_SECONDS = float(os.environ.get("MLB_REPORT_ODDS_SNAPSHOT_MAX_AGE") or 600.0)
+ODDS_HISTORY_MARKET = "pitcher_strikeouts"
+ODDS_HISTORY_RETENTION_DAYS = 7
+ODDS_HISTORY_PRUNE_INTERVAL_SECONDS = 3600.0
+
+# book_key, book_title, pitcher, point, over_price, under_price
+OddsLineRow = Tuple[str, str, str, float, Optional[int], Optional[int]]
+
+
+def _price(value: Any) -> Optional[int]:
+    try:
+        return None if value is None else int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def extract_odds_line_rows(payload: Dict[str, Any]) -> List[OddsLineRow]:
+    rows: Dict[Tuple[str, str, float], List[Any]] = {}
+    for bookmaker in payload.get("bookmakers") or []:
+        book_key = str(bookmaker.get("key") or "").strip()
+        book_title = str(bookmaker.get("title") or "").strip()
+        for market in bookmaker.get("markets") or []:
+            if market.get("key") != ODDS_HISTORY_MARKET:
+                continue
+            for outcome in market.get("outcomes") or []:
+                pitcher = outcome.get("description")
+                point = outcome.get("point")
+                side = outcome.get("name")
+                if pitcher is None or point is None or side not in {"Over", "Under"}:
+                    continue
+                row = rows.setdefault((book_key, str(pitcher), float(point)), [book_title, None, None])
+                row[1 if side == "Over" else 2] = _price(outcome.get("price"))
+    return [
+        (book_key, book_title, pitcher, point, over_price, under_price)
+        for (book_key, pitcher, point), (book_title, over_price, under_price) in rows.items()
+    ]
+
+
+def build_odds_payload(event_id: str, rows: Sequence[OddsLineRow]) -> Dict[str, Any]:
+    bookmakers: Dict[str, Dict[str, Any]] = {}
+    for book_key, book_title, pitcher, point, over_price, under_price in rows:
+        bookmaker = bookmakers.setdefault(
+            book_key,
+            {"key": book_key, "title": book_title, "markets": [{"key": ODDS_HISTORY_MARKET, "outcomes": []}]},
+        )
+        outcomes = bookmaker["markets"][0]["outcomes"]
+        for side, price in (("Over", over_price), ("Under", under_price)):
+            if price is not None:
+                outcomes.append({"name": side, "description": pitcher, "point": point, "price": price})
+    return {"id": event_id, "bookmakers": list(bookmakers.values())}
+
+
+class OddsHistoryStore:
+    def __init__(self, path: Path | str, *, clock: Callable[[], float] = time.time) -> None:
+        self.path = Path(path)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pruned_at: Optional[float] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                "snapshot_id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "event_id TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, "
+                "commence_time TEXT"
+                ")"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS snapshots_event_fetched ON snapshots (event_id, fetched_at)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS odds_lines ("
+                "snapshot_id INTEGER NOT NULL, "
+                "book_key TEXT NOT NULL, "
+                "book_title TEXT NOT NULL, "
+                "pitcher TEXT NOT NULL, "
+                "point REAL NOT NULL, "
+                "over_price INTEGER, "
+                "under_price INTEGER"
+                ")"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS odds_lines_snapshot ON odds_lines (snapshot_id)")
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def record_event(self, event_id: str, payload: Dict[str, Any], fetched_at: Optional[float] = None) -> int:
+        rows = extract_odds_line_rows(payload)
+        fetched_at = self._clock() if fetched_at is None else float(fetched_at)
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                cursor = connection.execute(
+                    "INSERT INTO snapshots (event_id, fetched_at, commence_time) VALUES (?, ?, ?)",
+                    (str(event_id), fetched_at, payload.get("commence_time")),
+                )
+                snapshot_id = int(cursor.lastrowid)
+                connection.executemany(
+                    "INSERT INTO odds_lines (snapshot_id, book_key, book_title, pitcher, point, over_price, under_price) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(snapshot_id, *row) for row in rows],
+                )
+            if self._pruned_at is None or fetched_at - self._pruned_at >= ODDS_HISTORY_PRUNE_INTERVAL_SECONDS:
+                self._prune(connection)
+        return snapshot_id
+
+    def prune(self) -> int:
+        with self._lock:
+            return self._prune(self._connect())
+
+    def _prune(self, connection: sqlite3.Connection) -> int:
+        now = self._clock()
+        cutoff = now - ODDS_HISTORY_RETENTION_DAYS * 24 * 3600
+        cutoff_text = dt.datetime.fromtimestamp(cutoff, dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        with connection:
+            stale_ids = [
+                int(row[0])
+                for row in connection.execute(
+                    "SELECT snapshot_id FROM snapshots WHERE commence_time < ? "
+                    "OR (commence_time IS NULL AND fetched_at < ?)",
+                    (cutoff_text, cutoff),
+                )
+            ]
+            for start in range(0, len(stale_ids), 500):
+                chunk = stale_ids[start : start + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                connection.execute(f"DELETE FROM odds_lines WHERE snapshot_id IN ({placeholders})", chunk)
+                connection.execute(f"DELETE FROM snapshots WHERE snapshot_id IN ({placeholders})", chunk)
+        self._pruned_at = now
+        return len(stale_ids)
+
+    def _snapshot_rows(self, connection: sqlite3.Connection, snapshot_id: int) -> List[OddsLineRow]:
+        return [
+            (book_key, book_title, pitcher, float(point), over_price, under_price)
+            for book_key, book_title, pitcher, point, over_price, under_price in connection.execute(
+                "SELECT book_key, book_title, pitcher, point, over_price, under_price "
+                "FROM odds_lines WHERE snapshot_id = ?",
+                (snapshot_id,),
+            )
+        ]
+
+    def latest_payload(
+        self,
+        event_id: str,
+        max_age_seconds: float = ODDS_SNAPSHOT_MAX_AGE_SECONDS,
+    ) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            connection = self._connect()
+            latest = connection.execute(
+                "SELECT snapshot_id, fetched_at FROM snapshots WHERE event_id = ? "
+                "ORDER BY fetched_at DESC, snapshot_id DESC LIMIT 1",
+                (str(event_id),),
+            ).fetchone()
+            if latest is None or self._clock() - float(latest[1]) > max_age_seconds:
+                return None
+            return build_odds_payload(str(event_id), self._snapshot_rows(connection, int(latest[0])))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def _open_odds_history_store(path: str) -> OddsHistoryStore:
+    store = OddsHistoryStore(path)
+    store.prune()
+    return store
+
+
+_DEFAULT_STORE = PersistentStoreSingleton(
+    "Odds history store",
+    _open_odds_history_store,
+    default_path=ODDS_HISTORY_PATH,
+    path_env=ODDS_HISTORY_PATH_ENV,
+    disable_env=ODDS_HISTORY_DISABLE_ENV,
+)
+
+
+def odds_history_enabled() -> bool:
+    return _DEFAULT_STORE.enabled()
+
+
+def get_odds_history_store() -> Optional[OddsHistoryStore]:
+    return _DEFAULT_STORE.get()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import datetime as dt
 import json
 import sys
@@ -9,14 +10,12 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
 
 import pandas as pd
-from bs4 import BeautifulSoup
 
 from mlb_pitcher_report.shared.report_data import (
     aggregate_stat_lines,
-    build_pitcher_profile_stats,
     build_espn_event_snapshot_lookup,
     compute_hit_streak,
-    compute_recent_metrics,
+    compute_recent_metrics_batch,
     extract_confirmed_espn_lineup,
     extract_espn_game_total,
     fetch_game_batter_stat_lines,
@@ -47,6 +46,10 @@ from mlb_pitcher_report.reports.pitchers import (
     get_opp_data as get_pitcher_lineup_matchup_data,
     prepare_pitcher_whiff_lookup,
 )
+from mlb_pitcher_report.shared.pitcher_profiles import get_pitcher_profile
+from mlb_pitcher_report.shared.slate_prefetch import prefetch_slate
+from mlb_pitcher_report.shared.slate_snapshot import split_snapshot_flags, use_slate_snapshot
+from mlb_pitcher_report.shared.slate_state import INCREMENTAL_FLAG, open_incremental_cache
 from mlb_pitcher_report.shared.site_nav import build_date_nav_html, build_report_tabs
 from mlb_pitcher_report.shared.team_logos import get_team_logo_src
 
@@ -60,6 +63,11 @@ SOURCE_ESPN = "ESPN Confirmed"
 SOURCE_ACTIVE = "Active Roster"
 RECENT_GAMES = 7
 RECENT_WINDOW_DAYS = 14
+METRIC_WINDOWS = {
+    "season": {},
+    "recent7": {"max_games": RECENT_GAMES},
+    "recent14": {"window_days": RECENT_WINDOW_DAYS},
+}
 FALLBACK_POOL_LIMIT = 12
 STREAK_SECTION_MIN = 3
 ACTIVE_STREAK_SECTION_MIN = 6
@@ -134,6 +142,13 @@ def build_candidate_rows(
     current_game_batter_lines: Optional[Dict[int, Dict[str, Any]]] = None,
 ) -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
+    game_logs_by_id: Dict[int, List[Dict[str, Any]]] = {}
+    for roster_entry in roster_entries:
+        person_id = _to_int((roster_entry.get("person") or {}).get("id"))
+        if person_id is not None and person_id in people_by_id:
+            game_logs_by_id[person_id] = extract_game_logs(people_by_id[person_id])
+    metrics_by_id = compute_recent_metrics_batch(game_logs_by_id, report_date, METRIC_WINDOWS)
+
     for roster_entry in roster_entries:
         person_info = roster_entry.get("person") or {}
         person_id = _to_int(person_info.get("id"))
@@ -145,17 +160,21 @@ def build_candidate_rows(
             continue
 
         indexed = index_stat_blocks(person)
-        game_logs = extract_game_logs(person)
-        season = compute_recent_metrics(game_logs, report_date)
-        recent7 = compute_recent_metrics(game_logs, report_date, max_games=RECENT_GAMES)
-        recent14 = compute_recent_metrics(game_logs, report_date, window_days=RECENT_WINDOW_DAYS)
+        game_logs = game_logs_by_id[person_id]
+        season = metrics_by_id[person_id]["season"]
+        recent7 = metrics_by_id[person_id]["recent7"]
+        recent14 = metrics_by_id[person_id]["recent14"]
         same_day_vsp = None
         if (
             pitcher_id is not None
             and game_id is not None
             and str(status or "").strip() not in NOT_STARTED_STATUSES
         ):
-            same_day_vsp = fetch_game_batter_vs_pitcher_stat_lines(int(game_id), int(pitcher_id)).get(person_id)
+            same_day_vsp = fetch_game_batter_vs_pitcher_stat_lines(
+                int(game_id),
+                int(pitcher_id),
+                completed=str(status or "").strip() == "Final",
+            ).get(person_id)
         vsp = parse_vs_pitcher_stats(
             indexed,
             batter_id=person_id,
@@ -578,13 +597,13 @@ def _pitcher_profile_lookup(
     profiles: Dict[int, Dict[str, Any]] = {}
     with ThreadPoolExecutor(max_workers=min(12, len(unique_pitcher_ids))) as executor:
         future_to_pitcher_id = {
-            executor.submit(build_pitcher_profile_stats, pitcher_id, int(report_year), report_date): pitcher_id
+            executor.submit(get_pitcher_profile, pitcher_id, int(report_year), report_date): pitcher_id
             for pitcher_id in unique_pitcher_ids
         }
         for future in as_completed(future_to_pitcher_id):
             pitcher_id = future_to_pitcher_id[future]
             try:
-                profiles[pitcher_id] = future.result()
+                profiles[pitcher_id] = future.result() or {}
             except Exception:
                 profiles[pitcher_id] = {}
     return profiles
@@ -1327,6 +1346,8 @@ def _build_worst_pitcher_table_html(report_df: pd.DataFrame, raw_df: pd.DataFram
     if report_df.empty:
         return '<p class="empty-state">No rows available.</p>'
 
+    from bs4 import BeautifulSoup
+
     table_html = report_df.to_html(
         index=False,
         escape=False,
@@ -1445,6 +1466,8 @@ def _build_focus_table_html(report_df: pd.DataFrame, raw_df: pd.DataFrame, *, fo
     if report_df.empty:
         return '<p class="empty-state">No rows available.</p>'
 
+    from bs4 import BeautifulSoup
+
     table_html = report_df.to_html(index=False, escape=False, classes="pitchers-table batters-table", border=0)
     soup = BeautifulSoup(table_html, "html.parser")
     table = soup.find("table")
@@ -2370,10 +2393,24 @@ def write_html(
     return output_path
 
 
-def build_report_rows(schedule: Sequence[Dict[str, Any]], report_date: str) -> List[Dict[str, Any]]:
+def build_report_rows(
+    schedule: Sequence[Dict[str, Any]],
+    report_date: str,
+    *,
+    prefetch: bool = True,
+    incremental: bool = False,
+) -> List[Dict[str, Any]]:
     report_date_obj = dt.datetime.strptime(report_date, "%m/%d/%Y").date()
     report_year = report_date_obj.year
     stats_end_date = report_date_obj - dt.timedelta(days=1)
+    slate_cache = (
+        open_incremental_cache("batters", schedule, report_date, source_files=[__file__])
+        if incremental
+        else None
+    )
+    if prefetch:
+        prefetch_schedule = slate_cache.stale_games(schedule) if slate_cache is not None else schedule
+        prefetch_slate(prefetch_schedule, report_date, people_stats_end_dates=[stats_end_date])
     lineup_locks = load_batter_lineup_locks()
     lineup_locks_changed = False
     espn_event_snapshots = build_espn_event_snapshot_lookup(report_date)
@@ -2394,9 +2431,16 @@ def build_report_rows(schedule: Sequence[Dict[str, Any]], report_date: str) -> L
         if away_team_id is None or home_team_id is None:
             continue
 
+        game_id = _to_int(game.get("game_id"))
+        if slate_cache is not None:
+            cached_rows = slate_cache.get(game_id)
+            if cached_rows is not None:
+                rows.extend(cached_rows)
+                continue
+
+        game_rows: List[Dict[str, Any]] = []
         start_time = _format_local_start_time(game.get("game_datetime"))
         status = str(game.get("status") or "").strip()
-        game_id = _to_int(game.get("game_id"))
         event_snapshot = espn_event_snapshots.get((_normalize_team_name(away_team), _normalize_team_name(home_team))) or {}
         event_id = str(event_snapshot.get("event_id") or "").strip()
         espn_summary = fetch_espn_summary(event_id) if event_id else None
@@ -2406,7 +2450,7 @@ def build_report_rows(schedule: Sequence[Dict[str, Any]], report_date: str) -> L
         total_result = _final_total_result(status, game_total, away_score, home_score)
         final_total_runs = (away_score + home_score) if away_score is not None and home_score is not None else None
         current_game_batter_lines = (
-            fetch_game_batter_stat_lines(int(game_id))
+            fetch_game_batter_stat_lines(int(game_id), completed=True)
             if status == "Final" and game_id is not None
             else {}
         )
@@ -2440,7 +2484,7 @@ def build_report_rows(schedule: Sequence[Dict[str, Any]], report_date: str) -> L
             if not pitcher_name:
                 continue
 
-            pitcher_context = fetch_pitcher_context(pitcher_name)
+            pitcher_context = fetch_pitcher_context(pitcher_name, report_year)
             if not pitcher_context or not pitcher_context.get("id"):
                 continue
 
@@ -2505,22 +2549,48 @@ def build_report_rows(schedule: Sequence[Dict[str, Any]], report_date: str) -> L
             )
             lineup_locks_changed = lineup_locks_changed or changed
             selected_rows = select_offense_rows(candidate_rows, lineup_player_ids)
-            rows.extend(selected_rows)
+            game_rows.extend(selected_rows)
+
+        rows.extend(game_rows)
+        if slate_cache is not None:
+            slate_cache.put(game_id, copy.deepcopy(game_rows))
 
     if lineup_locks_changed:
         save_batter_lineup_locks(lineup_locks)
+    if slate_cache is not None:
+        slate_cache.save()
 
     return rows
 
 
-def main(raw_date_input: str, *, allow_roll_forward: bool = True, write_root: bool = True) -> None:
+def main(
+    raw_date_input: str,
+    *,
+    allow_roll_forward: bool = True,
+    write_root: bool = True,
+    incremental: bool = False,
+    snapshot_mode: Optional[str] = None,
+    snapshot_path: Optional[str] = None,
+) -> None:
     report_date = resolve_date_input(raw_date_input)
-    report_date, schedule = resolve_effective_report_date_and_schedule(
-        report_date,
-        allow_roll_forward=allow_roll_forward,
-    )
+    with use_slate_snapshot(report_date, snapshot_mode, snapshot_path):
+        report_date, schedule = resolve_effective_report_date_and_schedule(
+            report_date,
+            allow_roll_forward=allow_roll_forward,
+        )
+        render_report(report_date, schedule, write_root=write_root, incremental=incremental)
+
+
+def render_report(
+    report_date: str,
+    schedule: Sequence[Dict[str, Any]],
+    *,
+    write_root: bool = True,
+    prefetch: bool = True,
+    incremental: bool = False,
+) -> None:
     report_key = report_date.replace("/", "")
-    rows = build_report_rows(schedule, report_date)
+    rows = build_report_rows(schedule, report_date, prefetch=prefetch, incremental=incremental)
     final_df = sort_batters_for_report(apply_hot_scores(rows))
     report_date_obj = dt.datetime.strptime(report_date, "%m/%d/%Y").date()
     final_df = verify_historical_bvp_for_feature_candidates(final_df, report_date_obj)
@@ -2549,24 +2619,38 @@ def main(raw_date_input: str, *, allow_roll_forward: bool = True, write_root: bo
     )
 
 
-def _parse_cli_args(argv: Sequence[str]) -> tuple[str, bool, bool]:
+def _parse_cli_args(argv: Sequence[str]) -> tuple[str, bool, bool, bool, Optional[str], Optional[str]]:
     if len(argv) < 2:
         print(
             "Usage: python3 -m mlb_pitcher_report.reports.batters "
-            "<today|tmrw|MM/DD|MM/DD/YYYY> [--exact] [--no-root]"
+            "<today|tmrw|MM/DD|MM/DD/YYYY> [--exact] [--no-root] [--incremental] [--snapshot[=PATH]|--from-snapshot[=PATH]]"
         )
         sys.exit(1)
 
-    supported_flags = {"--exact", "--no-root"}
-    raw_flags = [str(flag) for flag in argv[2:]]
+    supported_flags = {"--exact", "--no-root", INCREMENTAL_FLAG}
+    raw_flags, snapshot_mode, snapshot_path = split_snapshot_flags(argv[2:])
     unexpected_flags = [flag for flag in raw_flags if flag not in supported_flags]
     if unexpected_flags:
         print(f"Unsupported flags: {', '.join(unexpected_flags)}")
         sys.exit(1)
 
-    return str(argv[1]), "--exact" in raw_flags, "--no-root" in raw_flags
+    return (
+        str(argv[1]),
+        "--exact" in raw_flags,
+        "--no-root" in raw_flags,
+        INCREMENTAL_FLAG in raw_flags,
+        snapshot_mode,
+        snapshot_path,
+    )
 
 
 if __name__ == "__main__":
-    raw_date_input, exact_mode, no_root = _parse_cli_args(sys.argv)
-    main(raw_date_input, allow_roll_forward=not exact_mode, write_root=not no_root)
+    raw_date_input, exact_mode, no_root, incremental, snapshot_mode, snapshot_path = _parse_cli_args(sys.argv)
+    main(
+        raw_date_input,
+        allow_roll_forward=not exact_mode,
+        write_root=not no_root,
+        incremental=incremental,
+        snapshot_mode=snapshot_mode,
+        snapshot_path=snapshot_path,
+    )
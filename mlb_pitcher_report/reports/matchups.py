@@ -7,12 +7,13 @@ from html import escape
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
 
-import statsapi
-
 from mlb_pitcher_report.shared.report_data import (
+    PitcherGameLogRow,
     aggregate_stat_lines,
+    aggregate_stat_lines_batch,
     build_espn_event_snapshot_lookup,
-    compute_recent_metrics,
+    build_pitcher_game_log_row,
+    compute_recent_metrics_batch,
     extract_confirmed_espn_lineup,
     extract_espn_odds,
     fetch_game_batter_vs_pitcher_stat_lines,
@@ -31,7 +32,6 @@ from mlb_pitcher_report.shared.report_data import (
     first_stat_split,
     format_local_start_time,
     index_stat_blocks,
-    parse_date,
     parse_vs_pitcher_stats,
     resolve_date_input,
     resolve_effective_report_date_and_schedule,
@@ -41,6 +41,10 @@ from mlb_pitcher_report.shared.report_data import (
     to_int,
     normalize_team_name,
 )
+from mlb_pitcher_report.shared.pitcher_profiles import get_pitcher_profile
+from mlb_pitcher_report.shared.slate_prefetch import prefetch_slate
+from mlb_pitcher_report.shared.slate_snapshot import split_snapshot_flags, use_slate_snapshot
+from mlb_pitcher_report.shared.slate_state import INCREMENTAL_FLAG, open_incremental_cache
 from mlb_pitcher_report.shared.site_nav import build_date_nav_html, build_report_tabs
 from mlb_pitcher_report.shared.team_logos import get_team_logo_src
 from mlb_pitcher_report.reports.matchup_styles import _detail_page_css, _summary_page_css
@@ -56,6 +60,11 @@ LINEUP_SOURCE_LAST_GAME = "Last Game Lineup"
 LINEUP_SOURCE_ROSTER = "Roster Fallback"
 RECENT_GAMES = 7
 RECENT_WINDOW_DAYS = 14
+METRIC_WINDOWS = {
+    "recent7": {"max_games": RECENT_GAMES},
+    "recent14": {"window_days": RECENT_WINDOW_DAYS},
+    "season": {},
+}
 LOW_SAMPLE_PA = 18
 
 POSITIVE_BADGES = {"Strong BvP", "Strong vs Hand", "Lineup Hot", "Pitcher Cold"}
@@ -184,42 +193,23 @@ def build_pitcher_recent_form(
     report_date: dt.date,
     limit: int = 5,
 ) -> Dict[str, Any]:
-    starts: List[Dict[str, Any]] = []
+    starts: List[PitcherGameLogRow] = []
     for split in game_log_splits:
-        game_date = parse_date(split.get("date"))
-        if game_date is None or game_date >= report_date:
-            continue
-        stat = split.get("stat") or {}
-        if to_int(stat.get("gamesStarted")) != 1:
-            continue
-        game_info = split.get("game") or {}
-        outs = to_int(stat.get("outs"))
-        if outs is None:
-            outs = innings_string_to_outs(stat.get("inningsPitched"))
-        starts.append(
-            {
-                "date": game_date,
-                "gamePk": to_int(game_info.get("gamePk")) or 0,
-                "outs": outs or 0,
-                "earnedRuns": to_int(stat.get("earnedRuns")) or 0,
-                "hits": to_int(stat.get("hits")) or 0,
-                "walks": to_int(stat.get("baseOnBalls")) or 0,
-                "strikeOuts": to_int(stat.get("strikeOuts")) or 0,
-                "atBats": to_int(stat.get("atBats")) or 0,
-            }
-        )
+        row = build_pitcher_game_log_row(split, report_date)
+        if row is not None and row.games_started == 1:
+            starts.append(row)
 
-    starts.sort(key=lambda row: (row["date"], row["gamePk"]), reverse=True)
+    starts.sort(key=lambda row: (row.date, row.game_pk), reverse=True)
     starts = starts[:limit]
     if not starts:
         return {"Starts": 0, "IP": None, "IP/start": None, "ERA": None, "WHIP": None, "K/9": None, "BB/9": None, "AVG": None}
 
-    total_outs = sum(start["outs"] for start in starts)
-    total_er = sum(start["earnedRuns"] for start in starts)
-    total_hits = sum(start["hits"] for start in starts)
-    total_walks = sum(start["walks"] for start in starts)
-    total_strikeouts = sum(start["strikeOuts"] for start in starts)
-    total_at_bats = sum(start["atBats"] for start in starts)
+    total_outs = sum(start.outs for start in starts)
+    total_er = sum(start.earned_runs for start in starts)
+    total_hits = sum(start.hits for start in starts)
+    total_walks = sum(start.walks for start in starts)
+    total_strikeouts = sum(start.strike_outs for start in starts)
+    total_at_bats = sum(start.at_bats for start in starts)
     innings_pitched = total_outs / 3.0 if total_outs > 0 else 0.0
     starts_count = len(starts)
 
@@ -432,34 +422,27 @@ def _extract_team_pitcher_hand_split(
     return splits.get("vs_lhp") if str(pitcher_hand).upper() == "L" else splits.get("vs_rhp")
 
 
-def _fetch_pitcher_person(pitcher_name: str, season: int) -> Optional[Dict[str, Any]]:
-    pitcher_context = fetch_pitcher_context(pitcher_name)
-    if not pitcher_context or not pitcher_context.get("id"):
-        return None
-    payload = statsapi.get(
-        "people",
-        {
-            "personIds": pitcher_context["id"],
-            "hydrate": f"stats(group=[pitching],type=[season,gameLog],season={season})",
-        },
-        force=True,
-    )
-    people = payload.get("people") or []
-    return people[0] if people else None
-
-
-def _build_player_snapshot(person_id: int, person: Dict[str, Any], report_date: dt.date) -> Dict[str, Any]:
-    indexed = index_stat_blocks(person)
-    game_logs = extract_game_logs(person)
-    return {
-        "id": person_id,
-        "name": str(person.get("fullName") or "").strip(),
-        "vsp": aggregate_stat_lines([]),
-        "recent7": compute_recent_metrics(game_logs, report_date, max_games=RECENT_GAMES),
-        "recent14": compute_recent_metrics(game_logs, report_date, window_days=RECENT_WINDOW_DAYS),
-        "season": compute_recent_metrics(game_logs, report_date),
-        "__indexed": indexed,
+def _build_player_snapshots(
+    person_ids: Sequence[int],
+    people_by_id: Dict[int, Dict[str, Any]],
+    report_date: dt.date,
+) -> List[Dict[str, Any]]:
+    game_logs_by_id = {
+        person_id: extract_game_logs(people_by_id[person_id])
+        for person_id in person_ids
+        if person_id in people_by_id
     }
+    metrics_by_id = compute_recent_metrics_batch(game_logs_by_id, report_date, METRIC_WINDOWS)
+    return [
+        {
+            "id": person_id,
+            "name": str(people_by_id[person_id].get("fullName") or "").strip(),
+            "vsp": aggregate_stat_lines([]),
+            **metrics_by_id[person_id],
+            "__indexed": index_stat_blocks(people_by_id[person_id]),
+        }
+        for person_id in game_logs_by_id
+    ]
 
 
 def _rank_roster_fallback_candidates(snapshots: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -624,7 +607,7 @@ def _build_offense_matchup(
     ]
     requested_ids = list(dict.fromkeys(active_roster_ids + confirmed_lineup_ids + last_game_lineup_ids))
 
-    pitcher_context = fetch_pitcher_context(pitcher_name) if pitcher_name else None
+    pitcher_context = fetch_pitcher_context(pitcher_name, report_year) if pitcher_name else None
     people_by_id = fetch_people_stats_map(
         requested_ids,
         season=report_year,
@@ -640,12 +623,14 @@ def _build_offense_matchup(
         and pitcher_context.get("id")
         and str(status or "").strip() not in NOT_STARTED_STATUSES
     ):
-        same_day_bvp_lines = fetch_game_batter_vs_pitcher_stat_lines(int(game_id), int(pitcher_context["id"]))
+        same_day_bvp_lines = fetch_game_batter_vs_pitcher_stat_lines(
+            int(game_id),
+            int(pitcher_context["id"]),
+            completed=str(status or "").strip() == "Final",
+        )
 
-    for player_id in requested_ids:
-        if player_id not in people_by_id:
-            continue
-        snapshot = _build_player_snapshot(player_id, people_by_id[player_id], report_date)
+    for snapshot in _build_player_snapshots(requested_ids, people_by_id, report_date):
+        player_id = snapshot["id"]
         snapshot["vsp"] = parse_vs_pitcher_stats(
             snapshot.pop("__indexed"),
             batter_id=player_id,
@@ -656,9 +641,9 @@ def _build_offense_matchup(
         player_snapshots.append(snapshot)
     lineup_source, selected_snapshots = _select_lineup_source(confirmed_lineup_ids, last_game_lineup_ids, player_snapshots)
 
-    matchup_stats = aggregate_stat_lines([snapshot["vsp"] for snapshot in selected_snapshots])
-    recent7_stats = aggregate_stat_lines([snapshot["recent7"] for snapshot in selected_snapshots])
-    recent14_stats = aggregate_stat_lines([snapshot["recent14"] for snapshot in selected_snapshots])
+    matchup_stats, recent7_stats, recent14_stats = aggregate_stat_lines_batch(
+        [[snapshot[window] for snapshot in selected_snapshots] for window in ("vsp", "recent7", "recent14")]
+    )
     hand_split_stats = _extract_team_pitcher_hand_split(team_id, report_year, (pitcher_context or {}).get("hand"))
     hand_split_ranks = fetch_team_handedness_rank_map(report_year, (pitcher_context or {}).get("hand")).get(team_id, {})
 
@@ -670,16 +655,12 @@ def _build_offense_matchup(
     pitcher_display_name = str((pitcher_context or {}).get("name") or pitcher_name or "TBD").strip() or "TBD"
 
     if pitcher_context and pitcher_context.get("id"):
-        pitcher_person = _fetch_pitcher_person(str(pitcher_context.get("name") or pitcher_name), report_year)
-        if pitcher_person:
-            pitcher_season = extract_pitcher_season_stats(pitcher_person)
+        pitcher_profile = get_pitcher_profile(int(pitcher_context["id"]), report_year, report_date)
+        if pitcher_profile:
+            pitcher_season = extract_pitcher_season_stats(pitcher_profile["person"])
             if pitcher_id is not None:
                 pitcher_season_ranks = fetch_pitcher_season_rank_map(report_year).get(pitcher_id, {})
-            indexed = index_stat_blocks(pitcher_person)
-            pitcher_recent = build_pitcher_recent_form(
-                (indexed.get("gameLog") or [{}])[0].get("splits") or [],
-                report_date,
-            )
+            pitcher_recent = build_pitcher_recent_form(pitcher_profile["game_log"], report_date)
 
     badges = _build_badges(
         lineup_source,
@@ -722,9 +703,77 @@ def _build_offense_matchup(
     )
 
 
-def build_matchups(schedule: Sequence[Dict[str, Any]], report_date: str) -> List[GameMatchup]:
+def _build_game_offense_matchups(
+    game: Dict[str, Any],
+    *,
+    away_team_id: int,
+    away_team_name: str,
+    away_team_abbrev: str,
+    home_team_id: int,
+    home_team_name: str,
+    home_team_abbrev: str,
+    status: str,
+    report_date: dt.date,
+    report_year: int,
+    espn_summary: Optional[Dict[str, Any]],
+) -> tuple[OffenseMatchup, OffenseMatchup]:
+    game_id = to_int(game.get("game_id"))
+    start_time = format_local_start_time(game.get("game_datetime"))
+    away_offense = _build_offense_matchup(
+        team_id=away_team_id,
+        team_name=away_team_name,
+        team_abbrev=away_team_abbrev,
+        opponent_id=home_team_id,
+        opponent_name=home_team_name,
+        opponent_abbrev=home_team_abbrev,
+        pitcher_name=str(game.get("home_probable_pitcher") or "").strip(),
+        game_id=game_id,
+        start_time=start_time,
+        status=status,
+        report_date=report_date,
+        report_year=report_year,
+        espn_summary=espn_summary,
+    )
+    home_offense = _build_offense_matchup(
+        team_id=home_team_id,
+        team_name=home_team_name,
+        team_abbrev=home_team_abbrev,
+        opponent_id=away_team_id,
+        opponent_name=away_team_name,
+        opponent_abbrev=away_team_abbrev,
+        pitcher_name=str(game.get("away_probable_pitcher") or "").strip(),
+        game_id=game_id,
+        start_time=start_time,
+        status=status,
+        report_date=report_date,
+        report_year=report_year,
+        espn_summary=espn_summary,
+    )
+    return away_offense, home_offense
+
+
+def build_matchups(
+    schedule: Sequence[Dict[str, Any]],
+    report_date: str,
+    *,
+    prefetch: bool = True,
+    incremental: bool = False,
+) -> List[GameMatchup]:
     report_date_obj = dt.datetime.strptime(report_date, "%m/%d/%Y").date()
     report_year = report_date_obj.year
+    slate_cache = (
+        open_incremental_cache("matchups", schedule, report_date, source_files=[__file__])
+        if incremental
+        else None
+    )
+    if prefetch:
+        prefetch_slate(
+            slate_cache.stale_games(schedule) if slate_cache is not None else schedule,
+            report_date,
+            people_stats_end_dates=[None],
+            include_last_game_lineups=True,
+            include_team_context=True,
+        )
     espn_event_snapshot_lookup = build_espn_event_snapshot_lookup(report_date)
 
     team_ids = {
@@ -763,36 +812,26 @@ def build_matchups(schedule: Sequence[Dict[str, Any]], report_date: str) -> List
         if home_score is None and status_text not in NOT_STARTED_STATUSES:
             home_score = to_int(game.get("home_score"))
 
-        away_offense = _build_offense_matchup(
-            team_id=away_team_id,
-            team_name=away_team_name,
-            team_abbrev=away_team_abbrev,
-            opponent_id=home_team_id,
-            opponent_name=home_team_name,
-            opponent_abbrev=home_team_abbrev,
-            pitcher_name=str(game.get("home_probable_pitcher") or "").strip(),
-            game_id=to_int(game.get("game_id")),
-            start_time=format_local_start_time(game.get("game_datetime")),
-            status=status_text,
-            report_date=report_date_obj,
-            report_year=report_year,
-            espn_summary=espn_summary,
-        )
-        home_offense = _build_offense_matchup(
-            team_id=home_team_id,
-            team_name=home_team_name,
-            team_abbrev=home_team_abbrev,
-            opponent_id=away_team_id,
-            opponent_name=away_team_name,
-            opponent_abbrev=away_team_abbrev,
-            pitcher_name=str(game.get("away_probable_pitcher") or "").strip(),
-            game_id=to_int(game.get("game_id")),
-            start_time=format_local_start_time(game.get("game_datetime")),
-            status=status_text,
-            report_date=report_date_obj,
-            report_year=report_year,
-            espn_summary=espn_summary,
-        )
+        game_id = to_int(game.get("game_id"))
+        cached_offenses = slate_cache.get(game_id) if slate_cache is not None else None
+        if cached_offenses is not None:
+            away_offense, home_offense = cached_offenses
+        else:
+            away_offense, home_offense = _build_game_offense_matchups(
+                game,
+                away_team_id=away_team_id,
+                away_team_name=away_team_name,
+                away_team_abbrev=away_team_abbrev,
+                home_team_id=home_team_id,
+                home_team_name=home_team_name,
+                home_team_abbrev=home_team_abbrev,
+                status=status_text,
+                report_date=report_date_obj,
+                report_year=report_year,
+                espn_summary=espn_summary,
+            )
+            if slate_cache is not None:
+                slate_cache.put(game_id, (away_offense, home_offense))
 
         matchups.append(
             GameMatchup(
@@ -818,6 +857,8 @@ def build_matchups(schedule: Sequence[Dict[str, Any]], report_date: str) -> List
                 park_context=park_context,
             )
         )
+    if slate_cache is not None:
+        slate_cache.save()
     return _sort_matchups(matchups)
 
 
@@ -1467,35 +1508,69 @@ def write_html(
     return summary_output_path
 
 
-def main(raw_date_input: str, *, allow_roll_forward: bool = True, write_root: bool = True) -> None:
+def main(
+    raw_date_input: str,
+    *,
+    allow_roll_forward: bool = True,
+    write_root: bool = True,
+    incremental: bool = False,
+    snapshot_mode: Optional[str] = None,
+    snapshot_path: Optional[str] = None,
+) -> None:
     report_date = resolve_date_input(raw_date_input)
-    report_date, schedule = resolve_effective_report_date_and_schedule(
-        report_date,
-        allow_roll_forward=allow_roll_forward,
-    )
+    with use_slate_snapshot(report_date, snapshot_mode, snapshot_path):
+        report_date, schedule = resolve_effective_report_date_and_schedule(
+            report_date,
+            allow_roll_forward=allow_roll_forward,
+        )
+        render_report(report_date, schedule, write_root=write_root, incremental=incremental)
+
+
+def render_report(
+    report_date: str,
+    schedule: Sequence[Dict[str, Any]],
+    *,
+    write_root: bool = True,
+    prefetch: bool = True,
+    incremental: bool = False,
+) -> None:
     report_key = report_date.replace("/", "")
-    matchups = build_matchups(schedule, report_date)
+    matchups = build_matchups(schedule, report_date, prefetch=prefetch, incremental=incremental)
     write_html(matchups, report_key, report_date, write_root=write_root)
 
 
-def _parse_cli_args(argv: Sequence[str]) -> tuple[str, bool, bool]:
+def _parse_cli_args(argv: Sequence[str]) -> tuple[str, bool, bool, bool, Optional[str], Optional[str]]:
     if len(argv) < 2:
         print(
             "Usage: python3 -m mlb_pitcher_report.reports.matchups "
-            "<today|tmrw|MM/DD|MM/DD/YYYY> [--exact] [--no-root]"
+            "<today|tmrw|MM/DD|MM/DD/YYYY> [--exact] [--no-root] [--incremental] [--snapshot[=PATH]|--from-snapshot[=PATH]]"
         )
         sys.exit(1)
 
-    supported_flags = {"--exact", "--no-root"}
-    raw_flags = [str(flag) for flag in argv[2:]]
+    supported_flags = {"--exact", "--no-root", INCREMENTAL_FLAG}
+    raw_flags, snapshot_mode, snapshot_path = split_snapshot_flags(argv[2:])
     unexpected_flags = [flag for flag in raw_flags if flag not in supported_flags]
     if unexpected_flags:
         print(f"Unsupported flags: {', '.join(unexpected_flags)}")
         sys.exit(1)
 
-    return str(argv[1]), "--exact" in raw_flags, "--no-root" in raw_flags
+    return (
+        str(argv[1]),
+        "--exact" in raw_flags,
+        "--no-root" in raw_flags,
+        INCREMENTAL_FLAG in raw_flags,
+        snapshot_mode,
+        snapshot_path,
+    )
 
 
 if __name__ == "__main__":
-    raw_date_input, exact_mode, no_root = _parse_cli_args(sys.argv)
-    main(raw_date_input, allow_roll_forward=not exact_mode, write_root=not no_root)
+    raw_date_input, exact_mode, no_root, incremental, snapshot_mode, snapshot_path = _parse_cli_args(sys.argv)
+    main(
+        raw_date_input,
+        allow_roll_forward=not exact_mode,
+        write_root=not no_root,
+        incremental=incremental,
+        snapshot_mode=snapshot_mode,
+        snapshot_path=snapshot_path,
+    )
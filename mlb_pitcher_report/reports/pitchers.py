@@ -14,18 +14,26 @@ from urllib.parse import quote
 import pandas as pd
 import requests
 import statsapi
-from bs4 import BeautifulSoup
-from pybaseball import team_batting
 from unidecode import unidecode
 
-from mlb_pitcher_report.odds.oddapi import ALT_LINES_TOKEN, get_pitcher_odds_by_team
+from mlb_pitcher_report.odds import ALT_LINES_TOKEN
+from mlb_pitcher_report.shared.http_client import http_get
 from mlb_pitcher_report.shared.report_data import (
-    fetch_people_stats_map as fetch_hitter_people_stats_map,
+    build_espn_event_lookup,
+    build_slate_pitcher_strikeouts,
+    fetch_espn_summary,
     fetch_mlb_team_ids,
+    fetch_people_vs_pitcher_map as fetch_hitter_vs_pitcher_map,
+    fetch_pitcher_people,
+    fetch_pitcher_person,
     index_stat_blocks as index_hitter_stat_blocks,
     parse_vs_pitcher_stats as parse_hitter_vs_pitcher_stats,
+    pitcher_person_game_log_splits,
+    pitcher_person_season_stat,
+    resolve_pitcher_id,
 )
 from mlb_pitcher_report.shared.site_nav import build_date_nav_html, build_report_tabs
+from mlb_pitcher_report.shared.slate_snapshot import split_snapshot_flags, use_slate_snapshot
 from mlb_pitcher_report.shared.team_logos import get_team_logo_src
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -290,8 +298,9 @@ TEAM_HAND_SPLIT_CACHE: Dict[Tuple[int, int], Dict[str, Optional[float]]] = {}
 TEAM_RECENT_K_CACHE: Dict[Tuple[int, int, str], Dict[str, Optional[float]]] = {}
 TEAM_HAND_SPLIT_RANK_CACHE: Dict[Tuple[int, str], Dict[int, int]] = {}
 PREVIOUS_LINEUP_PLAYER_IDS_CACHE: Dict[Tuple[int, str], List[int]] = {}
-PITCHER_ID_CACHE: Dict[str, Optional[int]] = {}
 PREVIOUS_LINEUP_K_CACHE: Dict[Tuple[int, int, str, int], Optional[Dict[str, Any]]] = {}
+PITCHER_ARSENAL_CACHE: Dict[int, Dict[str, Dict[str, Any]]] = {}
+SLATE_ODDS_CACHE: Dict[str, Optional[Dict[str, Dict[str, str]]]] = {}
 
 
 def _normalize_person_name(name: Any) -> str:
@@ -319,115 +328,52 @@ def _format_local_start_time(game_datetime: Any) -> str:
     return local_time.replace(" AM", "a").replace(" PM", "p")
 
 
-def _choose_best_player_match(players: List[Dict[str, Any]], player_name: str) -> Optional[Dict[str, Any]]:
-    if not players:
-        return None
-
-    target = _normalize_person_name(player_name)
-    if not target:
-        return players[0]
-
-    exact_full = [p for p in players if _normalize_person_name(p.get("fullName")) == target]
-    if exact_full:
-        return exact_full[0]
-
-    exact_first_last = [
-        p
-        for p in players
-        if _normalize_person_name(p.get("firstLastName")) == target
-        or _normalize_person_name(p.get("nameFirstLast")) == target
-    ]
-    if exact_first_last:
-        return exact_first_last[0]
-
-    return players[0]
-
-
-def parse_pitcher_stats(raw_data: str, name: str) -> Dict[str, Any]:
-    lines = [line.strip() for line in raw_data.split("\n") if line.strip()]
-    data: Dict[str, str] = {}
-    for line in lines[2:]:
-        if ":" not in line:
-            continue
-        key, value = line.split(":", 1)
-        data[key.strip()] = value.strip()
+def parse_pitcher_stats(stat: Dict[str, Any], name: str) -> Dict[str, Any]:
     return {
         "Name": name,
-        "GP": data.get("gamesPlayed"),
-        "AB": data.get("atBats"),
-        "BB": data.get("baseOnBalls"),
-        "BF": data.get("battersFaced"),
-        "AVG": data.get("avg"),
-        "K": data.get("strikeOuts"),
-        "K/9": data.get("strikeoutsPer9Inn"),
+        "GP": stat.get("gamesPlayed"),
+        "AB": stat.get("atBats"),
+        "BB": stat.get("baseOnBalls"),
+        "BF": stat.get("battersFaced"),
+        "AVG": stat.get("avg"),
+        "K": stat.get("strikeOuts"),
+        "K/9": stat.get("strikeoutsPer9Inn"),
     }
 
 
-def get_game_id_by_probable_pitcher(date: str, pitcher_name: str) -> Optional[int]:
-    games = statsapi.schedule(start_date=date, end_date=date)
-    for game in games:
-        if game.get("away_probable_pitcher") == pitcher_name or game.get("home_probable_pitcher") == pitcher_name:
-            if game.get("status") in NOT_STARTED_STATUSES:
-                return None
-            return game.get("game_id")
+def lookup_pitcher_strikeouts(
+    strikeout_index: Dict[int, Dict[str, Any]],
+    player_id: Any,
+    full_name: str,
+) -> Optional[int]:
+    pitcher_id = _to_int(player_id)
+    if pitcher_id is not None and pitcher_id in strikeout_index:
+        return strikeout_index[pitcher_id]["strikeOuts"]
+    for line in strikeout_index.values():
+        if line.get("name") == full_name:
+            return line["strikeOuts"]
     return None
 
 
-def get_strikeouts_by_player_name(date: str, full_name: str) -> Any:
-    game_id = get_game_id_by_probable_pitcher(date, full_name)
-    if not game_id:
-        return "N/A"
-
-    data = statsapi.boxscore_data(game_id, timecode=None)
-    player_info = data.get("playerInfo", {})
-    player_id = None
-    for pid, player_data in player_info.items():
-        if player_data.get("fullName") == full_name:
-            player_id = pid
-            break
-
-    if not player_id:
-        return None
-
-    players = data.get("home", {}).get("players", {})
-    player_data = players.get(player_id, {})
-    if not player_data:
-        players = data.get("away", {}).get("players", {})
-        player_data = players.get(player_id, {})
-    return player_data.get("stats", {}).get("pitching", {}).get("strikeOuts", 0)
-
+def clear_pitcher_odds_caches() -> None:
+    SLATE_ODDS_CACHE.clear()
+    oddapi = sys.modules.get("mlb_pitcher_report.odds.oddapi")
+    if oddapi is not None:
+        oddapi.clear_event_odds_caches()
 
-def fetch_pitcher_stats(name: str, team: str, opponent: str, status: str, start_time: str) -> Dict[str, Any]:
-    try:
-        players = statsapi.lookup_player(name)
-        player = _choose_best_player_match(players or [], name)
-        if not player:
-            raise ValueError(f"Player {name} not found")
-        player_id = player["id"]
-        stats = statsapi.player_stats(player_id, group="[pitching]", type="season")
-        pitcher_stats = parse_pitcher_stats(stats, name)
-        pitcher_stats[PLAYER_ID_COLUMN] = player_id
-        pitcher_stats["Opponent"] = opponent
-        pitcher_stats["Status"] = status
-        pitcher_stats[START_TIME_COLUMN] = start_time
-        return pitcher_stats
-    except Exception as exc:
-        return {
-            "Name": name,
-            "Team": team,
-            "Opponent": opponent,
-            "Status": status,
-            START_TIME_COLUMN: start_time,
-            "Error": str(exc),
-        }
 
+def fetch_slate_odds(report_date: str, schedule: Sequence[Dict[str, Any]]) -> Optional[Dict[str, Dict[str, str]]]:
+    if report_date in SLATE_ODDS_CACHE:
+        return SLATE_ODDS_CACHE[report_date]
+    from mlb_pitcher_report.odds.oddapi import get_slate_pitcher_lines
 
-def fetch_pitcher_odds(name: str, report_date: str) -> Optional[pd.DataFrame]:
     try:
-        return get_pitcher_odds_by_team(name, report_date)
+        slate_lines = get_slate_pitcher_lines(list(schedule), report_date)
     except Exception as exc:
-        print(f"Odds lookup failed for {name}: {exc}")
+        print(f"Odds lookup failed for {report_date}: {exc}")
         return None
+    SLATE_ODDS_CACHE[report_date] = slate_lines
+    return slate_lines
 
 
 def get_team_full_name(abbreviation: str) -> str:
@@ -492,12 +438,14 @@ def get_savant_opp_data(date: str) -> pd.DataFrame:
     ]
 
     try:
-        response = requests.get(url, timeout=15)
+        response = http_get(url, timeout=15)
         response.raise_for_status()
     except requests.RequestException as exc:
         print(f"\033[91mFailed to retrieve probable pitcher data: {exc}\033[0m")
         return pd.DataFrame(columns=columns)
 
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(response.content, "html.parser")
     blocks = soup.find_all("div", class_="mod")
     for block in blocks:
@@ -536,54 +484,12 @@ def get_savant_opp_data(date: str) -> pd.DataFrame:
     return pd.DataFrame(data, columns=columns)
 
 
-def _fetch_espn_scoreboard_events(date: str) -> List[Dict[str, Any]]:
-    date_obj = datetime.datetime.strptime(date, "%m/%d/%Y")
-    url = (
-        "https://site.web.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard"
-        f"?dates={date_obj.strftime('%Y%m%d')}"
-    )
+def _build_espn_event_id_lookup(date: str) -> Dict[Tuple[str, str], str]:
     try:
-        response = requests.get(url, timeout=20)
-        response.raise_for_status()
-        payload = response.json()
+        return build_espn_event_lookup(date)
     except Exception as exc:
         print(f"\033[91mFailed to load ESPN scoreboard data: {exc}\033[0m")
-        return []
-    return payload.get("events") or []
-
-
-def _build_espn_event_id_lookup(date: str) -> Dict[Tuple[str, str], str]:
-    lookup: Dict[Tuple[str, str], str] = {}
-    for event in _fetch_espn_scoreboard_events(date):
-        event_id = str(event.get("id", "")).strip()
-        comp = (event.get("competitions") or [{}])[0]
-        competitors = comp.get("competitors") or []
-        away_name = ""
-        home_name = ""
-        for competitor in competitors:
-            team = competitor.get("team") or {}
-            display_name = str(team.get("displayName", "")).strip()
-            home_away = str(competitor.get("homeAway", "")).strip().lower()
-            if home_away == "away":
-                away_name = display_name
-            elif home_away == "home":
-                home_name = display_name
-        if not event_id or not away_name or not home_name:
-            continue
-        lookup[(_normalize_team_name(away_name), _normalize_team_name(home_name))] = event_id
-    return lookup
-
-
-def _fetch_espn_summary(event_id: str) -> Optional[Dict[str, Any]]:
-    if not event_id:
-        return None
-    url = f"https://site.web.api.espn.com/apis/site/v2/sports/baseball/mlb/summary?event={event_id}"
-    try:
-        response = requests.get(url, timeout=20)
-        response.raise_for_status()
-        return response.json()
-    except Exception:
-        return None
+        return {}
 
 
 def _is_espn_lineup_confirmed(
@@ -807,25 +713,6 @@ def _fetch_previous_lineup_player_ids(team_id: int, report_date: datetime.date)
     return []
 
 
-def _lookup_pitcher_id(pitcher_name: Any) -> Optional[int]:
-    name_text = str(pitcher_name or "").strip()
-    pitcher_key = _normalize_person_name(name_text)
-    if not pitcher_key:
-        return None
-    if pitcher_key in PITCHER_ID_CACHE:
-        return PITCHER_ID_CACHE[pitcher_key]
-
-    try:
-        players = statsapi.lookup_player(name_text)
-        player = _choose_best_player_match(players or [], name_text)
-        pitcher_id = _to_int(player.get("id") if player else None)
-    except Exception:
-        pitcher_id = None
-
-    PITCHER_ID_CACHE[pitcher_key] = pitcher_id
-    return pitcher_id
-
-
 def _person_display_name(person: Dict[str, Any]) -> str:
     last_name = str(person.get("lastName") or "").strip()
     if last_name:
@@ -863,10 +750,9 @@ def _previous_lineup_k_percent(
         return None
 
     try:
-        people_by_id = fetch_hitter_people_stats_map(
+        people_by_id = fetch_hitter_vs_pitcher_map(
             lineup_ids[:9],
             season,
-            None,
             pitcher_id,
             stats_end_date=report_date - datetime.timedelta(days=1),
         )
@@ -942,7 +828,7 @@ def get_espn_opp_data(date: str, schedule: Sequence[Dict[str, Any]]) -> pd.DataF
         if not event_id:
             continue
 
-        summary_data = _fetch_espn_summary(event_id)
+        summary_data = fetch_espn_summary(event_id)
         if not summary_data:
             continue
 
@@ -1024,7 +910,7 @@ def get_previous_lineup_opp_data(
             opponent_team_id = _to_int(opponent_team_id_raw)
             if not pitcher_name or not pitcher_key or pitcher_key in excluded_keys or opponent_team_id is None:
                 continue
-            pitcher_id = _lookup_pitcher_id(pitcher_name)
+            pitcher_id = resolve_pitcher_id(pitcher_name)
             if pitcher_id is None:
                 continue
 
@@ -1179,16 +1065,49 @@ def get_pitcher_tasks(schedule: Sequence[Dict[str, Any]]) -> List[Tuple[str, str
     return pitcher_tasks
 
 
-def fetch_pitcher_stats_concurrently(pitcher_tasks: Sequence[Tuple[str, str, str, str, str]]) -> List[Dict[str, Any]]:
+def fetch_pitcher_stats_batch(
+    pitcher_tasks: Sequence[Tuple[str, str, str, str, str]],
+    season: int,
+) -> List[Dict[str, Any]]:
     if not pitcher_tasks:
         return []
-    max_workers = min(16, len(pitcher_tasks))
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            executor.submit(fetch_pitcher_stats, pitcher, team, opponent, status, start_time)
-            for pitcher, team, opponent, status, start_time in pitcher_tasks
-        ]
-        return [future.result() for future in futures]
+    names = list(dict.fromkeys(str(task[0]) for task in pitcher_tasks))
+    with ThreadPoolExecutor(max_workers=min(16, len(names))) as executor:
+        pitcher_ids = dict(zip(names, executor.map(resolve_pitcher_id, names)))
+
+    fetch_error: Optional[str] = None
+    try:
+        people_by_id = fetch_pitcher_people(
+            [pitcher_id for pitcher_id in pitcher_ids.values() if pitcher_id is not None],
+            season,
+        )
+    except Exception as exc:
+        people_by_id = {}
+        fetch_error = str(exc)
+
+    results: List[Dict[str, Any]] = []
+    for name, team, opponent, status, start_time in pitcher_tasks:
+        pitcher_id = pitcher_ids.get(str(name))
+        person = people_by_id.get(pitcher_id) if pitcher_id is not None else None
+        if person is None:
+            results.append(
+                {
+                    "Name": name,
+                    "Team": team,
+                    "Opponent": opponent,
+                    "Status": status,
+                    START_TIME_COLUMN: start_time,
+                    "Error": fetch_error if pitcher_id is not None and fetch_error else f"Player {name} not found",
+                }
+            )
+            continue
+        pitcher_stats = parse_pitcher_stats(pitcher_person_season_stat(person), name)
+        pitcher_stats[PLAYER_ID_COLUMN] = pitcher_id
+        pitcher_stats["Opponent"] = opponent
+        pitcher_stats["Status"] = status
+        pitcher_stats[START_TIME_COLUMN] = start_time
+        results.append(pitcher_stats)
+    return results
 
 
 def prepare_team_batting_df(year: int) -> pd.DataFrame:
@@ -1225,6 +1144,8 @@ def prepare_team_batting_df(year: int) -> pd.DataFrame:
         except Exception as exc:
             last_error = exc
 
+    from pybaseball import team_batting
+
     for candidate_year in [year, year - 1]:
         try:
             df = team_batting(candidate_year)
@@ -1258,8 +1179,12 @@ def _last_first_to_full_name(value: Any) -> str:
 
 
 def prepare_pitcher_arsenal_lookup(year: int) -> Dict[str, Dict[str, Any]]:
+    cached = PITCHER_ARSENAL_CACHE.get(year)
+    if cached is not None:
+        return cached
+
     try:
-        response = requests.get(WHIFF_CSV_URL_TEMPLATE.format(year=year), timeout=20)
+        response = http_get(WHIFF_CSV_URL_TEMPLATE.format(year=year), timeout=20)
         response.raise_for_status()
         df = pd.read_csv(StringIO(response.text), encoding="utf-8-sig")
     except Exception as exc:
@@ -1308,6 +1233,8 @@ def prepare_pitcher_arsenal_lookup(year: int) -> Dict[str, Dict[str, Any]]:
             "arsenal": arsenal_entries,
         }
 
+    if arsenal_lookup:
+        PITCHER_ARSENAL_CACHE[year] = arsenal_lookup
     return arsenal_lookup
 
 
@@ -1371,29 +1298,10 @@ def _team_display_abbreviation(team_name: Any) -> str:
 
 def _pitcher_game_log_splits(player_id: int, season: int) -> List[Dict[str, Any]]:
     try:
-        data = statsapi.get(
-            "person",
-            {
-                "personId": player_id,
-                "hydrate": (
-                    "stats(group=pitching,type=gameLog,"
-                    f"sportId=1,season={season}),currentTeam"
-                ),
-            },
-        )
+        person = fetch_pitcher_person(player_id, season)
     except Exception:
         return []
-
-    people = data.get("people") or []
-    if not people:
-        return []
-
-    for stats_block in people[0].get("stats") or []:
-        type_name = str((stats_block.get("type") or {}).get("displayName", "")).lower()
-        group_name = str((stats_block.get("group") or {}).get("displayName", "")).lower()
-        if type_name == "gamelog" and group_name == "pitching":
-            return list(stats_block.get("splits") or [])
-    return []
+    return pitcher_person_game_log_splits(person)
 
 
 def _format_recent_pitcher_game_line(split: Dict[str, Any]) -> Optional[str]:
@@ -1457,6 +1365,12 @@ def add_pitcher_recent_game_logs(
         enriched[RECENT_PITCHER_GAMES_COLUMN] = values
         return enriched
 
+    for candidate_season in [season, season - 1]:
+        try:
+            fetch_pitcher_people([player_id for _, player_id in tasks], candidate_season)
+        except Exception:
+            continue
+
     max_workers = min(16, len(tasks))
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_to_position = {
@@ -1784,7 +1698,10 @@ def sort_pitchers_for_report(pitchers: pd.DataFrame) -> pd.DataFrame:
     )
 
 
-def calculate_additional_metrics(date: str, pitchers: pd.DataFrame) -> pd.DataFrame:
+def calculate_additional_metrics(
+    pitchers: pd.DataFrame,
+    schedule: Sequence[Dict[str, Any]],
+) -> pd.DataFrame:
     pitchers = pitchers.copy()
 
     for col in ["AB", "GP", "K", "BB", "BF", "SO/PA", "K%", "PA", "K/9", "r"]:
@@ -1806,9 +1723,11 @@ def calculate_additional_metrics(date: str, pitchers: pd.DataFrame) -> pd.DataFr
     pitchers[K_PA_COLUMN] = pd.Series(pd.NA, index=pitchers.index, dtype="object")
     valid_bf = bf.notna() & (bf > 0)
     pitchers.loc[valid_bf, K_PA_COLUMN] = 100 * (k[valid_bf] / bf[valid_bf])
+    strikeout_index = build_slate_pitcher_strikeouts(schedule) if status_series.isin(COMPLETED_STATUSES).any() else {}
+    player_ids = pitchers[PLAYER_ID_COLUMN] if PLAYER_ID_COLUMN in pitchers.columns else [None] * len(pitchers)
     pitchers["Ks"] = [
-        get_strikeouts_by_player_name(date, name) if status in COMPLETED_STATUSES else ""
-        for name, status in zip(pitchers["Name"], status_series)
+        lookup_pitcher_strikeouts(strikeout_index, player_id, name) if status in COMPLETED_STATUSES else ""
+        for name, status, player_id in zip(pitchers["Name"], status_series, player_ids)
     ]
 
     for col in REPORT_COLUMN_ORDER:
@@ -1820,34 +1739,31 @@ def calculate_additional_metrics(date: str, pitchers: pd.DataFrame) -> pd.DataFr
     return sort_pitchers_for_report(pitchers)
 
 
-def merge_with_odds_data(pitchers: pd.DataFrame, report_date: str) -> pd.DataFrame:
-    odds_frames: List[pd.DataFrame] = []
-    pending_names = [
-        name
+def merge_with_odds_data(
+    pitchers: pd.DataFrame,
+    report_date: str,
+    schedule: Sequence[Dict[str, Any]],
+) -> pd.DataFrame:
+    pending_lines = [
+        None if status in COMPLETED_STATUSES else _normalize_person_name(name)
         for name, status in zip(pitchers["Name"], pitchers["Status"])
-        if status not in COMPLETED_STATUSES
     ]
-    unique_pending_names = list(dict.fromkeys(pending_names))
-
-    odds_lookup_cache: Dict[str, Optional[pd.DataFrame]] = {}
-    for name in unique_pending_names:
-        odds_lookup_cache[name] = fetch_pitcher_odds(name, report_date)
-
-    for odds_df in odds_lookup_cache.values():
-        if isinstance(odds_df, pd.DataFrame) and not odds_df.empty:
-            odds_frames.append(odds_df)
+    if not any(pending_lines):
+        return pitchers
 
-    if not odds_frames:
+    slate_lines = fetch_slate_odds(report_date, schedule)
+    if not slate_lines:
         return pitchers
 
-    odds_df_all = pd.concat(odds_frames, ignore_index=True)
-    preferred_existing = [col for col in PREFERRED_ODDS_COLUMNS if col in odds_df_all.columns]
-    if preferred_existing:
-        odds_df_all = odds_df_all[["pitcher"] + preferred_existing]
+    pending_lines = [slate_lines.get(key) if key else None for key in pending_lines]
+    if not any(pending_lines):
+        return pitchers
+    slate_books = {book for book_lines in slate_lines.values() for book in book_lines}
+    odds_columns = [col for col in PREFERRED_ODDS_COLUMNS if col in slate_books] or sorted(slate_books)
 
-    final_df = pd.merge(pitchers, odds_df_all, left_on="Name", right_on="pitcher", how="left")
-    if "pitcher" in final_df.columns:
-        final_df.drop(columns=["pitcher"], inplace=True)
+    final_df = pitchers.copy()
+    for column in odds_columns:
+        final_df[column] = [book_lines.get(column) if book_lines else None for book_lines in pending_lines]
     return final_df
 
 
@@ -2626,6 +2542,8 @@ def _build_conditional_table_html(
     raw_df: pd.DataFrame,
     pitcher_arsenal_lookup: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> str:
+    from bs4 import BeautifulSoup
+
     table_html = report_df.to_html(index=False, escape=False, classes="pitchers-table", border=0)
     soup = BeautifulSoup(table_html, "html.parser")
 
@@ -4406,23 +4324,36 @@ def main(
     *,
     allow_roll_forward: bool = True,
     write_root: bool = True,
+    snapshot_mode: Optional[str] = None,
+    snapshot_path: Optional[str] = None,
+) -> None:
+    with use_slate_snapshot(report_date, snapshot_mode, snapshot_path):
+        report_date, schedule = resolve_effective_report_date_and_schedule(
+            report_date,
+            allow_roll_forward=allow_roll_forward,
+        )
+        render_report(report_date, schedule, odds, write_root=write_root)
+
+
+def render_report(
+    report_date: str,
+    schedule: Sequence[Dict[str, Any]],
+    odds: str,
+    *,
+    write_root: bool = True,
 ) -> None:
-    report_date, schedule = resolve_effective_report_date_and_schedule(
-        report_date,
-        allow_roll_forward=allow_roll_forward,
-    )
     report_key = report_date.replace("/", "")
     print((REPORTS_DIR / f"report-{report_key}.html").resolve().as_uri())
 
+    report_year = datetime.datetime.strptime(report_date, "%m/%d/%Y").year
     pitcher_tasks = get_pitcher_tasks(schedule)
-    results = fetch_pitcher_stats_concurrently(pitcher_tasks)
+    results = fetch_pitcher_stats_batch(pitcher_tasks, report_year)
     if not results:
         print("\033[93mNo probable pitchers found for the selected date.\033[0m")
         empty_df = pd.DataFrame(columns=REPORT_COLUMN_ORDER)
         write_to_html(empty_df, report_key, report_date, pitcher_arsenal_lookup={}, write_root=write_root)
         return
 
-    report_year = datetime.datetime.strptime(report_date, "%m/%d/%Y").year
     team_batting_df = prepare_team_batting_df(report_year)
     merged_df = merge_pitcher_with_batting_data(results, team_batting_df)
     opp_df = get_opp_data(report_date, schedule)
@@ -4440,7 +4371,7 @@ def main(
     report_date_obj = datetime.datetime.strptime(report_date, "%m/%d/%Y").date()
     opponent_recent_lookup = build_opponent_recent_k_lookup(schedule, report_year, report_date_obj)
     pitchers = add_opponent_recent_k_percent(pitchers, opponent_recent_lookup)
-    pitchers = calculate_additional_metrics(report_date, pitchers)
+    pitchers = calculate_additional_metrics(pitchers, schedule)
     pitchers = add_pitcher_recent_game_logs(pitchers, report_year, report_date_obj)
 
     final_df = pitchers
@@ -4448,7 +4379,7 @@ def main(
         print("NO ODDS")
     else:
         try:
-            final_df = merge_with_odds_data(pitchers, report_date)
+            final_df = merge_with_odds_data(pitchers, report_date, schedule)
         except Exception as exc:
             print(f"No Odds Found {exc}")
             final_df = pitchers
@@ -4464,11 +4395,11 @@ def main(
     )
 
 
-def _parse_cli_args(argv: Sequence[str]) -> Tuple[str, str, bool, bool]:
+def _parse_cli_args(argv: Sequence[str]) -> Tuple[str, str, bool, bool, Optional[str], Optional[str]]:
     if len(argv) < 3:
         print(
             "Usage: python3 -m mlb_pitcher_report.reports.pitchers "
-            "<today|tmrw|MM/DD|MM/DD/YYYY> <y|n> [--exact] [--no-root]"
+            "<today|tmrw|MM/DD|MM/DD/YYYY> <y|n> [--exact] [--no-root] [--snapshot[=PATH]|--from-snapshot[=PATH]]"
         )
         sys.exit(1)
 
@@ -4479,17 +4410,17 @@ def _parse_cli_args(argv: Sequence[str]) -> Tuple[str, str, bool, bool]:
         sys.exit(1)
 
     supported_flags = {"--exact", "--no-root"}
-    raw_flags = [str(flag) for flag in argv[3:]]
+    raw_flags, snapshot_mode, snapshot_path = split_snapshot_flags(argv[3:])
     unexpected_flags = [flag for flag in raw_flags if flag not in supported_flags]
     if unexpected_flags:
         print(f"Unsupported flags: {', '.join(unexpected_flags)}")
         sys.exit(1)
 
-    return date_input, odds, "--exact" in raw_flags, "--no-root" in raw_flags
+    return date_input, odds, "--exact" in raw_flags, "--no-root" in raw_flags, snapshot_mode, snapshot_path
 
 
 if __name__ == "__main__":
-    date_input, odds, exact_mode, no_root = _parse_cli_args(sys.argv)
+    date_input, odds, exact_mode, no_root, snapshot_mode, snapshot_path = _parse_cli_args(sys.argv)
 
     try:
         report_date = resolve_date_input(date_input)
@@ -4498,4 +4429,11 @@ if __name__ == "__main__":
         sys.exit(1)
 
     print(f"\033[94mRunning at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\033[0m")
-    main(report_date, odds, allow_roll_forward=not exact_mode, write_root=not no_root)
+    main(
+        report_date,
+        odds,
+        allow_roll_forward=not exact_mode,
+        write_root=not no_root,
+        snapshot_mode=snapshot_mode,
+        snapshot_path=snapshot_path,
+    )
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from mlb_pitcher_report.reports import batters, matchups, pitchers
+from mlb_pitcher_report.shared.report_data import resolve_date_input, resolve_effective_report_date_and_schedule
+from mlb_pitcher_report.shared.slate_prefetch import prefetch_slate
+from mlb_pitcher_report.shared.slate_snapshot import split_snapshot_flags, use_slate_snapshot
+from mlb_pitcher_report.shared.slate_state import INCREMENTAL_FLAG
+
+SUPPORTED_FLAGS = {"--exact", "--no-root", INCREMENTAL_FLAG}
+
+
+def build_report_steps(
+    report_date: str,
+    schedule: Sequence[Dict[str, Any]],
+    odds: str,
+    *,
+    write_root: bool,
+    incremental: bool = False,
+) -> List[Tuple[str, Callable[[], None]]]:
+    return [
+        ("pitchers", lambda: pitchers.render_report(report_date, schedule, odds, write_root=write_root)),
+        (
+            "batters",
+            lambda: batters.render_report(
+                report_date,
+                schedule,
+                write_root=write_root,
+                prefetch=incremental,
+                incremental=incremental,
+            ),
+        ),
+        (
+            "matchups",
+            lambda: matchups.render_report(
+                report_date,
+                schedule,
+                write_root=write_root,
+                prefetch=incremental,
+                incremental=incremental,
+            ),
+        ),
+    ]
+
+
+def run_slate(
+    report_date: str,
+    odds: str,
+    *,
+    allow_roll_forward: bool = True,
+    write_root: bool = True,
+    incremental: bool = False,
+    snapshot_mode: Optional[str] = None,
+    snapshot_path: Optional[str] = None,
+) -> List[str]:
+    with use_slate_snapshot(report_date, snapshot_mode, snapshot_path):
+        return _run_slate(
+            report_date,
+            odds,
+            allow_roll_forward=allow_roll_forward,
+            write_root=write_root,
+            incremental=incremental,
+        )
+
+
+def _run_slate(
+    report_date: str,
+    odds: str,
+    *,
+    allow_roll_forward: bool,
+    write_root: bool,
+    incremental: bool,
+) -> List[str]:
+    report_date, schedule = resolve_effective_report_date_and_schedule(
+        report_date,
+        allow_roll_forward=allow_roll_forward,
+    )
+    if not incremental:
+        report_date_obj = dt.datetime.strptime(report_date, "%m/%d/%Y").date()
+        prefetch_slate(
+            schedule,
+            report_date,
+            people_stats_end_dates=[report_date_obj - dt.timedelta(days=1), None],
+            include_last_game_lineups=True,
+            include_team_context=True,
+        )
+
+    failed_reports: List[str] = []
+    steps = build_report_steps(report_date, schedule, odds, write_root=write_root, incremental=incremental)
+    for report_name, render in steps:
+        started = time.perf_counter()
+        try:
+            render()
+        except Exception as exc:
+            print(f"\033[91mFailed to build {report_name} report: {exc}\033[0m")
+            failed_reports.append(report_name)
+            continue
+        print(f"Built {report_name} report in {time.perf_counter() - started:.1f}s")
+    return failed_reports
+
+
+def _parse_cli_args(argv: Sequence[str]) -> Tuple[str, str, bool, bool, bool, Optional[str], Optional[str]]:
+    if len(argv) < 3:
+        print(
+            "Usage: python3 -m mlb_pitcher_report.run_slate "
+            "<today|tmrw|MM/DD|MM/DD/YYYY> <y|n> [--exact] [--no-root] [--incremental] [--snapshot[=PATH]|--from-snapshot[=PATH]]"
+        )
+        sys.exit(1)
+
+    date_input = str(argv[1])
+    odds = str(argv[2]).lower()
+    if odds not in {"y", "n"}:
+        print("Second argument must be 'y' or 'n'.")
+        sys.exit(1)
+
+    raw_flags, snapshot_mode, snapshot_path = split_snapshot_flags(argv[3:])
+    unexpected_flags = [flag for flag in raw_flags if flag not in SUPPORTED_FLAGS]
+    if unexpected_flags:
+        print(f"Unsupported flags: {', '.join(unexpected_flags)}")
+        sys.exit(1)
+
+    return (
+        date_input,
+        odds,
+        "--exact" in raw_flags,
+        "--no-root" in raw_flags,
+        INCREMENTAL_FLAG in raw_flags,
+        snapshot_mode,
+        snapshot_path,
+    )
+
+
+if __name__ == "__main__":
+    date_input, odds, exact_mode, no_root, incremental, snapshot_mode, snapshot_path = _parse_cli_args(sys.argv)
+
+    try:
+        report_date = resolve_date_input(date_input)
+    except ValueError as exc:
+        print(f"\033[91m{exc}\033[0m")
+        sys.exit(1)
+
+    print(f"\033[94mRunning at {dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\033[0m")
+    failed = run_slate(
+        report_date,
+        odds,
+        allow_roll_forward=not exact_mode,
+        write_root=not no_root,
+        incremental=incremental,
+        snapshot_mode=snapshot_mode,
+        snapshot_path=snapshot_path,
+    )
+    if failed:
+        sys.exit(1)
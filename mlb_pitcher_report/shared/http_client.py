@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import requests
+import statsapi
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT_SECONDS = 20
+HTTP_POOL_CONNECTIONS = int(os.environ.get("MLB_REPORT_HTTP_POOL_CONNECTIONS") or 16)
+HTTP_POOL_MAXSIZE = int(os.environ.get("MLB_REPORT_HTTP_POOL_MAXSIZE") or 32)
+HTTP_RETRY_TOTAL = int(os.environ.get("MLB_REPORT_HTTP_RETRIES") or 3)
+HTTP_RETRY_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUSES = (500, 502, 503, 504)
+HTTP_USER_AGENT = "mlb-pitcher-report"
+
+RequestInterceptor = Callable[..., requests.Response]
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+_REQUEST_INTERCEPTOR: Optional[RequestInterceptor] = None
+
+
+def build_retry_policy(total: int = HTTP_RETRY_TOTAL, backoff_factor: float = HTTP_RETRY_BACKOFF_FACTOR) -> Retry:
+    return Retry(
+        total=total,
+        connect=total,
+        read=total,
+        status=total,
+        backoff_factor=backoff_factor,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def build_session(
+    *,
+    pool_connections: int = HTTP_POOL_CONNECTIONS,
+    pool_maxsize: int = HTTP_POOL_MAXSIZE,
+    retry_total: int = HTTP_RETRY_TOTAL,
+    backoff_factor: float = HTTP_RETRY_BACKOFF_FACTOR,
+) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=build_retry_policy(retry_total, backoff_factor),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": HTTP_USER_AGENT, "Accept-Encoding": "gzip, deflate"})
+    return session
+
+
+def get_session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = build_session()
+    return _SESSION
+
+
+def reset_session() -> None:
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+        _SESSION = None
+
+
+def set_request_interceptor(interceptor: Optional[RequestInterceptor]) -> Optional[RequestInterceptor]:
+    global _REQUEST_INTERCEPTOR
+    previous = _REQUEST_INTERCEPTOR
+    _REQUEST_INTERCEPTOR = interceptor
+    return previous
+
+
+def _session_get(url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> requests.Response:
+    return get_session().get(url, params=params, **kwargs)
+
+
+def http_get(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    *,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    **kwargs: Any,
+) -> requests.Response:
+    interceptor = _REQUEST_INTERCEPTOR
+    if interceptor is not None:
+        return interceptor(_session_get, url, params, timeout=timeout, **kwargs)
+    return _session_get(url, params, timeout=timeout, **kwargs)
+
+
+class _StatsapiRequestsProxy:
+    def __getattr__(self, name: str) -> Any:
+        return getattr(requests, name)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT_SECONDS)
+        return http_get(url, **kwargs)
+
+
+def install_statsapi_session() -> None:
+    if not isinstance(statsapi.requests, _StatsapiRequestsProxy):
+        statsapi.requests = _StatsapiRequestsProxy()
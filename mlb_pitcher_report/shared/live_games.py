@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import copy
+import gzip
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import statsapi
+
+from mlb_pitcher_report.shared.response_cache import env_flag_enabled
+
+LIVE_GAME_STATE_DIR = Path("report_state") / "live-games"
+LIVE_GAME_STATE_DIR_ENV = "MLB_REPORT_LIVE_GAME_STATE_DIR"
+LIVE_GAME_STATE_DISABLE_ENV = "MLB_REPORT_DISABLE_LIVE_GAME_STATE"
+LIVE_GAME_REFRESH_SECONDS = 20
+LIVE_GAME_STATE_MAX_AGE_SECONDS = 24 * 3600
+FINAL_GAME_STATES = {"Final"}
+
+
+class JsonPatchError(ValueError):
+    pass
+
+
+def _parse_pointer(path: str) -> List[str]:
+    if path == "":
+        return []
+    if not path.startswith("/"):
+        raise JsonPatchError(f"Invalid JSON pointer: {path}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in path[1:].split("/")]
+
+
+def _resolve_parent(document: Any, tokens: List[str]) -> Any:
+    target = document
+    for token in tokens[:-1]:
+        if isinstance(target, list):
+            target = target[int(token)]
+        elif isinstance(target, dict):
+            target = target[token]
+        else:
+            raise JsonPatchError(f"Cannot traverse into {type(target).__name__}")
+    return target
+
+
+def _get_value(document: Any, tokens: List[str]) -> Any:
+    if not tokens:
+        return document
+    parent = _resolve_parent(document, tokens)
+    return parent[int(tokens[-1])] if isinstance(parent, list) else parent[tokens[-1]]
+
+
+def _add_value(document: Any, tokens: List[str], value: Any) -> Any:
+    if not tokens:
+        return value
+    parent = _resolve_parent(document, tokens)
+    key = tokens[-1]
+    if isinstance(parent, list):
+        if key == "-":
+            parent.append(value)
+        else:
+            parent.insert(int(key), value)
+    else:
+        parent[key] = value
+    return document
+
+
+def _remove_value(document: Any, tokens: List[str]) -> Any:
+    parent = _resolve_parent(document, tokens)
+    key = tokens[-1]
+    if isinstance(parent, list):
+        return parent.pop(int(key))
+    return parent.pop(key)
+
+
+def apply_json_patch(document: Any, operations: List[Dict[str, Any]]) -> Any:
+    for operation in operations:
+        op = str(operation.get("op") or "")
+        tokens = _parse_pointer(str(operation.get("path") or ""))
+        try:
+            if op == "add":
+                document = _add_value(document, tokens, copy.deepcopy(operation.get("value")))
+            elif op == "replace":
+                if not tokens:
+                    document = copy.deepcopy(operation.get("value"))
+                    continue
+                _remove_value(document, tokens)
+                document = _add_value(document, tokens, copy.deepcopy(operation.get("value")))
+            elif op == "remove":
+                _remove_value(document, tokens)
+            elif op in {"move", "copy"}:
+                from_tokens = _parse_pointer(str(operation.get("from") or ""))
+                value = _get_value(document, from_tokens)
+                if op == "move":
+                    _remove_value(document, from_tokens)
+                else:
+                    value = copy.deepcopy(value)
+                document = _add_value(document, tokens, value)
+            elif op == "test":
+                if _get_value(document, tokens) != operation.get("value"):
+                    raise JsonPatchError(f"Test failed at {operation.get('path')}")
+            else:
+                raise JsonPatchError(f"Unsupported JSON patch op: {op}")
+        except (KeyError, IndexError, TypeError, ValueError) as exc:
+            if isinstance(exc, JsonPatchError):
+                raise
+            raise JsonPatchError(f"Could not apply {op} at {operation.get('path')}: {exc}") from exc
+    return document
+
+
+def _feed_timecode(feed: Dict[str, Any]) -> str:
+    return str((feed.get("metaData") or {}).get("timeStamp") or "")
+
+
+def _feed_is_final(feed: Dict[str, Any]) -> bool:
+    status = ((feed.get("gameData") or {}).get("status") or {})
+    return str(status.get("abstractGameState") or "").strip() in FINAL_GAME_STATES
+
+
+class LiveGamePoller:
+    def __init__(
+        self,
+        state_dir: Optional[Path | str] = None,
+        *,
+        refresh_seconds: float = LIVE_GAME_REFRESH_SECONDS,
+    ) -> None:
+        self.state_dir = Path(state_dir) if state_dir else None
+        self.refresh_seconds = float(refresh_seconds)
+        self.full_fetches = 0
+        self.diff_fetches = 0
+        self._feeds: Dict[int, Dict[str, Any]] = {}
+        self._checked_at: Dict[int, float] = {}
+        self._locks: Dict[int, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, game_pk: int) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(game_pk, threading.Lock())
+
+    def _state_path(self, game_pk: int) -> Optional[Path]:
+        if self.state_dir is None or not live_game_state_enabled():
+            return None
+        return self.state_dir / f"{game_pk}.json.gz"
+
+    def _load_state(self, game_pk: int) -> Optional[Dict[str, Any]]:
+        path = self._state_path(game_pk)
+        if path is None or not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                feed = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        return feed if isinstance(feed, dict) and _feed_timecode(feed) else None
+
+    def _save_state(self, game_pk: int, feed: Dict[str, Any]) -> bool:
+        path = self._state_path(game_pk)
+        if path is None:
+            return False
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{path.name}.tmp")
+            with gzip.open(temp_path, "wt", encoding="utf-8") as handle:
+                json.dump(feed, handle, separators=(",", ":"))
+            temp_path.replace(path)
+        except OSError as exc:
+            print(f"\033[93mCould not persist live state for game {game_pk}: {exc}\033[0m")
+            return False
+        return True
+
+    def _fetch_full(self, game_pk: int) -> Dict[str, Any]:
+        self.full_fetches += 1
+        return statsapi.get("game", {"gamePk": game_pk})
+
+    def _apply_diff(self, game_pk: int, feed: Dict[str, Any]) -> Dict[str, Any]:
+        self.diff_fetches += 1
+        payload = statsapi.get(
+            "game_diff",
+            {"gamePk": game_pk, "startTimecode": _feed_timecode(feed)},
+            force=True,
+        )
+        if isinstance(payload, dict):
+            return payload if payload.get("liveData") else feed
+        patched = feed
+        for entry in payload or []:
+            operations = entry.get("diff") if isinstance(entry, dict) else None
+            patched = apply_json_patch(patched, list(operations or []))
+        return patched
+
+    def feed(self, game_pk: int) -> Dict[str, Any]:
+        game_pk = int(game_pk)
+        with self._lock_for(game_pk):
+            feed = self._feeds.get(game_pk)
+            now = time.monotonic()
+            if feed is not None and (
+                _feed_is_final(feed) or now - self._checked_at.get(game_pk, 0.0) < self.refresh_seconds
+            ):
+                return feed
+
+            loaded_from_disk = False
+            if feed is None:
+                feed = self._load_state(game_pk)
+                loaded_from_disk = feed is not None
+            previous_timecode = _feed_timecode(feed) if feed is not None else ""
+            if feed is None:
+                feed = self._fetch_full(game_pk)
+            elif not _feed_is_final(feed):
+                working_copy = copy.deepcopy(feed)
+                try:
+                    feed = self._apply_diff(game_pk, working_copy)
+                except JsonPatchError:
+                    feed = self._fetch_full(game_pk)
+
+            if _feed_timecode(feed) != previous_timecode:
+                persisted = self._save_state(game_pk, feed)
+            else:
+                persisted = loaded_from_disk
+            if _feed_is_final(feed) and persisted:
+                # A saved Final feed never changes, so later calls reload it from disk instead of
+                # keeping every finished game resident in a long-running watch loop.
+                self._feeds.pop(game_pk, None)
+                self._checked_at.pop(game_pk, None)
+            else:
+                self._feeds[game_pk] = feed
+                self._checked_at[game_pk] = now
+            return feed
+
+    def forget(self, game_pk: int) -> None:
+        with self._lock_for(int(game_pk)):
+            self._feeds.pop(int(game_pk), None)
+            self._checked_at.pop(int(game_pk), None)
+
+    def clear(self) -> None:
+        for game_pk in list(self._feeds):
+            self.forget(game_pk)
+        self.prune_state()
+
+    def prune_state(self, max_age_seconds: float = LIVE_GAME_STATE_MAX_AGE_SECONDS, now: Optional[float] = None) -> int:
+        if self.state_dir is None or not live_game_state_enabled() or not self.state_dir.is_dir():
+            return 0
+        cutoff = (time.time() if now is None else float(now)) - float(max_age_seconds)
+        removed = 0
+        for path in self.state_dir.glob("*.json.gz"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+
+def live_game_state_enabled() -> bool:
+    return not env_flag_enabled(LIVE_GAME_STATE_DISABLE_ENV)
+
+
+_DEFAULT_POLLER: Optional[LiveGamePoller] = None
+_DEFAULT_POLLER_LOCK = threading.Lock()
+
+
+def get_live_game_poller() -> LiveGamePoller:
+    global _DEFAULT_POLLER
+    with _DEFAULT_POLLER_LOCK:
+        if _DEFAULT_POLLER is None:
+            _DEFAULT_POLLER = LiveGamePoller(os.environ.get(LIVE_GAME_STATE_DIR_ENV) or LIVE_GAME_STATE_DIR)
+        return _DEFAULT_POLLER
+
+
+def live_boxscore_teams(game_pk: int) -> Dict[str, Any]:
+    feed = get_live_game_poller().feed(game_pk)
+    return (((feed.get("liveData") or {}).get("boxscore") or {}).get("teams")) or {}
+
+
+def live_plays(game_pk: int) -> Dict[str, Any]:
+    feed = get_live_game_poller().feed(game_pk)
+    return ((feed.get("liveData") or {}).get("plays")) or {}
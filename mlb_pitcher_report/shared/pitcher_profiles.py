@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Any, Dict, Optional, Tuple
+
+from mlb_pitcher_report.shared.report_data import (
+    build_pitcher_form_from_game_logs,
+    fetch_pitcher_person,
+    parse_date,
+    pitcher_person_game_log_splits,
+    pitcher_person_season_stat,
+    resolve_pitcher_id,
+)
+
+PITCHER_PROFILE_RECENT_STARTS = 5
+PITCHER_PROFILE_CACHE: Dict[Tuple[int, int, dt.date], Optional[Dict[str, Any]]] = {}
+
+
+def build_pitcher_profile(
+    person: Dict[str, Any],
+    report_date: dt.date,
+    *,
+    recent_starts: int = PITCHER_PROFILE_RECENT_STARTS,
+) -> Dict[str, Any]:
+    game_log = pitcher_person_game_log_splits(person)
+    debut_date = parse_date(person.get("mlbDebutDate"))
+    return {
+        "id": int(person["id"]),
+        "name": str(person.get("fullName") or "").strip(),
+        "hand": str(((person.get("pitchHand") or {}).get("code") or "")).upper() or None,
+        "debut_year": debut_date.year if debut_date is not None else None,
+        "person": person,
+        "season_stat": pitcher_person_season_stat(person),
+        "game_log": game_log,
+        "season": build_pitcher_form_from_game_logs(game_log, report_date),
+        "recent": build_pitcher_form_from_game_logs(
+            game_log,
+            report_date,
+            starts_only=True,
+            limit=recent_starts,
+        ),
+    }
+
+
+def get_pitcher_profile(pitcher_id: int, season: int, report_date: dt.date) -> Optional[Dict[str, Any]]:
+    cache_key = (int(pitcher_id), int(season), report_date)
+    if cache_key in PITCHER_PROFILE_CACHE:
+        return PITCHER_PROFILE_CACHE[cache_key]
+
+    person = fetch_pitcher_person(int(pitcher_id), int(season))
+    profile = build_pitcher_profile(person, report_date) if person else None
+    PITCHER_PROFILE_CACHE[cache_key] = profile
+    return profile
+
+
+def get_pitcher_profile_by_name(pitcher_name: Any, season: int, report_date: dt.date) -> Optional[Dict[str, Any]]:
+    pitcher_id = resolve_pitcher_id(pitcher_name)
+    if pitcher_id is None:
+        return None
+    return get_pitcher_profile(pitcher_id, season, report_date)
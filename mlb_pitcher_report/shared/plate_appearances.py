@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import datetime as dt
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from mlb_pitcher_report.shared.response_cache import PersistentStoreSingleton
+
+PLATE_APPEARANCE_STORE_PATH = Path("report_state") / "plate-appearances.sqlite3"
+PLATE_APPEARANCE_STORE_PATH_ENV = "MLB_REPORT_PA_STORE_PATH"
+PLATE_APPEARANCE_STORE_DISABLE_ENV = "MLB_REPORT_DISABLE_PA_STORE"
+EMPTY_GAME_RETRY_SECONDS = 24 * 3600
+
+PlateAppearanceRecord = Tuple[int, int, str, int]
+
+NON_AT_BAT_EVENTS = {"walk", "intent_walk", "hit_by_pitch", "sac_fly", "sac_bunt", "catcher_interf"}
+HIT_EVENT_BASES = {"single": 1, "double": 2, "triple": 3, "home_run": 4}
+STRIKEOUT_EVENTS = {"strikeout", "strikeout_double_play"}
+
+STAT_LINE_COLUMNS = ("PA", "AB", "H", "BB", "HBP", "SF", "TB", "K", "HR", "RBI")
+INDEX_EPOCH_ORDINAL = dt.date(1970, 1, 1).toordinal()
+INDEX_BATTER_SHIFT = 16
+INDEX_PITCHER_SHIFT = 40
+INDEX_DATE_MASK = (1 << INDEX_BATTER_SHIFT) - 1
+INDEX_ID_MASK = (1 << (INDEX_PITCHER_SHIFT - INDEX_BATTER_SHIFT)) - 1
+
+EVENT_CATEGORY_IN_PLAY_OUT = 0
+EVENT_CATEGORY_BY_TYPE = {
+    "single": 1,
+    "double": 2,
+    "triple": 3,
+    "home_run": 4,
+    "walk": 5,
+    "intent_walk": 5,
+    "hit_by_pitch": 6,
+    "sac_fly": 7,
+    "sac_bunt": 8,
+    "catcher_interf": 8,
+    "strikeout": 9,
+    "strikeout_double_play": 9,
+}
+EVENT_CATEGORY_CONTRIBUTIONS = np.array(
+    [
+        # PA, AB, H, BB, HBP, SF, TB, K, HR
+        [1, 1, 0, 0, 0, 0, 0, 0, 0],
+        [1, 1, 1, 0, 0, 0, 1, 0, 0],
+        [1, 1, 1, 0, 0, 0, 2, 0, 0],
+        [1, 1, 1, 0, 0, 0, 3, 0, 0],
+        [1, 1, 1, 0, 0, 0, 4, 0, 1],
+        [1, 0, 0, 1, 0, 0, 0, 0, 0],
+        [1, 0, 0, 0, 1, 0, 0, 0, 0],
+        [1, 0, 0, 0, 0, 1, 0, 0, 0],
+        [1, 0, 0, 0, 0, 0, 0, 0, 0],
+        [1, 1, 0, 0, 0, 0, 0, 1, 0],
+    ],
+    dtype=np.int32,
+)
+
+
+def event_category(event_type: str) -> int:
+    return EVENT_CATEGORY_BY_TYPE.get(event_type, EVENT_CATEGORY_IN_PLAY_OUT)
+
+
+def _date_offset(value: dt.date) -> int:
+    return min(max(value.toordinal() - INDEX_EPOCH_ORDINAL, 0), INDEX_DATE_MASK)
+
+
+def _matchup_key(pitcher_ids: Any, batter_ids: Any) -> np.ndarray:
+    pitchers = np.asarray(pitcher_ids, dtype=np.uint64) & np.uint64(INDEX_ID_MASK)
+    batters = np.asarray(batter_ids, dtype=np.uint64) & np.uint64(INDEX_ID_MASK)
+    return (pitchers << np.uint64(INDEX_PITCHER_SHIFT)) | (batters << np.uint64(INDEX_BATTER_SHIFT))
+
+
+class PlateAppearanceIndex:
+    def __init__(self, keys: np.ndarray, values: np.ndarray) -> None:
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.values = values[order]
+        self.cumulative = np.zeros((len(self.keys) + 1, len(STAT_LINE_COLUMNS)), dtype=np.int64)
+        np.cumsum(self.values, axis=0, out=self.cumulative[1:])
+
+    @classmethod
+    def empty(cls) -> PlateAppearanceIndex:
+        return cls(np.zeros(0, dtype=np.uint64), np.zeros((0, len(STAT_LINE_COLUMNS)), dtype=np.int32))
+
+    @staticmethod
+    def build_columns(
+        rows: Sequence[Tuple[int, int, dt.date, str, int]],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        count = len(rows)
+        pitcher_ids = np.fromiter((row[0] for row in rows), dtype=np.uint64, count=count)
+        batter_ids = np.fromiter((row[1] for row in rows), dtype=np.uint64, count=count)
+        day_offsets = np.fromiter((_date_offset(row[2]) for row in rows), dtype=np.uint64, count=count)
+        categories = np.fromiter((event_category(row[3]) for row in rows), dtype=np.intp, count=count)
+        rbi = np.fromiter((row[4] for row in rows), dtype=np.int32, count=count)
+
+        keys = _matchup_key(pitcher_ids, batter_ids) | day_offsets
+        values = np.empty((count, len(STAT_LINE_COLUMNS)), dtype=np.int32)
+        values[:, :-1] = EVENT_CATEGORY_CONTRIBUTIONS[categories]
+        values[:, -1] = rbi
+        return keys, values
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Tuple[int, int, dt.date, str, int]]) -> PlateAppearanceIndex:
+        return cls(*cls.build_columns(rows))
+
+    def extended(self, rows: Sequence[Tuple[int, int, dt.date, str, int]]) -> PlateAppearanceIndex:
+        if not rows:
+            return self
+        keys, values = self.build_columns(rows)
+        return PlateAppearanceIndex(np.concatenate([self.keys, keys]), np.concatenate([self.values, values]))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def batter_ids_for_pitcher(self, pitcher_id: int) -> np.ndarray:
+        start_key = np.uint64(int(pitcher_id) << INDEX_PITCHER_SHIFT)
+        end_key = np.uint64((int(pitcher_id) + 1) << INDEX_PITCHER_SHIFT)
+        lo, hi = np.searchsorted(self.keys, [start_key, end_key], side="left")
+        segment = self.keys[lo:hi]
+        return np.unique((segment >> np.uint64(INDEX_BATTER_SHIFT)) & np.uint64(INDEX_ID_MASK)).astype(np.int64)
+
+    def stat_totals(
+        self,
+        pitcher_id: int,
+        before_date: dt.date,
+        batter_ids: Optional[Iterable[int]] = None,
+    ) -> Dict[int, Dict[str, int]]:
+        if batter_ids is None:
+            batters = self.batter_ids_for_pitcher(pitcher_id)
+        else:
+            batters = np.unique(np.fromiter((int(batter_id) for batter_id in batter_ids), dtype=np.int64))
+        if len(batters) == 0 or len(self.keys) == 0:
+            return {}
+
+        matchup_keys = _matchup_key(np.full(len(batters), int(pitcher_id)), batters)
+        starts = np.searchsorted(self.keys, matchup_keys, side="left")
+        stops = np.searchsorted(self.keys, matchup_keys | np.uint64(_date_offset(before_date)), side="left")
+        totals = self.cumulative[stops] - self.cumulative[starts]
+
+        lines: Dict[int, Dict[str, int]] = {}
+        for batter_id, row in zip(batters.tolist(), totals.tolist()):
+            if row[0] <= 0:
+                continue
+            lines[int(batter_id)] = dict(zip(STAT_LINE_COLUMNS, row))
+        return lines
+
+
+def extract_plate_appearance_records(plays: Sequence[Dict[str, Any]]) -> List[PlateAppearanceRecord]:
+    records: List[PlateAppearanceRecord] = []
+    for play in plays:
+        result = play.get("result") or {}
+        if str(result.get("type") or "").strip() != "atBat":
+            continue
+        event_type = str(result.get("eventType") or "").strip().lower()
+        if not event_type:
+            continue
+        matchup = play.get("matchup") or {}
+        try:
+            batter_id = int((matchup.get("batter") or {}).get("id"))
+            pitcher_id = int((matchup.get("pitcher") or {}).get("id"))
+        except (TypeError, ValueError):
+            continue
+        try:
+            rbi = int(result.get("rbi") or 0)
+        except (TypeError, ValueError):
+            rbi = 0
+        records.append((batter_id, pitcher_id, event_type, rbi))
+    return records
+
+
+class PlateAppearanceStore:
+    def __init__(self, path: Path | str, *, clock: Callable[[], float] = time.time) -> None:
+        self.path = Path(path)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._index: Optional[PlateAppearanceIndex] = None
+        self._indexed_game_count = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS games ("
+                "game_pk INTEGER PRIMARY KEY, "
+                "game_date TEXT NOT NULL, "
+                "plate_appearances INTEGER NOT NULL"
+                ")"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS plate_appearances ("
+                "game_pk INTEGER NOT NULL, "
+                "game_date TEXT NOT NULL, "
+                "batter_id INTEGER NOT NULL, "
+                "pitcher_id INTEGER NOT NULL, "
+                "event_type TEXT NOT NULL, "
+                "rbi INTEGER NOT NULL"
+                ")"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS empty_games ("
+                "game_pk INTEGER PRIMARY KEY, "
+                "checked_at REAL NOT NULL"
+                ")"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS plate_appearances_pitcher_batter "
+                "ON plate_appearances (pitcher_id, batter_id, game_date)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def _select_game_ids(self, query: str, game_ids: Iterable[int], *params: Any) -> Set[int]:
+        requested = sorted({int(game_id) for game_id in game_ids})
+        selected: Set[int] = set()
+        with self._lock:
+            connection = self._connect()
+            for start in range(0, len(requested), 500):
+                chunk = requested[start : start + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = connection.execute(query.format(placeholders=placeholders), [*chunk, *params]).fetchall()
+                selected.update(int(row[0]) for row in rows)
+        return selected
+
+    def stored_game_ids(self, game_ids: Iterable[int]) -> Set[int]:
+        return self._select_game_ids("SELECT game_pk FROM games WHERE game_pk IN ({placeholders})", game_ids)
+
+    def recently_empty_game_ids(self, game_ids: Iterable[int]) -> Set[int]:
+        return self._select_game_ids(
+            "SELECT game_pk FROM empty_games WHERE game_pk IN ({placeholders}) AND checked_at > ?",
+            game_ids,
+            self._clock() - EMPTY_GAME_RETRY_SECONDS,
+        )
+
+    def missing_game_ids(self, game_ids: Sequence[int]) -> List[int]:
+        skipped = self.stored_game_ids(game_ids) | self.recently_empty_game_ids(game_ids)
+        return [int(game_id) for game_id in dict.fromkeys(game_ids) if int(game_id) not in skipped]
+
+    def record_empty_games(self, game_pks: Iterable[int]) -> None:
+        # An empty play-by-play is not proof that a game had no plate appearances, so it is only
+        # remembered long enough to avoid refetching it on every run, never as an ingested game.
+        checked_at = self._clock()
+        rows = [(int(game_pk), checked_at) for game_pk in dict.fromkeys(game_pks)]
+        if not rows:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO empty_games (game_pk, checked_at) VALUES (?, ?)",
+                    rows,
+                )
+
+    def ingest_game(self, game_pk: int, game_date: dt.date, records: Sequence[PlateAppearanceRecord]) -> None:
+        self.ingest_games([(game_pk, game_date, records)])
+
+    def ingest_games(self, games: Sequence[Tuple[int, dt.date, Sequence[PlateAppearanceRecord]]]) -> None:
+        if not games:
+            return
+        index_rows: List[Tuple[int, int, dt.date, str, int]] = []
+        with self._lock:
+            connection = self._connect()
+            stored_before = self._stored_game_count(connection)
+            with connection:
+                for game_pk, game_date, records in games:
+                    date_text = game_date.isoformat()
+                    connection.execute("DELETE FROM empty_games WHERE game_pk = ?", (int(game_pk),))
+                    connection.execute("DELETE FROM plate_appearances WHERE game_pk = ?", (int(game_pk),))
+                    connection.executemany(
+                        "INSERT INTO plate_appearances (game_pk, game_date, batter_id, pitcher_id, event_type, rbi) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        [
+                            (int(game_pk), date_text, batter_id, pitcher_id, event_type, rbi)
+                            for batter_id, pitcher_id, event_type, rbi in records
+                        ],
+                    )
+                    connection.execute(
+                        "INSERT OR REPLACE INTO games (game_pk, game_date, plate_appearances) VALUES (?, ?, ?)",
+                        (int(game_pk), date_text, len(records)),
+                    )
+                    index_rows.extend(
+                        (pitcher_id, batter_id, game_date, event_type, rbi)
+                        for batter_id, pitcher_id, event_type, rbi in records
+                    )
+            if self._index is None:
+                return
+            # Extend the in-memory index only when it already mirrored the table and every game
+            # here was new; replaced games or rows written by another process force a rebuild.
+            added_games = self._stored_game_count(connection) - stored_before
+            if stored_before == self._indexed_game_count and added_games == len({int(game[0]) for game in games}):
+                self._index = self._index.extended(index_rows)
+                self._indexed_game_count += added_games
+            else:
+                self._index = None
+
+    def _stored_game_count(self, connection: sqlite3.Connection) -> int:
+        return int(connection.execute("SELECT COUNT(*) FROM games").fetchone()[0])
+
+    def index(self) -> PlateAppearanceIndex:
+        with self._lock:
+            connection = self._connect()
+            stored_game_count = self._stored_game_count(connection)
+            if self._index is None or stored_game_count != self._indexed_game_count:
+                rows = connection.execute(
+                    "SELECT pitcher_id, batter_id, game_date, event_type, rbi FROM plate_appearances"
+                ).fetchall()
+                self._index = PlateAppearanceIndex.from_rows(
+                    [
+                        (pitcher_id, batter_id, dt.date.fromisoformat(game_date), event_type, rbi)
+                        for pitcher_id, batter_id, game_date, event_type, rbi in rows
+                    ]
+                )
+                self._indexed_game_count = stored_game_count
+            return self._index
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def _open_plate_appearance_store(path: str) -> PlateAppearanceStore:
+    store = PlateAppearanceStore(path)
+    store.stored_game_ids([])
+    return store
+
+
+_DEFAULT_STORE = PersistentStoreSingleton(
+    "Plate appearance store",
+    _open_plate_appearance_store,
+    default_path=PLATE_APPEARANCE_STORE_PATH,
+    path_env=PLATE_APPEARANCE_STORE_PATH_ENV,
+    disable_env=PLATE_APPEARANCE_STORE_DISABLE_ENV,
+)
+
+
+def plate_appearance_store_enabled() -> bool:
+    return _DEFAULT_STORE.enabled()
+
+
+def get_plate_appearance_store() -> Optional[PlateAppearanceStore]:
+    return _DEFAULT_STORE.get()
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import datetime as dt
+import gzip
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import statsapi
+from unidecode import unidecode
+
+from mlb_pitcher_report.shared.response_cache import env_flag_enabled
+
+PLAYER_DIRECTORY_PATH = Path("report_state") / "player-directory.json.gz"
+PLAYER_DIRECTORY_PATH_ENV = "MLB_REPORT_PLAYER_DIRECTORY_PATH"
+PLAYER_DIRECTORY_DISABLE_ENV = "MLB_REPORT_DISABLE_PLAYER_DIRECTORY"
+PLAYER_DIRECTORY_NAME_FIELDS = ("fullName", "firstLastName", "nameFirstLast")
+
+
+def normalize_person_name(name: Any) -> str:
+    text = unidecode(str(name or "")).lower().strip()
+    text = text.replace(".", "").replace("'", "")
+    return " ".join(text.split())
+
+
+def build_directory_entry(person: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    try:
+        person_id = int(person.get("id"))
+    except (TypeError, ValueError):
+        return None
+
+    names = [person.get(field) for field in PLAYER_DIRECTORY_NAME_FIELDS]
+    use_name = str(person.get("useName") or "").strip()
+    last_name = str(person.get("useLastName") or person.get("lastName") or "").strip()
+    if use_name and last_name:
+        names.append(f"{use_name} {last_name}")
+    name_keys = list(dict.fromkeys(key for key in (normalize_person_name(name) for name in names) if key))
+    if not name_keys:
+        return None
+
+    team_id = (person.get("currentTeam") or {}).get("id")
+    return {
+        "id": person_id,
+        "name": str(person.get("fullName") or "").strip(),
+        "name_keys": name_keys,
+        "team_id": int(team_id) if team_id is not None else None,
+        "bat_side": str((person.get("batSide") or {}).get("code") or "").upper() or None,
+        "pitch_hand": str((person.get("pitchHand") or {}).get("code") or "").upper() or None,
+        "position_type": str((person.get("primaryPosition") or {}).get("type") or "").strip() or None,
+        "active": bool(person.get("active", True)),
+    }
+
+
+class PlayerDirectory:
+    def __init__(self, entries: Sequence[Dict[str, Any]], *, season: int, refreshed_on: str) -> None:
+        self.season = int(season)
+        self.refreshed_on = str(refreshed_on)
+        self.players: Dict[int, Dict[str, Any]] = {}
+        self.index: Dict[str, List[int]] = {}
+        for entry in entries:
+            self.players[int(entry["id"])] = entry
+            for name_key in entry.get("name_keys") or []:
+                self.index.setdefault(name_key, []).append(int(entry["id"]))
+
+    @classmethod
+    def from_people(cls, people: Sequence[Dict[str, Any]], *, season: int, refreshed_on: str) -> PlayerDirectory:
+        entries = [entry for entry in (build_directory_entry(person) for person in people) if entry is not None]
+        return cls(entries, season=season, refreshed_on=refreshed_on)
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def find(
+        self,
+        name: Any,
+        *,
+        team_id: Optional[int] = None,
+        position_type: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        candidates = [self.players[person_id] for person_id in self.index.get(normalize_person_name(name), [])]
+        if team_id is not None:
+            candidates = [entry for entry in candidates if entry.get("team_id") == int(team_id)]
+        if position_type is not None:
+            candidates = [entry for entry in candidates if entry.get("position_type") == position_type]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda entry: entry.get("active", False))
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "season": self.season,
+            "refreshed_on": self.refreshed_on,
+            "players": list(self.players.values()),
+        }
+
+    def save(self, path: Path | str) -> None:
+        path = Path(path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{path.name}.tmp")
+            with gzip.open(temp_path, "wt", encoding="utf-8") as handle:
+                json.dump(self.to_payload(), handle, separators=(",", ":"))
+            temp_path.replace(path)
+        except OSError as exc:
+            print(f"\033[93mCould not persist player directory to {path}: {exc}\033[0m")
+
+    @classmethod
+    def load(cls, path: Path | str) -> Optional[PlayerDirectory]:
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                payload = json.load(handle)
+            return cls(payload["players"], season=payload["season"], refreshed_on=payload["refreshed_on"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+def fetch_player_directory(season: int, refreshed_on: str) -> PlayerDirectory:
+    payload = statsapi.get("sports_players", {"sportId": 1, "season": int(season)})
+    return PlayerDirectory.from_people(payload.get("people") or [], season=season, refreshed_on=refreshed_on)
+
+
+def player_directory_enabled() -> bool:
+    return not env_flag_enabled(PLAYER_DIRECTORY_DISABLE_ENV)
+
+
+_DEFAULT_DIRECTORY: Optional[PlayerDirectory] = None
+_DEFAULT_DIRECTORY_LOCK = threading.Lock()
+_REFRESH_ATTEMPTED_ON: Optional[str] = None
+
+
+def get_player_directory(today: Optional[dt.date] = None) -> Optional[PlayerDirectory]:
+    global _DEFAULT_DIRECTORY, _REFRESH_ATTEMPTED_ON
+    if not player_directory_enabled():
+        return None
+    today = today or dt.date.today()
+    with _DEFAULT_DIRECTORY_LOCK:
+        if _DEFAULT_DIRECTORY is not None and _DEFAULT_DIRECTORY.refreshed_on == today.isoformat():
+            return _DEFAULT_DIRECTORY
+
+        path = os.environ.get(PLAYER_DIRECTORY_PATH_ENV) or PLAYER_DIRECTORY_PATH
+        stored = _DEFAULT_DIRECTORY or PlayerDirectory.load(path)
+        if (stored is not None and stored.refreshed_on == today.isoformat()) or _REFRESH_ATTEMPTED_ON == today.isoformat():
+            _DEFAULT_DIRECTORY = stored
+            return stored
+
+        _REFRESH_ATTEMPTED_ON = today.isoformat()
+        try:
+            directory = fetch_player_directory(today.year, today.isoformat())
+        except Exception as exc:
+            print(f"\033[93mPlayer directory refresh failed: {exc}\033[0m")
+            directory = None
+        if directory is None or not len(directory):
+            _DEFAULT_DIRECTORY = stored
+            return stored
+
+        directory.save(path)
+        _DEFAULT_DIRECTORY = directory
+        return directory
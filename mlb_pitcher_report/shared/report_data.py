@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import datetime as dt
+import sqlite3
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import quote
 from zoneinfo import ZoneInfo
 
 import pandas as pd
@@ -10,14 +12,59 @@ import requests
 import statsapi
 from unidecode import unidecode
 
+from mlb_pitcher_report.shared.http_client import http_get, install_statsapi_session
+from mlb_pitcher_report.shared.live_games import live_boxscore_teams, live_plays
+from mlb_pitcher_report.shared.player_directory import get_player_directory, normalize_person_name
+from mlb_pitcher_report.shared.plate_appearances import (
+    HIT_EVENT_BASES,
+    NON_AT_BAT_EVENTS,
+    STRIKEOUT_EVENTS,
+    PlateAppearanceStore,
+    extract_plate_appearance_records,
+    get_plate_appearance_store,
+)
+from mlb_pitcher_report.shared.response_cache import (
+    DAY_SECONDS,
+    HOUR_SECONDS,
+    MINUTE_SECONDS,
+    cached_fetch,
+    get_response_cache,
+)
+from mlb_pitcher_report.shared.stat_lines import (
+    SPLIT_STAT_FIELDS,
+    BatterGameLogRow,
+    GameLog,
+    PitcherGameLogRow,
+    StatLineArray,
+    aggregate_stat_line_groups,
+    as_game_log,
+    compute_window_metrics,
+)
+
+install_statsapi_session()
+
 SCHEDULE_STATUSES = {"Pre-Game", "Scheduled", "Warmup", "Final", "In Progress"}
 NOT_STARTED_STATUSES = {"Pre-Game", "Scheduled", "Warmup"}
 REQUEST_TIMEOUT_SECONDS = 20
+TEAM_META_TTL_SECONDS = 7 * DAY_SECONDS
+TEAM_ROSTER_TTL_SECONDS = HOUR_SECONDS
+PARK_WEATHER_TTL_SECONDS = HOUR_SECONDS
+ESPN_SUMMARY_TTL_SECONDS = 5 * MINUTE_SECONDS
+CURRENT_SEASON_GAME_LOG_TTL_SECONDS = 30 * MINUTE_SECONDS
+PEOPLE_ENDPOINT_URL = "https://statsapi.mlb.com/api/v1/people"
+PEOPLE_MAX_URL_LENGTH = 2000
+PEOPLE_FETCH_WORKERS = 8
+PEOPLE_CHUNK_SIZE = 25
+PEOPLE_SPLITTABLE_STATUSES = {400, 413, 414}
+PEOPLE_STATS_TTL_SECONDS = DAY_SECONDS
+PEOPLE_LIVE_STATS_TTL_SECONDS = 30 * MINUTE_SECONDS
 
 TEAM_META_CACHE: Dict[int, Dict[str, Any]] = {}
 TEAM_ROSTER_CACHE: Dict[int, List[Dict[str, Any]]] = {}
-PITCHER_LOOKUP_CACHE: Dict[str, Optional[Dict[str, Any]]] = {}
+PITCHER_LOOKUP_CACHE: Dict[Tuple[str, int], Optional[Dict[str, Any]]] = {}
+PITCHER_ID_CACHE: Dict[str, Optional[int]] = {}
 ESPN_SUMMARY_CACHE: Dict[str, Optional[Dict[str, Any]]] = {}
+ESPN_SCOREBOARD_CACHE: Dict[str, List[Dict[str, Any]]] = {}
 LINEUP_NAME_LOOKUP_CACHE: Dict[Tuple[int, str], Optional[int]] = {}
 LAST_GAME_LINEUP_CACHE: Dict[int, List[int]] = {}
 TEAM_HAND_SPLIT_CACHE: Dict[Tuple[int, int], Dict[str, Any]] = {}
@@ -27,10 +74,18 @@ PITCHER_SEASON_RANK_CACHE: Dict[Tuple[int, int], Dict[int, Dict[str, int]]] = {}
 PARK_WEATHER_CACHE: Dict[Tuple[int, str], Optional[Dict[str, Any]]] = {}
 GAME_BVP_LINE_CACHE: Dict[Tuple[int, int], Dict[int, Dict[str, Any]]] = {}
 GAME_BATTER_LINE_CACHE: Dict[int, Dict[int, Dict[str, Any]]] = {}
-PITCHER_DEBUT_YEAR_CACHE: Dict[int, int] = {}
-PITCHER_GAME_LOG_CACHE: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+GAME_PITCHER_STRIKEOUT_CACHE: Dict[int, Dict[int, Dict[str, Any]]] = {}
 BATTER_GAME_LOG_CACHE: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
 PITCHER_HISTORICAL_BVP_CACHE: Dict[Tuple[int, dt.date], Dict[int, Dict[str, Any]]] = {}
+PEOPLE_STATS_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+ESPN_STATE_CACHES = (ESPN_SCOREBOARD_CACHE, ESPN_SUMMARY_CACHE)
+LIVE_STATE_CACHES = (
+    GAME_BVP_LINE_CACHE,
+    PEOPLE_STATS_CACHE,
+    PARK_WEATHER_CACHE,
+    BATTER_GAME_LOG_CACHE,
+    LAST_GAME_LINEUP_CACHE,
+)
 
 MLB_PARK_METADATA: Dict[int, Dict[str, Any]] = {
     1: {"name": "Angel Stadium", "lat": 33.8003, "lon": -117.8827, "roof_type": "open"},
@@ -66,12 +121,6 @@ MLB_PARK_METADATA: Dict[int, Dict[str, Any]] = {
 }
 
 
-def normalize_person_name(name: Any) -> str:
-    text = unidecode(str(name or "")).lower().strip()
-    text = text.replace(".", "").replace("'", "")
-    return " ".join(text.split())
-
-
 def normalize_team_name(name: Any) -> str:
     text = unidecode(str(name or "")).lower().strip()
     text = text.replace(".", "").replace("'", "")
@@ -160,6 +209,11 @@ def resolve_date_input(raw_input: str) -> str:
     raise ValueError("Date must be 'today', 'tmrw', 'MM/DD', or 'MM/DD/YYYY'.")
 
 
+def clear_process_caches(caches: Iterable[Dict[Any, Any]]) -> None:
+    for cache in caches:
+        cache.clear()
+
+
 def _next_report_date(report_date: str) -> str:
     date_obj = dt.datetime.strptime(report_date, "%m/%d/%Y")
     return (date_obj + dt.timedelta(days=1)).strftime("%m/%d/%Y")
@@ -204,7 +258,13 @@ def fetch_team_meta(team_id: int) -> Dict[str, Any]:
     if team_id in TEAM_META_CACHE:
         return TEAM_META_CACHE[team_id]
 
-    data = statsapi.get("team", {"teamId": team_id})
+    data = cached_fetch(
+        "team",
+        {"teamId": team_id},
+        lambda: statsapi.get("team", {"teamId": team_id}),
+        ttl_seconds=TEAM_META_TTL_SECONDS,
+        should_store=lambda payload: bool(payload.get("teams")),
+    )
     team = (data.get("teams") or [{}])[0]
     TEAM_META_CACHE[team_id] = team
     return team
@@ -214,7 +274,13 @@ def fetch_team_roster(team_id: int) -> List[Dict[str, Any]]:
     if team_id in TEAM_ROSTER_CACHE:
         return TEAM_ROSTER_CACHE[team_id]
 
-    roster_data = statsapi.get("team_roster", {"teamId": team_id})
+    roster_data = cached_fetch(
+        "team_roster",
+        {"teamId": team_id},
+        lambda: statsapi.get("team_roster", {"teamId": team_id}),
+        ttl_seconds=TEAM_ROSTER_TTL_SECONDS,
+        should_store=lambda payload: bool(payload.get("roster")),
+    )
     roster = roster_data.get("roster") or []
     TEAM_ROSTER_CACHE[team_id] = roster
     return roster
@@ -307,10 +373,14 @@ def _fetch_open_meteo_hourly_payload(venue_id: int, report_date: str) -> Optiona
         "start_date": dt.datetime.strptime(report_date, "%m/%d/%Y").strftime("%Y-%m-%d"),
         "end_date": dt.datetime.strptime(report_date, "%m/%d/%Y").strftime("%Y-%m-%d"),
     }
-    try:
-        response = requests.get(url, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
+
+    def fetch_payload() -> Dict[str, Any]:
+        response = http_get(url, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
         response.raise_for_status()
-        payload = response.json()
+        return response.json()
+
+    try:
+        payload = cached_fetch("open_meteo_hourly", params, fetch_payload, ttl_seconds=PARK_WEATHER_TTL_SECONDS)
     except (requests.RequestException, ValueError):
         payload = None
 
@@ -343,24 +413,78 @@ def fetch_park_context(venue_id: Any, game_datetime: Any, report_date: str) -> O
     return context
 
 
-def fetch_pitcher_context(pitcher_name: str) -> Optional[Dict[str, Any]]:
-    key = normalize_person_name(pitcher_name)
+def resolve_pitcher_id(pitcher_name: Any) -> Optional[int]:
+    name_text = str(pitcher_name or "").strip()
+    key = normalize_person_name(name_text)
+    if not key:
+        return None
+    if key in PITCHER_ID_CACHE:
+        return PITCHER_ID_CACHE[key]
+
+    directory = get_player_directory()
+    entry = directory.find(name_text, position_type="Pitcher") if directory is not None else None
+    if entry is not None:
+        PITCHER_ID_CACHE[key] = int(entry["id"])
+        return PITCHER_ID_CACHE[key]
+
+    try:
+        player = choose_best_player_match(statsapi.lookup_player(name_text) or [], name_text)
+    except Exception:
+        return None
+    pitcher_id = to_int(player.get("id") if player else None)
+    PITCHER_ID_CACHE[key] = pitcher_id
+    return pitcher_id
+
+
+def build_pitcher_person_hydrate(season: int) -> str:
+    return f"stats(group=[pitching],type=[season,gameLog],season={int(season)})"
+
+
+def fetch_pitcher_people(pitcher_ids: Sequence[int], season: int) -> Dict[int, Dict[str, Any]]:
+    requested_ids = list(dict.fromkeys(int(pitcher_id) for pitcher_id in pitcher_ids))
+    if not requested_ids:
+        return {}
+
+    hydrate = build_pitcher_person_hydrate(season)
+    completed_season = int(season) < dt.date.today().year
+    ttl_seconds = PEOPLE_STATS_TTL_SECONDS if completed_season else CURRENT_SEASON_GAME_LOG_TTL_SECONDS
+    fetch_people_batch(
+        {hydrate: requested_ids},
+        ttl_by_hydrate={hydrate: ttl_seconds},
+        immutable_by_hydrate={hydrate: completed_season},
+    )
+    return {
+        pitcher_id: PEOPLE_STATS_CACHE[(hydrate, pitcher_id)]
+        for pitcher_id in requested_ids
+        if (hydrate, pitcher_id) in PEOPLE_STATS_CACHE
+    }
+
+
+def fetch_pitcher_person(pitcher_id: int, season: int) -> Optional[Dict[str, Any]]:
+    return fetch_pitcher_people([int(pitcher_id)], season).get(int(pitcher_id))
+
+
+def fetch_pitcher_context(pitcher_name: str, season: int) -> Optional[Dict[str, Any]]:
+    key = (normalize_person_name(pitcher_name), int(season))
     if key in PITCHER_LOOKUP_CACHE:
         return PITCHER_LOOKUP_CACHE[key]
 
-    players = statsapi.lookup_player(pitcher_name)
-    player = choose_best_player_match(players or [], pitcher_name)
-    if not player:
+    pitcher_id = resolve_pitcher_id(pitcher_name)
+    if pitcher_id is None:
         PITCHER_LOOKUP_CACHE[key] = None
         return None
 
-    data = statsapi.get("people", {"personIds": player["id"]}, force=True)
-    people = data.get("people") or []
-    if not people:
+    directory = get_player_directory()
+    entry = directory.players.get(pitcher_id) if directory is not None else None
+    if entry is not None and entry.get("pitch_hand"):
+        PITCHER_LOOKUP_CACHE[key] = {"id": pitcher_id, "name": entry["name"] or pitcher_name, "hand": entry["pitch_hand"]}
+        return PITCHER_LOOKUP_CACHE[key]
+
+    person = fetch_pitcher_person(pitcher_id, int(season))
+    if not person:
         PITCHER_LOOKUP_CACHE[key] = None
         return None
 
-    person = people[0]
     result = {
         "id": int(person["id"]),
         "name": str(person.get("fullName") or pitcher_name),
@@ -371,15 +495,21 @@ def fetch_pitcher_context(pitcher_name: str) -> Optional[Dict[str, Any]]:
 
 
 def _fetch_espn_scoreboard_events(date: str) -> List[Dict[str, Any]]:
+    cached = ESPN_SCOREBOARD_CACHE.get(date)
+    if cached is not None:
+        return cached
+
     date_obj = dt.datetime.strptime(date, "%m/%d/%Y")
     url = (
         "https://site.web.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard"
         f"?dates={date_obj.strftime('%Y%m%d')}"
     )
-    response = requests.get(url, timeout=REQUEST_TIMEOUT_SECONDS)
+    response = http_get(url, timeout=REQUEST_TIMEOUT_SECONDS)
     response.raise_for_status()
     payload = response.json()
-    return payload.get("events") or []
+    events = payload.get("events") or []
+    ESPN_SCOREBOARD_CACHE[date] = events
+    return events
 
 
 def extract_espn_scoreboard_snapshot(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -446,6 +576,12 @@ def build_espn_event_lookup(date: str) -> Dict[Tuple[str, str], str]:
     return lookup
 
 
+def _espn_summary_completed(summary: Dict[str, Any]) -> bool:
+    competition = (((summary or {}).get("header") or {}).get("competitions") or [{}])[0]
+    status_type = (competition.get("status") or {}).get("type") or {}
+    return bool(status_type.get("completed"))
+
+
 def fetch_espn_summary(event_id: str) -> Optional[Dict[str, Any]]:
     if not event_id:
         return None
@@ -453,11 +589,21 @@ def fetch_espn_summary(event_id: str) -> Optional[Dict[str, Any]]:
         return ESPN_SUMMARY_CACHE[event_id]
 
     url = f"https://site.web.api.espn.com/apis/site/v2/sports/baseball/mlb/summary?event={event_id}"
-    try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT_SECONDS)
+
+    def fetch_summary() -> Dict[str, Any]:
+        response = http_get(url, timeout=REQUEST_TIMEOUT_SECONDS)
         response.raise_for_status()
-        summary = response.json()
-    except requests.RequestException:
+        return response.json()
+
+    try:
+        summary = cached_fetch(
+            "espn_summary",
+            {"event": event_id},
+            fetch_summary,
+            ttl_seconds=ESPN_SUMMARY_TTL_SECONDS,
+            immutable_when=_espn_summary_completed,
+        )
+    except (requests.RequestException, ValueError):
         summary = None
     ESPN_SUMMARY_CACHE[event_id] = summary
     return summary
@@ -552,6 +698,10 @@ def resolve_lineup_player_ids(
             player_id = LINEUP_NAME_LOOKUP_CACHE[cache_key]
         else:
             player_id = roster_name_lookup.get(cache_key[1])
+            directory = get_player_directory() if player_id is None and player_name else None
+            entry = directory.find(player_name, team_id=team_id) if directory is not None else None
+            if entry is not None:
+                player_id = int(entry["id"])
             if player_id is None and player_name:
                 candidates = statsapi.lookup_player(player_name)
                 for candidate in candidates or []:
@@ -615,50 +765,250 @@ def filter_active_hitters(roster_entries: Sequence[Dict[str, Any]]) -> List[Dict
     return hitters
 
 
-def chunked(values: Sequence[int], size: int) -> Iterable[Sequence[int]]:
-    for start in range(0, len(values), size):
-        yield values[start : start + size]
-
-
-def fetch_people_stats_map(
-    person_ids: Sequence[int],
+def _people_hydrate(
+    stat_types: Sequence[str],
     season: int,
-    pitch_hand: Optional[str],
-    pitcher_id: Optional[int],
+    pitch_hand: Optional[str] = None,
+    pitcher_id: Optional[int] = None,
     stats_end_date: Optional[dt.date] = None,
-) -> Dict[int, Dict[str, Any]]:
-    if not person_ids:
-        return {}
-
+) -> str:
     sit_code = None
     if str(pitch_hand or "").upper() == "L":
         sit_code = "vl"
     elif str(pitch_hand or "").upper() == "R":
         sit_code = "vr"
 
-    hydrate_parts = ["season", "gameLog", "statSplits"]
     hydrate_tail = f",season={season}"
     if stats_end_date is not None:
         hydrate_tail = f"{hydrate_tail},endDate={stats_end_date.strftime('%Y-%m-%d')}"
     if sit_code:
         hydrate_tail = f",sitCodes=[{sit_code}]{hydrate_tail}"
     if pitcher_id:
-        hydrate_parts.append("vsPlayer")
         hydrate_tail = f"{hydrate_tail},opposingPlayerId={pitcher_id}"
-    hydrate = f"stats(group=[hitting],type=[{','.join(hydrate_parts)}]{hydrate_tail})"
+    return f"stats(group=[hitting],type=[{','.join(stat_types)}]{hydrate_tail})"
 
-    people_by_id: Dict[int, Dict[str, Any]] = {}
-    for chunk in chunked(list(dict.fromkeys(int(person_id) for person_id in person_ids)), 8):
+
+def build_people_base_hydrate(season: int, pitch_hand: Optional[str], stats_end_date: Optional[dt.date] = None) -> str:
+    return _people_hydrate(["season", "gameLog", "statSplits"], season, pitch_hand, None, stats_end_date)
+
+
+def build_people_vs_pitcher_hydrate(season: int, pitcher_id: int, stats_end_date: Optional[dt.date] = None) -> str:
+    return _people_hydrate(["vsPlayer"], season, None, pitcher_id, stats_end_date)
+
+
+def _people_stats_ttl(stats_end_date: Optional[dt.date]) -> float:
+    return PEOPLE_STATS_TTL_SECONDS if stats_end_date is not None else PEOPLE_LIVE_STATS_TTL_SECONDS
+
+
+def plan_people_chunks(
+    person_ids: Sequence[int],
+    hydrate: str,
+    *,
+    max_ids: Optional[int] = None,
+    max_url_length: int = PEOPLE_MAX_URL_LENGTH,
+) -> List[List[int]]:
+    id_limit = max(int(max_ids if max_ids is not None else PEOPLE_CHUNK_SIZE), 1)
+    base_length = len(PEOPLE_ENDPOINT_URL) + len("?personIds=&hydrate=") + len(quote(hydrate, safe=",()="))
+    chunks: List[List[int]] = []
+    current: List[int] = []
+    current_length = base_length
+    for person_id in person_ids:
+        id_length = len(str(person_id)) + (1 if current else 0)
+        if current and (len(current) >= id_limit or current_length + id_length > max_url_length):
+            chunks.append(current)
+            current = []
+            current_length = base_length
+            id_length = len(str(person_id))
+        current.append(int(person_id))
+        current_length += id_length
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _is_request_too_large(exc: Exception) -> bool:
+    if isinstance(exc, requests.exceptions.InvalidURL):
+        return True
+    response = getattr(exc, "response", None)
+    return isinstance(exc, requests.exceptions.HTTPError) and (
+        response is not None and response.status_code in PEOPLE_SPLITTABLE_STATUSES
+    )
+
+
+def _fetch_people_chunk(hydrate: str, chunk: Sequence[int]) -> None:
+    try:
         payload = statsapi.get(
             "people",
             {"personIds": ",".join(str(person_id) for person_id in chunk), "hydrate": hydrate},
             force=True,
         )
-        for person in payload.get("people") or []:
-            people_by_id[int(person["id"])] = person
+    except requests.exceptions.RequestException as exc:
+        if len(chunk) <= 1 or not _is_request_too_large(exc):
+            raise
+        midpoint = len(chunk) // 2
+        _fetch_people_chunk(hydrate, chunk[:midpoint])
+        _fetch_people_chunk(hydrate, chunk[midpoint:])
+        return
+
+    for person in payload.get("people") or []:
+        PEOPLE_STATS_CACHE[(hydrate, int(person["id"]))] = person
+
+
+def _load_stored_people(hydrate: str, person_ids: Sequence[int]) -> List[int]:
+    cache = get_response_cache()
+    if cache is None:
+        return list(person_ids)
+    missing_ids: List[int] = []
+    for person_id in person_ids:
+        try:
+            person = cache.get("people_stats", {"hydrate": hydrate, "id": int(person_id)})
+        except sqlite3.Error:
+            person = None
+        if isinstance(person, dict):
+            PEOPLE_STATS_CACHE[(hydrate, int(person_id))] = person
+        else:
+            missing_ids.append(int(person_id))
+    return missing_ids
+
+
+def _store_people(
+    hydrate: str,
+    person_ids: Sequence[int],
+    ttl_seconds: Optional[float],
+    immutable: bool = False,
+) -> None:
+    cache = get_response_cache()
+    if cache is None or (ttl_seconds is None and not immutable):
+        return
+    for person_id in person_ids:
+        person = PEOPLE_STATS_CACHE.get((hydrate, int(person_id)))
+        if person is None:
+            continue
+        try:
+            cache.put(
+                "people_stats",
+                {"hydrate": hydrate, "id": int(person_id)},
+                person,
+                ttl_seconds=None if immutable else ttl_seconds,
+            )
+        except (sqlite3.Error, TypeError, ValueError):
+            return
+
+
+def fetch_people_batch(
+    requests_by_hydrate: Dict[str, Sequence[int]],
+    *,
+    ttl_by_hydrate: Optional[Dict[str, float]] = None,
+    immutable_by_hydrate: Optional[Dict[str, bool]] = None,
+) -> None:
+    chunk_jobs: List[Tuple[str, List[int]]] = []
+    for hydrate, person_ids in requests_by_hydrate.items():
+        missing_ids = [
+            person_id
+            for person_id in dict.fromkeys(int(person_id) for person_id in person_ids)
+            if (hydrate, person_id) not in PEOPLE_STATS_CACHE
+        ]
+        missing_ids = _load_stored_people(hydrate, missing_ids) if missing_ids else []
+        chunk_jobs.extend((hydrate, chunk) for chunk in plan_people_chunks(missing_ids, hydrate))
+    if not chunk_jobs:
+        return
+
+    def fetch_and_store(hydrate: str, chunk: Sequence[int]) -> None:
+        _fetch_people_chunk(hydrate, chunk)
+        _store_people(
+            hydrate,
+            chunk,
+            (ttl_by_hydrate or {}).get(hydrate),
+            bool((immutable_by_hydrate or {}).get(hydrate)),
+        )
+
+    if len(chunk_jobs) == 1:
+        fetch_and_store(*chunk_jobs[0])
+        return
+
+    with ThreadPoolExecutor(max_workers=min(PEOPLE_FETCH_WORKERS, len(chunk_jobs))) as executor:
+        futures = [executor.submit(fetch_and_store, hydrate, chunk) for hydrate, chunk in chunk_jobs]
+        errors = [future.exception() for future in futures]
+    first_error = next((error for error in errors if error is not None), None)
+    if first_error is not None:
+        raise first_error
+
+
+def _add_people_stats_request(
+    requests_by_hydrate: Dict[str, List[int]],
+    ttl_by_hydrate: Dict[str, float],
+    hydrate: str,
+    person_ids: Sequence[int],
+    stats_end_date: Optional[dt.date],
+) -> None:
+    requests_by_hydrate.setdefault(hydrate, []).extend(int(person_id) for person_id in person_ids)
+    ttl_by_hydrate[hydrate] = _people_stats_ttl(stats_end_date)
+
+
+def fetch_people_stats_batch(
+    people_requests: Sequence[Tuple[Sequence[int], int, Optional[str], Optional[int], Optional[dt.date]]],
+) -> None:
+    requests_by_hydrate: Dict[str, List[int]] = {}
+    ttl_by_hydrate: Dict[str, float] = {}
+    for person_ids, season, pitch_hand, pitcher_id, stats_end_date in people_requests:
+        base_hydrate = build_people_base_hydrate(season, pitch_hand, stats_end_date)
+        _add_people_stats_request(requests_by_hydrate, ttl_by_hydrate, base_hydrate, person_ids, stats_end_date)
+        if pitcher_id:
+            vs_hydrate = build_people_vs_pitcher_hydrate(season, int(pitcher_id), stats_end_date)
+            _add_people_stats_request(requests_by_hydrate, ttl_by_hydrate, vs_hydrate, person_ids, stats_end_date)
+    fetch_people_batch(requests_by_hydrate, ttl_by_hydrate=ttl_by_hydrate)
+
+
+def _merge_person_stats(base_person: Dict[str, Any], vs_person: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if not vs_person:
+        return base_person
+    return {**base_person, "stats": list(base_person.get("stats") or []) + list(vs_person.get("stats") or [])}
+
+
+def fetch_people_stats_map(
+    person_ids: Sequence[int],
+    season: int,
+    pitch_hand: Optional[str],
+    pitcher_id: Optional[int],
+    stats_end_date: Optional[dt.date] = None,
+) -> Dict[int, Dict[str, Any]]:
+    if not person_ids:
+        return {}
+
+    requested_ids = list(dict.fromkeys(int(person_id) for person_id in person_ids))
+    fetch_people_stats_batch([(requested_ids, season, pitch_hand, pitcher_id, stats_end_date)])
+
+    base_hydrate = build_people_base_hydrate(season, pitch_hand, stats_end_date)
+    vs_hydrate = build_people_vs_pitcher_hydrate(season, int(pitcher_id), stats_end_date) if pitcher_id else None
+    people_by_id: Dict[int, Dict[str, Any]] = {}
+    for person_id in requested_ids:
+        base_person = PEOPLE_STATS_CACHE.get((base_hydrate, person_id))
+        if base_person is None:
+            continue
+        vs_person = PEOPLE_STATS_CACHE.get((vs_hydrate, person_id)) if vs_hydrate else None
+        people_by_id[person_id] = _merge_person_stats(base_person, vs_person)
     return people_by_id
 
 
+def fetch_people_vs_pitcher_map(
+    person_ids: Sequence[int],
+    season: int,
+    pitcher_id: int,
+    stats_end_date: Optional[dt.date] = None,
+) -> Dict[int, Dict[str, Any]]:
+    if not person_ids:
+        return {}
+
+    requested_ids = list(dict.fromkeys(int(person_id) for person_id in person_ids))
+    hydrate = build_people_vs_pitcher_hydrate(season, int(pitcher_id), stats_end_date)
+    fetch_people_batch({hydrate: requested_ids}, ttl_by_hydrate={hydrate: _people_stats_ttl(stats_end_date)})
+    return {
+        person_id: PEOPLE_STATS_CACHE[(hydrate, person_id)]
+        for person_id in requested_ids
+        if (hydrate, person_id) in PEOPLE_STATS_CACHE
+    }
+
+
 def index_stat_blocks(person: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
     indexed: Dict[str, List[Dict[str, Any]]] = {}
     for block in person.get("stats") or []:
@@ -677,9 +1027,9 @@ def first_stat_split(blocks: Sequence[Dict[str, Any]]) -> Optional[Dict[str, Any
     return splits[0]
 
 
-def extract_game_logs(person: Dict[str, Any]) -> List[Dict[str, Any]]:
+def extract_game_logs(person: Dict[str, Any]) -> GameLog:
     indexed = index_stat_blocks(person)
-    logs: List[Dict[str, Any]] = []
+    logs: List[BatterGameLogRow] = []
     for block in indexed.get("gameLog", []):
         for split in block.get("splits") or []:
             game_date = parse_date(split.get("date"))
@@ -688,23 +1038,22 @@ def extract_game_logs(person: Dict[str, Any]) -> List[Dict[str, Any]]:
             stat = split.get("stat") or {}
             game_info = split.get("game") or {}
             logs.append(
-                {
-                    "date": game_date,
-                    "gamePk": to_int(game_info.get("gamePk")) or 0,
-                    "atBats": to_int(stat.get("atBats")) or 0,
-                    "hits": to_int(stat.get("hits")) or 0,
-                    "walks": to_int(stat.get("baseOnBalls")) or 0,
-                    "hitByPitch": to_int(stat.get("hitByPitch")) or 0,
-                    "sacFlies": to_int(stat.get("sacFlies")) or 0,
-                    "plateAppearances": to_int(stat.get("plateAppearances")) or 0,
-                    "totalBases": to_int(stat.get("totalBases")) or 0,
-                    "strikeOuts": to_int(stat.get("strikeOuts")) or 0,
-                    "homeRuns": to_int(stat.get("homeRuns")) or 0,
-                    "rbi": to_int(stat.get("rbi")) or 0,
-                }
+                BatterGameLogRow(
+                    date=game_date,
+                    game_pk=to_int(game_info.get("gamePk")) or 0,
+                    at_bats=to_int(stat.get("atBats")) or 0,
+                    hits=to_int(stat.get("hits")) or 0,
+                    walks=to_int(stat.get("baseOnBalls")) or 0,
+                    hit_by_pitch=to_int(stat.get("hitByPitch")) or 0,
+                    sac_flies=to_int(stat.get("sacFlies")) or 0,
+                    plate_appearances=to_int(stat.get("plateAppearances")) or 0,
+                    total_bases=to_int(stat.get("totalBases")) or 0,
+                    strike_outs=to_int(stat.get("strikeOuts")) or 0,
+                    home_runs=to_int(stat.get("homeRuns")) or 0,
+                    rbi=to_int(stat.get("rbi")) or 0,
+                )
             )
-    logs.sort(key=lambda row: (row["date"], row["gamePk"]), reverse=True)
-    return logs
+    return GameLog(logs)
 
 
 def compute_recent_metrics(
@@ -714,67 +1063,20 @@ def compute_recent_metrics(
     max_games: Optional[int] = None,
     window_days: Optional[int] = None,
 ) -> Dict[str, Any]:
-    start_date = report_date - dt.timedelta(days=window_days or 0) if window_days is not None else None
-    filtered = []
-    for row in game_logs:
-        row_date = row.get("date")
-        if not isinstance(row_date, dt.date) or row_date >= report_date:
-            continue
-        if start_date is not None and row_date < start_date:
-            continue
-        filtered.append(row)
-
-    filtered.sort(key=lambda row: (row["date"], row.get("gamePk", 0)), reverse=True)
-    if max_games is not None:
-        filtered = filtered[:max_games]
-
-    totals = {
-        "games": len(filtered),
-        "PA": 0,
-        "AB": 0,
-        "H": 0,
-        "BB": 0,
-        "HBP": 0,
-        "SF": 0,
-        "TB": 0,
-        "K": 0,
-        "HR": 0,
-        "RBI": 0,
-    }
-    for row in filtered:
-        totals["PA"] += int(row.get("plateAppearances") or 0)
-        totals["AB"] += int(row.get("atBats") or 0)
-        totals["H"] += int(row.get("hits") or 0)
-        totals["BB"] += int(row.get("walks") or 0)
-        totals["HBP"] += int(row.get("hitByPitch") or 0)
-        totals["SF"] += int(row.get("sacFlies") or 0)
-        totals["TB"] += int(row.get("totalBases") or 0)
-        totals["K"] += int(row.get("strikeOuts") or 0)
-        totals["HR"] += int(row.get("homeRuns") or 0)
-        totals["RBI"] += int(row.get("rbi") or 0)
+    counts, games = as_game_log(game_logs).window_counts(report_date, max_games=max_games, window_days=window_days)
+    return StatLineArray(counts, [games]).to_dicts()[0]
 
-    return aggregate_stat_lines([totals], preserve_games=len(filtered))
 
+def compute_recent_metrics_batch(
+    game_logs_by_player: Dict[int, Sequence[Dict[str, Any]]],
+    report_date: dt.date,
+    windows: Dict[str, Dict[str, Optional[int]]],
+) -> Dict[int, Dict[str, Dict[str, Any]]]:
+    return compute_window_metrics(game_logs_by_player, report_date, windows)
 
-def compute_hit_streak(game_logs: Sequence[Dict[str, Any]], report_date: dt.date) -> int:
-    filtered = [
-        row
-        for row in game_logs
-        if isinstance(row.get("date"), dt.date) and row["date"] < report_date
-    ]
-    filtered.sort(key=lambda row: (row["date"], row.get("gamePk", 0)), reverse=True)
 
-    streak = 0
-    for row in filtered:
-        at_bats = int(row.get("atBats") or 0)
-        hits = int(row.get("hits") or 0)
-        if at_bats <= 0:
-            continue
-        if hits >= 1:
-            streak += 1
-            continue
-        break
-    return streak
+def compute_hit_streak(game_logs: Sequence[Dict[str, Any]], report_date: dt.date) -> int:
+    return as_game_log(game_logs).hit_streak(report_date)
 
 
 def aggregate_stat_lines(
@@ -782,48 +1084,14 @@ def aggregate_stat_lines(
     *,
     preserve_games: Optional[int] = None,
 ) -> Dict[str, Any]:
-    totals = {
-        "games": preserve_games or 0,
-        "PA": 0,
-        "AB": 0,
-        "H": 0,
-        "BB": 0,
-        "HBP": 0,
-        "SF": 0,
-        "TB": 0,
-        "K": 0,
-        "HR": 0,
-        "RBI": 0,
-    }
-    for line in lines:
-        totals["games"] += int(line.get("games") or 0) if preserve_games is None else 0
-        totals["PA"] += int(line.get("PA") or 0)
-        totals["AB"] += int(line.get("AB") or 0)
-        totals["H"] += int(line.get("H") or 0)
-        totals["BB"] += int(line.get("BB") or 0)
-        totals["HBP"] += int(line.get("HBP") or 0)
-        totals["SF"] += int(line.get("SF") or 0)
-        totals["TB"] += int(line.get("TB") or 0)
-        totals["K"] += int(line.get("K") or 0)
-        totals["HR"] += int(line.get("HR") or 0)
-        totals["RBI"] += int(line.get("RBI") or 0)
-
-    obp_denom = totals["AB"] + totals["BB"] + totals["HBP"] + totals["SF"]
-    avg = safe_ratio(totals["H"], totals["AB"])
-    obp = safe_ratio(totals["H"] + totals["BB"] + totals["HBP"], obp_denom)
-    slg = safe_ratio(totals["TB"], totals["AB"])
-    ops = None if obp is None or slg is None else obp + slg
-    k_pct = safe_ratio(totals["K"] * 100.0, totals["PA"])
-    totals.update(
-        {
-            "AVG": avg,
-            "OBP": obp,
-            "SLG": slg,
-            "OPS": ops,
-            "K%": k_pct,
-        }
-    )
-    return totals
+    totals = StatLineArray.from_records(lines).total()
+    if preserve_games is not None:
+        totals.games[0] = preserve_games
+    return totals.to_dicts()[0]
+
+
+def aggregate_stat_lines_batch(groups: Sequence[Sequence[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    return aggregate_stat_line_groups(groups)
 
 
 def _stat_line_from_values(
@@ -869,32 +1137,9 @@ def _stat_line_from_split_stat(stat: Dict[str, Any]) -> Dict[str, int]:
 
 
 def _subtract_stat_line(base_line: Dict[str, Any], adjustment_line: Optional[Dict[str, Any]]) -> Dict[str, int]:
-    if not adjustment_line:
-        return _stat_line_from_values(
-            pa=to_int(base_line.get("PA")) or 0,
-            ab=to_int(base_line.get("AB")) or 0,
-            hits=to_int(base_line.get("H")) or 0,
-            walks=to_int(base_line.get("BB")) or 0,
-            hit_by_pitch=to_int(base_line.get("HBP")) or 0,
-            sac_flies=to_int(base_line.get("SF")) or 0,
-            total_bases=to_int(base_line.get("TB")) or 0,
-            strike_outs=to_int(base_line.get("K")) or 0,
-            home_runs=to_int(base_line.get("HR")) or 0,
-            rbi=to_int(base_line.get("RBI")) or 0,
-        )
-
-    return _stat_line_from_values(
-        pa=(to_int(base_line.get("PA")) or 0) - (to_int(adjustment_line.get("PA")) or 0),
-        ab=(to_int(base_line.get("AB")) or 0) - (to_int(adjustment_line.get("AB")) or 0),
-        hits=(to_int(base_line.get("H")) or 0) - (to_int(adjustment_line.get("H")) or 0),
-        walks=(to_int(base_line.get("BB")) or 0) - (to_int(adjustment_line.get("BB")) or 0),
-        hit_by_pitch=(to_int(base_line.get("HBP")) or 0) - (to_int(adjustment_line.get("HBP")) or 0),
-        sac_flies=(to_int(base_line.get("SF")) or 0) - (to_int(adjustment_line.get("SF")) or 0),
-        total_bases=(to_int(base_line.get("TB")) or 0) - (to_int(adjustment_line.get("TB")) or 0),
-        strike_outs=(to_int(base_line.get("K")) or 0) - (to_int(adjustment_line.get("K")) or 0),
-        home_runs=(to_int(base_line.get("HR")) or 0) - (to_int(adjustment_line.get("HR")) or 0),
-        rbi=(to_int(base_line.get("RBI")) or 0) - (to_int(adjustment_line.get("RBI")) or 0),
-    )
+    base = StatLineArray.from_records([base_line], games_field=None)
+    adjusted = base.subtract(StatLineArray.from_records([adjustment_line], games_field=None)) if adjustment_line else base.clipped()
+    return adjusted.to_dicts(include_games=False, include_rates=False)[0]
 
 
 def _nested_person_id(split: Dict[str, Any], key: str) -> Optional[int]:
@@ -922,15 +1167,34 @@ def _split_matches_batter_pitcher(
     return True
 
 
+def _apply_plate_appearance_event(line: Dict[str, Any], event_type: str, *, rbi: int = 0) -> None:
+    line["PA"] += 1
+    if event_type not in NON_AT_BAT_EVENTS:
+        line["AB"] += 1
+
+    bases = HIT_EVENT_BASES.get(event_type, 0)
+    if bases > 0:
+        line["H"] += 1
+        line["TB"] += bases
+        if event_type == "home_run":
+            line["HR"] += 1
+    if event_type in {"walk", "intent_walk"}:
+        line["BB"] += 1
+    if event_type == "hit_by_pitch":
+        line["HBP"] += 1
+    if event_type == "sac_fly":
+        line["SF"] += 1
+    if event_type in STRIKEOUT_EVENTS:
+        line["K"] += 1
+
+    line["RBI"] += rbi
+
+
 def extract_batter_vs_pitcher_stat_lines_from_plays(
     plays: Sequence[Dict[str, Any]],
     pitcher_id: int,
 ) -> Dict[int, Dict[str, Any]]:
     stat_lines: Dict[int, Dict[str, Any]] = {}
-    non_at_bat_events = {"walk", "intent_walk", "hit_by_pitch", "sac_fly", "sac_bunt", "catcher_interf"}
-    hit_event_bases = {"single": 1, "double": 2, "triple": 3, "home_run": 4}
-    strikeout_events = {"strikeout", "strikeout_double_play"}
-
     for play in plays:
         if str((play.get("result") or {}).get("type") or "").strip() != "atBat":
             continue
@@ -945,95 +1209,114 @@ def extract_batter_vs_pitcher_stat_lines_from_plays(
             continue
 
         line = stat_lines.setdefault(batter_id, _stat_line_from_values())
-        line["PA"] += 1
-        if event_type not in non_at_bat_events:
-            line["AB"] += 1
-
-        bases = hit_event_bases.get(event_type, 0)
-        if bases > 0:
-            line["H"] += 1
-            line["TB"] += bases
-            if event_type == "home_run":
-                line["HR"] += 1
-        if event_type in {"walk", "intent_walk"}:
-            line["BB"] += 1
-        if event_type == "hit_by_pitch":
-            line["HBP"] += 1
-        if event_type == "sac_fly":
-            line["SF"] += 1
-        if event_type in strikeout_events:
-            line["K"] += 1
-
-        line["RBI"] += to_int((play.get("result") or {}).get("rbi")) or 0
+        _apply_plate_appearance_event(line, event_type, rbi=to_int((play.get("result") or {}).get("rbi")) or 0)
 
     return stat_lines
 
 
-def fetch_game_batter_vs_pitcher_stat_lines(game_id: int, pitcher_id: int) -> Dict[int, Dict[str, Any]]:
+def _compact_at_bat_plays(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    plays: List[Dict[str, Any]] = []
+    for play in payload.get("allPlays") or []:
+        result = play.get("result") or {}
+        if str(result.get("type") or "").strip() != "atBat":
+            continue
+        matchup = play.get("matchup") or {}
+        plays.append(
+            {
+                "result": {
+                    "type": "atBat",
+                    "eventType": result.get("eventType"),
+                    "rbi": result.get("rbi"),
+                },
+                "matchup": {
+                    "batter": {"id": (matchup.get("batter") or {}).get("id")},
+                    "pitcher": {"id": (matchup.get("pitcher") or {}).get("id")},
+                },
+            }
+        )
+    return plays
+
+
+def fetch_game_at_bat_plays(game_id: int, *, completed: bool = False) -> List[Dict[str, Any]]:
+    game_id = int(game_id)
+    if not completed:
+        return _compact_at_bat_plays(live_plays(game_id))
+    return cached_fetch(
+        "game_playByPlay:atBats",
+        {"gamePk": game_id},
+        lambda: _compact_at_bat_plays(statsapi.get("game_playByPlay", {"gamePk": game_id})),
+        immutable=True,
+        should_store=bool,
+    )
+
+
+def fetch_game_batter_vs_pitcher_stat_lines(
+    game_id: int,
+    pitcher_id: int,
+    *,
+    completed: bool = False,
+) -> Dict[int, Dict[str, Any]]:
     cache_key = (int(game_id), int(pitcher_id))
     cached = GAME_BVP_LINE_CACHE.get(cache_key)
     if cached is not None:
         return cached
 
     try:
-        payload = statsapi.get("game_playByPlay", {"gamePk": int(game_id)})
+        plays = fetch_game_at_bat_plays(int(game_id), completed=completed)
     except Exception:
-        payload = {}
+        plays = []
 
-    stat_lines = extract_batter_vs_pitcher_stat_lines_from_plays(payload.get("allPlays") or [], int(pitcher_id))
+    stat_lines = extract_batter_vs_pitcher_stat_lines_from_plays(plays, int(pitcher_id))
     GAME_BVP_LINE_CACHE[cache_key] = stat_lines
     return stat_lines
 
 
 def fetch_pitcher_debut_year(pitcher_id: int, fallback_year: int) -> int:
-    pitcher_id = int(pitcher_id)
-    cached = PITCHER_DEBUT_YEAR_CACHE.get(pitcher_id)
-    if cached is not None:
-        return cached
-
-    debut_year = int(fallback_year)
     try:
-        payload = statsapi.get("people", {"personIds": pitcher_id}, force=True)
+        person = fetch_pitcher_person(int(pitcher_id), int(fallback_year))
     except Exception:
-        payload = {}
+        person = None
 
-    people = payload.get("people") or []
-    if people:
-        debut_date = parse_date(people[0].get("mlbDebutDate"))
-        if debut_date is not None:
-            debut_year = min(debut_date.year, int(fallback_year))
+    debut_date = parse_date((person or {}).get("mlbDebutDate"))
+    if debut_date is None:
+        return int(fallback_year)
+    return min(debut_date.year, int(fallback_year))
 
-    PITCHER_DEBUT_YEAR_CACHE[pitcher_id] = debut_year
-    return debut_year
 
+def _fetch_season_game_log_payload(person_id: int, group: str, season: int) -> Dict[str, Any]:
+    params = {
+        "personIds": int(person_id),
+        "hydrate": f"stats(group=[{group}],type=[gameLog],season={int(season)})",
+    }
+    return cached_fetch(
+        "people",
+        params,
+        lambda: statsapi.get("people", params, force=True),
+        ttl_seconds=CURRENT_SEASON_GAME_LOG_TTL_SECONDS,
+        immutable=int(season) < dt.date.today().year,
+        should_store=lambda payload: bool(payload.get("people")),
+    )
 
-def fetch_pitcher_game_log_splits(pitcher_id: int, season: int) -> List[Dict[str, Any]]:
-    cache_key = (int(pitcher_id), int(season))
-    cached = PITCHER_GAME_LOG_CACHE.get(cache_key)
-    if cached is not None:
-        return cached
 
-    try:
-        payload = statsapi.get(
-            "people",
-            {
-                "personIds": int(pitcher_id),
-                "hydrate": f"stats(group=[pitching],type=[gameLog],season={int(season)})",
-            },
-            force=True,
-        )
-    except Exception:
-        payload = {}
+def pitcher_person_season_stat(person: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    split = first_stat_split(index_stat_blocks(person or {}).get("season", []))
+    return (split or {}).get("stat") or {}
 
-    people = payload.get("people") or []
-    splits: List[Dict[str, Any]] = []
-    for block in (people[0].get("stats") if people else []) or []:
-        if str((block.get("type") or {}).get("displayName") or "").strip() != "gameLog":
-            continue
-        splits.extend(block.get("splits") or [])
 
-    PITCHER_GAME_LOG_CACHE[cache_key] = splits
-    return splits
+def pitcher_person_game_log_splits(person: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        split
+        for block in index_stat_blocks(person or {}).get("gameLog", [])
+        for split in block.get("splits") or []
+    ]
+
+
+def fetch_pitcher_game_log_splits(pitcher_id: int, season: int) -> List[Dict[str, Any]]:
+    try:
+        person = fetch_pitcher_person(int(pitcher_id), int(season))
+    except Exception:
+        person = None
+    return pitcher_person_game_log_splits(person)
 
 
 def innings_string_to_outs(value: Any) -> int:
@@ -1067,6 +1350,28 @@ def _pitcher_batters_faced(stat: Dict[str, Any]) -> int:
     return at_bats + walks + hit_batsmen + sac_flies
 
 
+def build_pitcher_game_log_row(split: Dict[str, Any], report_date: dt.date) -> Optional[PitcherGameLogRow]:
+    game_date = parse_date(split.get("date"))
+    if game_date is None or game_date >= report_date:
+        return None
+    stat = split.get("stat") or {}
+    outs = to_int(stat.get("outs"))
+    if outs is None:
+        outs = innings_string_to_outs(stat.get("inningsPitched"))
+    return PitcherGameLogRow(
+        date=game_date,
+        game_pk=to_int((split.get("game") or {}).get("gamePk")) or 0,
+        games_started=to_int(stat.get("gamesStarted")) or 0,
+        outs=outs or 0,
+        earned_runs=to_int(stat.get("earnedRuns")) or 0,
+        hits=to_int(stat.get("hits")) or 0,
+        walks=to_int(stat.get("baseOnBalls")) or 0,
+        strike_outs=to_int(stat.get("strikeOuts")) or 0,
+        at_bats=to_int(stat.get("atBats")) or 0,
+        batters_faced=_pitcher_batters_faced(stat),
+    )
+
+
 def build_pitcher_form_from_game_logs(
     game_log_splits: Sequence[Dict[str, Any]],
     report_date: dt.date,
@@ -1074,35 +1379,14 @@ def build_pitcher_form_from_game_logs(
     starts_only: bool = False,
     limit: Optional[int] = None,
 ) -> Dict[str, Any]:
-    rows: List[Dict[str, Any]] = []
+    rows: List[PitcherGameLogRow] = []
     for split in game_log_splits:
-        game_date = parse_date(split.get("date"))
-        if game_date is None or game_date >= report_date:
+        row = build_pitcher_game_log_row(split, report_date)
+        if row is None or (starts_only and row.games_started != 1):
             continue
-        stat = split.get("stat") or {}
-        games_started = to_int(stat.get("gamesStarted")) or 0
-        if starts_only and games_started != 1:
-            continue
-        game_info = split.get("game") or {}
-        outs = to_int(stat.get("outs"))
-        if outs is None:
-            outs = innings_string_to_outs(stat.get("inningsPitched"))
-        rows.append(
-            {
-                "date": game_date,
-                "gamePk": to_int(game_info.get("gamePk")) or 0,
-                "gamesStarted": games_started,
-                "outs": outs or 0,
-                "earnedRuns": to_int(stat.get("earnedRuns")) or 0,
-                "hits": to_int(stat.get("hits")) or 0,
-                "walks": to_int(stat.get("baseOnBalls")) or 0,
-                "strikeOuts": to_int(stat.get("strikeOuts")) or 0,
-                "atBats": to_int(stat.get("atBats")) or 0,
-                "battersFaced": _pitcher_batters_faced(stat),
-            }
-        )
+        rows.append(row)
 
-    rows.sort(key=lambda row: (row["date"], row["gamePk"]), reverse=True)
+    rows.sort(key=lambda row: (row.date, row.game_pk), reverse=True)
     if limit is not None:
         rows = rows[:limit]
 
@@ -1120,15 +1404,15 @@ def build_pitcher_form_from_game_logs(
             "AVG": None,
         }
 
-    total_outs = sum(row["outs"] for row in rows)
-    total_er = sum(row["earnedRuns"] for row in rows)
-    total_hits = sum(row["hits"] for row in rows)
-    total_walks = sum(row["walks"] for row in rows)
-    total_strikeouts = sum(row["strikeOuts"] for row in rows)
-    total_at_bats = sum(row["atBats"] for row in rows)
-    total_batters_faced = sum(row["battersFaced"] for row in rows)
+    total_outs = sum(row.outs for row in rows)
+    total_er = sum(row.earned_runs for row in rows)
+    total_hits = sum(row.hits for row in rows)
+    total_walks = sum(row.walks for row in rows)
+    total_strikeouts = sum(row.strike_outs for row in rows)
+    total_at_bats = sum(row.at_bats for row in rows)
+    total_batters_faced = sum(row.batters_faced for row in rows)
     games_count = len(rows)
-    starts_count = sum(1 for row in rows if row["gamesStarted"] == 1)
+    starts_count = sum(1 for row in rows if row.games_started == 1)
     innings_pitched = total_outs / 3.0 if total_outs > 0 else 0.0
 
     return {
@@ -1145,25 +1429,6 @@ def build_pitcher_form_from_game_logs(
     }
 
 
-def build_pitcher_profile_stats(
-    pitcher_id: int,
-    season: int,
-    report_date: dt.date,
-    *,
-    recent_starts: int = 5,
-) -> Dict[str, Any]:
-    splits = fetch_pitcher_game_log_splits(int(pitcher_id), int(season))
-    return {
-        "season": build_pitcher_form_from_game_logs(splits, report_date),
-        "recent": build_pitcher_form_from_game_logs(
-            splits,
-            report_date,
-            starts_only=True,
-            limit=recent_starts,
-        ),
-    }
-
-
 def fetch_batter_game_log_splits(batter_id: int, season: int) -> List[Dict[str, Any]]:
     cache_key = (int(batter_id), int(season))
     cached = BATTER_GAME_LOG_CACHE.get(cache_key)
@@ -1171,14 +1436,7 @@ def fetch_batter_game_log_splits(batter_id: int, season: int) -> List[Dict[str,
         return cached
 
     try:
-        payload = statsapi.get(
-            "people",
-            {
-                "personIds": int(batter_id),
-                "hydrate": f"stats(group=[hitting],type=[gameLog],season={int(season)})",
-            },
-            force=True,
-        )
+        payload = _fetch_season_game_log_payload(int(batter_id), "hitting", int(season))
     except Exception:
         payload = {}
 
@@ -1193,6 +1451,52 @@ def fetch_batter_game_log_splits(batter_id: int, season: int) -> List[Dict[str,
     return splits
 
 
+def ingest_completed_games_into_plate_appearance_store(
+    store: PlateAppearanceStore,
+    game_ids: Sequence[int],
+    game_dates_by_id: Dict[int, dt.date],
+) -> int:
+    missing_game_ids = store.missing_game_ids(game_ids)
+    if not missing_game_ids:
+        return 0
+
+    fetched_games = []
+    empty_game_ids = []
+    with ThreadPoolExecutor(max_workers=min(8, len(missing_game_ids))) as executor:
+        future_to_game_id = {
+            executor.submit(fetch_game_at_bat_plays, game_id, completed=True): game_id
+            for game_id in missing_game_ids
+        }
+        for future in as_completed(future_to_game_id):
+            game_id = future_to_game_id[future]
+            try:
+                plays = future.result()
+            except Exception:
+                continue
+            if not plays:
+                empty_game_ids.append(game_id)
+                continue
+            fetched_games.append((game_id, game_dates_by_id[game_id], extract_plate_appearance_records(plays)))
+
+    store.ingest_games(fetched_games)
+    store.record_empty_games(empty_game_ids)
+    return len(fetched_games)
+
+
+def _historical_bvp_from_plate_appearance_store(
+    store: PlateAppearanceStore,
+    pitcher_id: int,
+    report_date: dt.date,
+    game_ids: Sequence[int],
+    game_dates_by_id: Dict[int, dt.date],
+    target_batter_ids: Iterable[int],
+) -> Dict[int, Dict[str, Any]]:
+    ingest_completed_games_into_plate_appearance_store(store, game_ids, game_dates_by_id)
+
+    totals = store.index().stat_totals(pitcher_id, report_date, target_batter_ids or None)
+    return {batter_id: aggregate_stat_lines([line]) for batter_id, line in totals.items()}
+
+
 def fetch_pitcher_historical_batter_vs_pitcher_stat_lines(
     pitcher_id: int,
     report_date: dt.date,
@@ -1239,13 +1543,32 @@ def fetch_pitcher_historical_batter_vs_pitcher_stat_lines(
                         overlapping_game_ids.add(int(game_id))
         game_ids = [game_id for game_id in game_ids if game_id in overlapping_game_ids]
 
+    store = get_plate_appearance_store()
+    if store is not None:
+        stat_lines = _historical_bvp_from_plate_appearance_store(
+            store,
+            int(pitcher_id),
+            report_date,
+            game_ids,
+            game_dates_by_id,
+            target_batter_ids,
+        )
+        if not target_batter_ids:
+            PITCHER_HISTORICAL_BVP_CACHE[cache_key] = stat_lines
+        return stat_lines
+
     lines_by_batter: Dict[int, List[Dict[str, Any]]] = {}
     game_line_maps: List[Dict[int, Dict[str, Any]]] = []
     if game_ids:
         max_workers = min(8, len(game_ids))
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_game_id = {
-                executor.submit(fetch_game_batter_vs_pitcher_stat_lines, game_id, int(pitcher_id)): game_id
+                executor.submit(
+                    fetch_game_batter_vs_pitcher_stat_lines,
+                    game_id,
+                    int(pitcher_id),
+                    completed=True,
+                ): game_id
                 for game_id in game_ids
             }
             for future in as_completed(future_to_game_id):
@@ -1289,22 +1612,110 @@ def extract_game_batter_stat_lines_from_boxscore(boxscore_data: Dict[str, Any])
     return stat_lines
 
 
-def fetch_game_batter_stat_lines(game_id: int) -> Dict[int, Dict[str, Any]]:
+def fetch_game_batter_stat_lines(game_id: int, *, completed: bool = False) -> Dict[int, Dict[str, Any]]:
     game_id = int(game_id)
     cached = GAME_BATTER_LINE_CACHE.get(game_id)
     if cached is not None:
         return cached
 
+    if not completed:
+        try:
+            return extract_game_batter_stat_lines_from_boxscore(live_boxscore_teams(game_id))
+        except Exception:
+            return {}
+
     try:
-        boxscore_data = statsapi.boxscore_data(game_id)
+        cached_lines = cached_fetch(
+            "game_boxscore:batterLines",
+            {"gamePk": game_id},
+            lambda: {
+                str(player_id): line
+                for player_id, line in extract_game_batter_stat_lines_from_boxscore(
+                    statsapi.boxscore_data(game_id)
+                ).items()
+            },
+            immutable=True,
+            should_store=bool,
+        )
     except Exception:
-        boxscore_data = {}
+        cached_lines = {}
 
-    stat_lines = extract_game_batter_stat_lines_from_boxscore(boxscore_data)
+    stat_lines = {int(player_id): line for player_id, line in cached_lines.items()}
     GAME_BATTER_LINE_CACHE[game_id] = stat_lines
     return stat_lines
 
 
+def extract_pitcher_strikeouts_from_boxscore(boxscore: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    strikeouts: Dict[int, Dict[str, Any]] = {}
+    teams = boxscore.get("teams") or {}
+    for side in ("away", "home"):
+        for player in ((teams.get(side) or {}).get("players") or {}).values():
+            pitching = (player.get("stats") or {}).get("pitching") or {}
+            person = player.get("person") or {}
+            player_id = to_int(person.get("id"))
+            if player_id is None or not pitching:
+                continue
+            strikeouts[int(player_id)] = {
+                "name": str(person.get("fullName") or "").strip(),
+                "strikeOuts": to_int(pitching.get("strikeOuts")) or 0,
+            }
+    return strikeouts
+
+
+def fetch_game_pitcher_strikeouts(game_id: int, *, completed: bool = False) -> Dict[int, Dict[str, Any]]:
+    game_id = int(game_id)
+    cached = GAME_PITCHER_STRIKEOUT_CACHE.get(game_id)
+    if cached is not None:
+        return cached
+
+    if not completed:
+        try:
+            return extract_pitcher_strikeouts_from_boxscore({"teams": live_boxscore_teams(game_id)})
+        except Exception:
+            return {}
+
+    try:
+        cached_strikeouts = cached_fetch(
+            "game_boxscore:pitcherStrikeouts",
+            {"gamePk": game_id},
+            lambda: {
+                str(player_id): line
+                for player_id, line in extract_pitcher_strikeouts_from_boxscore(
+                    statsapi.get("game_boxscore", {"gamePk": game_id})
+                ).items()
+            },
+            immutable=True,
+            should_store=bool,
+        )
+    except Exception:
+        return {}
+
+    strikeouts = {int(player_id): line for player_id, line in cached_strikeouts.items()}
+    GAME_PITCHER_STRIKEOUT_CACHE[game_id] = strikeouts
+    return strikeouts
+
+
+def build_slate_pitcher_strikeouts(schedule: Sequence[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    started_games = [
+        (int(game_id), str(game.get("status") or "").strip() == "Final")
+        for game in schedule
+        for game_id in [to_int(game.get("game_id"))]
+        if game_id is not None and str(game.get("status") or "").strip() not in NOT_STARTED_STATUSES
+    ]
+    strikeouts: Dict[int, Dict[str, Any]] = {}
+    if not started_games:
+        return strikeouts
+
+    with ThreadPoolExecutor(max_workers=min(8, len(started_games))) as executor:
+        futures = [
+            executor.submit(fetch_game_pitcher_strikeouts, game_id, completed=completed)
+            for game_id, completed in started_games
+        ]
+        for future in futures:
+            strikeouts.update(future.result())
+    return strikeouts
+
+
 def parse_vs_pitcher_stats(
     indexed_blocks: Dict[str, List[Dict[str, Any]]],
     *,
@@ -1379,22 +1790,7 @@ def extract_season_hitting_stats(person: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def parse_team_split_stats(stat: Dict[str, Any]) -> Dict[str, Any]:
-    return aggregate_stat_lines(
-        [
-            {
-                "PA": to_int(stat.get("plateAppearances")) or 0,
-                "AB": to_int(stat.get("atBats")) or 0,
-                "H": to_int(stat.get("hits")) or 0,
-                "BB": to_int(stat.get("baseOnBalls")) or 0,
-                "HBP": to_int(stat.get("hitByPitch")) or 0,
-                "SF": to_int(stat.get("sacFlies")) or 0,
-                "TB": to_int(stat.get("totalBases")) or 0,
-                "K": to_int(stat.get("strikeOuts")) or 0,
-                "HR": to_int(stat.get("homeRuns")) or 0,
-                "RBI": to_int(stat.get("rbi")) or 0,
-            }
-        ]
-    )
+    return StatLineArray.from_records([stat], SPLIT_STAT_FIELDS, games_field=None).to_dicts()[0]
 
 
 def build_metric_rank_index(
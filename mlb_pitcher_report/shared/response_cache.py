@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+RESPONSE_CACHE_PATH = Path("report_state") / "response-cache.sqlite3"
+RESPONSE_CACHE_PATH_ENV = "MLB_REPORT_RESPONSE_CACHE_PATH"
+RESPONSE_CACHE_DISABLE_ENV = "MLB_REPORT_DISABLE_RESPONSE_CACHE"
+
+MINUTE_SECONDS = 60
+HOUR_SECONDS = 60 * MINUTE_SECONDS
+DAY_SECONDS = 24 * HOUR_SECONDS
+
+_MISSING = object()
+TRUTHY_ENV_VALUES = {"1", "true", "yes", "on"}
+
+StoreT = TypeVar("StoreT")
+
+
+def env_flag_enabled(name: str) -> bool:
+    return str(os.environ.get(name) or "").strip().lower() in TRUTHY_ENV_VALUES
+
+
+class PersistentStoreSingleton(Generic[StoreT]):
+    def __init__(
+        self,
+        label: str,
+        open_store: Callable[[str], StoreT],
+        *,
+        default_path: Path,
+        path_env: str,
+        disable_env: str,
+    ) -> None:
+        self.label = label
+        self.default_path = default_path
+        self.path_env = path_env
+        self.disable_env = disable_env
+        self._open_store = open_store
+        self._lock = threading.Lock()
+        self._store: Optional[StoreT] = None
+        self._open_failed = False
+
+    def enabled(self) -> bool:
+        return not self._open_failed and not env_flag_enabled(self.disable_env)
+
+    def get(self) -> Optional[StoreT]:
+        if not self.enabled():
+            return None
+        with self._lock:
+            if self._store is None and not self._open_failed:
+                path = os.environ.get(self.path_env) or str(self.default_path)
+                try:
+                    self._store = self._open_store(path)
+                except sqlite3.Error as exc:
+                    print(f"\033[93m{self.label} unavailable at {path}: {exc}\033[0m")
+                    self._open_failed = True
+            return self._store
+
+    def reset(self) -> None:
+        with self._lock:
+            self._store = None
+            self._open_failed = False
+
+
+def build_cache_key(namespace: str, params: Optional[Dict[str, Any]] = None) -> str:
+    canonical = json.dumps(params or {}, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha256(f"{namespace}|{canonical}".encode("utf-8")).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+class ResponseCache:
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "namespace TEXT NOT NULL, "
+                "payload BLOB NOT NULL, "
+                "stored_at REAL NOT NULL, "
+                "expires_at REAL"
+                ")"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get(self, namespace: str, params: Optional[Dict[str, Any]] = None, *, now: Optional[float] = None) -> Any:
+        key = build_cache_key(namespace, params)
+        current_time = time.time() if now is None else now
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT payload, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return _MISSING
+        payload, expires_at = row
+        if expires_at is not None and expires_at <= current_time:
+            return _MISSING
+        try:
+            return json.loads(zlib.decompress(payload).decode("utf-8"))
+        except (zlib.error, ValueError):
+            return _MISSING
+
+    def put(
+        self,
+        namespace: str,
+        params: Optional[Dict[str, Any]],
+        value: Any,
+        *,
+        ttl_seconds: Optional[float],
+        now: Optional[float] = None,
+    ) -> None:
+        key = build_cache_key(namespace, params)
+        current_time = time.time() if now is None else now
+        expires_at = None if ttl_seconds is None else current_time + float(ttl_seconds)
+        payload = zlib.compress(json.dumps(value, separators=(",", ":"), default=str).encode("utf-8"))
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, namespace, payload, stored_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (key, namespace, sqlite3.Binary(payload), current_time, expires_at),
+            )
+            connection.commit()
+
+    def purge_expired(self, *, now: Optional[float] = None) -> int:
+        current_time = time.time() if now is None else now
+        with self._lock:
+            connection = self._connect()
+            cursor = connection.execute(
+                "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (current_time,),
+            )
+            connection.commit()
+        return int(cursor.rowcount or 0)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def _open_response_cache(path: str) -> ResponseCache:
+    cache = ResponseCache(path)
+    cache.purge_expired()
+    return cache
+
+
+_DEFAULT_CACHE = PersistentStoreSingleton(
+    "Response cache",
+    _open_response_cache,
+    default_path=RESPONSE_CACHE_PATH,
+    path_env=RESPONSE_CACHE_PATH_ENV,
+    disable_env=RESPONSE_CACHE_DISABLE_ENV,
+)
+
+
+def response_cache_enabled() -> bool:
+    return _DEFAULT_CACHE.enabled()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    return _DEFAULT_CACHE.get()
+
+
+def cached_fetch(
+    namespace: str,
+    params: Optional[Dict[str, Any]],
+    fetcher: Callable[[], Any],
+    *,
+    ttl_seconds: Optional[float] = None,
+    immutable: bool = False,
+    should_store: Optional[Callable[[Any], bool]] = None,
+    immutable_when: Optional[Callable[[Any], bool]] = None,
+) -> Any:
+    if ttl_seconds is None and not immutable:
+        return fetcher()
+
+    cache = get_response_cache()
+    if cache is not None:
+        try:
+            cached = cache.get(namespace, params)
+        except sqlite3.Error:
+            cached = _MISSING
+        if cached is not _MISSING:
+            return cached
+
+    value = fetcher()
+    if cache is None or (should_store is not None and not should_store(value)):
+        return value
+
+    if immutable_when is not None and immutable_when(value):
+        immutable = True
+    try:
+        cache.put(namespace, params, value, ttl_seconds=None if immutable else ttl_seconds)
+    except (sqlite3.Error, TypeError, ValueError):
+        pass
+    return value
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from mlb_pitcher_report.shared import report_data
+
+PREFETCH_CONCURRENCY = 16
+
+PeopleStatsRequest = Tuple[List[int], int, Optional[str], Optional[int], Optional[dt.date]]
+
+
+class SlatePrefetcher:
+    def __init__(self, concurrency: int = PREFETCH_CONCURRENCY) -> None:
+        self.concurrency = max(int(concurrency), 1)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self.failures: List[Hashable] = []
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def call(self, key: Hashable, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run(key, func, *args, **kwargs))
+            self._tasks[key] = task
+        return await task
+
+    async def _run(self, key: Hashable, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        assert self._semaphore is not None
+        async with self._semaphore:
+            try:
+                return await asyncio.to_thread(func, *args, **kwargs)
+            except Exception:
+                self.failures.append(key)
+                return None
+
+    async def run(self, coroutines: Sequence[Awaitable[Any]]) -> None:
+        await asyncio.gather(*coroutines)
+
+    async def prefetch(
+        self,
+        schedule: Sequence[Dict[str, Any]],
+        report_date: str,
+        *,
+        people_stats_end_dates: Sequence[Optional[dt.date]] = (),
+        include_last_game_lineups: bool = False,
+        include_team_context: bool = False,
+    ) -> None:
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        report_date_obj = dt.datetime.strptime(report_date, "%m/%d/%Y").date()
+        season = report_date_obj.year
+
+        coroutines: List[Awaitable[Any]] = [self._prefetch_espn_summaries(schedule, report_date)]
+        offense_coroutines: List[Awaitable[List[PeopleStatsRequest]]] = []
+        for game in schedule:
+            away_team_id = report_data.to_int(game.get("away_id"))
+            home_team_id = report_data.to_int(game.get("home_id"))
+            if away_team_id is None or home_team_id is None:
+                continue
+            offenses = [
+                (away_team_id, str(game.get("home_probable_pitcher") or "").strip()),
+                (home_team_id, str(game.get("away_probable_pitcher") or "").strip()),
+            ]
+            for team_id, pitcher_name in offenses:
+                coroutines.append(self.call(("team_meta", team_id), report_data.fetch_team_meta, team_id))
+                offense_coroutines.append(
+                    self._prefetch_offense(
+                        team_id,
+                        pitcher_name,
+                        season,
+                        people_stats_end_dates=people_stats_end_dates,
+                        include_last_game_lineup=include_last_game_lineups,
+                    )
+                )
+            if include_team_context:
+                venue_id = report_data.to_int(game.get("venue_id"))
+                if venue_id is not None:
+                    coroutines.append(
+                        self.call(
+                            ("park", venue_id),
+                            report_data.fetch_park_context,
+                            venue_id,
+                            game.get("game_datetime"),
+                            report_date,
+                        )
+                    )
+
+        if include_team_context:
+            coroutines.append(self._prefetch_team_context(season))
+        coroutines.append(self._prefetch_people_stats(offense_coroutines))
+        await self.run(coroutines)
+
+    async def _prefetch_people_stats(self, offense_coroutines: Sequence[Awaitable[List[PeopleStatsRequest]]]) -> None:
+        people_requests = [
+            people_request
+            for offense_requests in await asyncio.gather(*offense_coroutines)
+            for people_request in offense_requests
+        ]
+        if people_requests:
+            await self.call(("people_stats_batch",), report_data.fetch_people_stats_batch, people_requests)
+
+    async def _prefetch_espn_summaries(self, schedule: Sequence[Dict[str, Any]], report_date: str) -> None:
+        snapshots = await self.call(("espn_scoreboard", report_date), report_data.build_espn_event_snapshot_lookup, report_date)
+        if not snapshots:
+            return
+        summary_calls = []
+        for game in schedule:
+            key = (
+                report_data.normalize_team_name(game.get("away_name")),
+                report_data.normalize_team_name(game.get("home_name")),
+            )
+            event_id = str((snapshots.get(key) or {}).get("event_id") or "").strip()
+            if event_id:
+                summary_calls.append(self.call(("espn_summary", event_id), report_data.fetch_espn_summary, event_id))
+        await self.run(summary_calls)
+
+    async def _prefetch_offense(
+        self,
+        team_id: int,
+        pitcher_name: str,
+        season: int,
+        *,
+        people_stats_end_dates: Sequence[Optional[dt.date]],
+        include_last_game_lineup: bool,
+    ) -> List[PeopleStatsRequest]:
+        roster_task = self.call(("team_roster", team_id), report_data.fetch_team_roster, team_id)
+        pitcher_task = (
+            self.call(("pitcher_context", pitcher_name, season), report_data.fetch_pitcher_context, pitcher_name, season)
+            if pitcher_name
+            else _resolved(None)
+        )
+        lineup_task = (
+            self.call(("last_game_lineup", team_id), report_data.fetch_last_game_lineup_player_ids, team_id)
+            if include_last_game_lineup
+            else _resolved([])
+        )
+        roster, pitcher_context, last_game_lineup_ids = await asyncio.gather(roster_task, pitcher_task, lineup_task)
+        if not people_stats_end_dates or not roster:
+            return []
+
+        person_ids = [
+            int((entry.get("person") or {}).get("id"))
+            for entry in report_data.filter_active_hitters(roster)
+            if (entry.get("person") or {}).get("id") is not None
+        ]
+        person_ids = list(dict.fromkeys(person_ids + list(last_game_lineup_ids or [])))
+        pitch_hand = (pitcher_context or {}).get("hand")
+        pitcher_id = (pitcher_context or {}).get("id")
+        return [
+            (person_ids, season, pitch_hand, pitcher_id, stats_end_date)
+            for stats_end_date in people_stats_end_dates
+        ]
+
+    async def _prefetch_team_context(self, season: int) -> None:
+        team_ids = await self.call(("mlb_team_ids", season), report_data.fetch_mlb_team_ids, season)
+        await self.run(
+            [
+                self.call(("team_hand_splits", team_id, season), report_data.fetch_team_handedness_splits, team_id, season)
+                for team_id in team_ids or []
+            ]
+            + [self.call(("pitcher_season_ranks", season), report_data.fetch_pitcher_season_rank_map, season)]
+        )
+
+
+async def _resolved(value: Any) -> Any:
+    return value
+
+
+def prefetch_slate(
+    schedule: Sequence[Dict[str, Any]],
+    report_date: str,
+    *,
+    concurrency: int = PREFETCH_CONCURRENCY,
+    people_stats_end_dates: Sequence[Optional[dt.date]] = (),
+    include_last_game_lineups: bool = False,
+    include_team_context: bool = False,
+) -> SlatePrefetcher:
+    prefetcher = SlatePrefetcher(concurrency)
+    if not schedule:
+        return prefetcher
+
+    started = time.perf_counter()
+    asyncio.run(
+        prefetcher.prefetch(
+            schedule,
+            report_date,
+            people_stats_end_dates=people_stats_end_dates,
+            include_last_game_lineups=include_last_game_lineups,
+            include_team_context=include_team_context,
+        )
+    )
+    elapsed = time.perf_counter() - started
+    message = f"Prefetched {len(prefetcher)} slate dependencies in {elapsed:.1f}s"
+    if prefetcher.failures:
+        print(f"\033[93m{message} ({len(prefetcher.failures)} failed; they will be retried serially).\033[0m")
+    else:
+        print(message)
+    return prefetcher
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import contextlib
+import gzip
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from mlb_pitcher_report.odds.key_pool import ODDS_KEY_POOL_DISABLE_ENV
+from mlb_pitcher_report.odds.odds_history import ODDS_HISTORY_DISABLE_ENV
+from mlb_pitcher_report.shared import http_client
+from mlb_pitcher_report.shared.live_games import LIVE_GAME_STATE_DISABLE_ENV
+from mlb_pitcher_report.shared.plate_appearances import PLATE_APPEARANCE_STORE_DISABLE_ENV
+from mlb_pitcher_report.shared.player_directory import PLAYER_DIRECTORY_DISABLE_ENV
+from mlb_pitcher_report.shared.response_cache import RESPONSE_CACHE_DISABLE_ENV
+
+SNAPSHOT_DIR = Path("report_state") / "snapshots"
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_RECORD_FLAG = "--snapshot"
+SNAPSHOT_REPLAY_FLAG = "--from-snapshot"
+SNAPSHOT_MODE_RECORD = "record"
+SNAPSHOT_MODE_REPLAY = "replay"
+REDACTED_QUERY_PARAMS = {"apikey", "api_key", "token"}
+
+
+def default_snapshot_path(report_date: str) -> Path:
+    return SNAPSHOT_DIR / f"slate-{report_date.replace('/', '')}.json.gz"
+
+
+def build_request_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    prepared_url = requests.Request("GET", url, params=params or {}).prepare().url or url
+    parts = urlsplit(prepared_url)
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in REDACTED_QUERY_PARAMS
+    )
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+def _build_response(key: str, entry: Dict[str, Any]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = int(entry.get("status") or 200)
+    response.headers = CaseInsensitiveDict(entry.get("headers") or {})
+    response.encoding = "utf-8"
+    response._content = str(entry.get("body") or "").encode("utf-8")
+    response.url = key
+    return response
+
+
+class SlateSnapshot:
+    def __init__(
+        self,
+        entries: Optional[Dict[str, Dict[str, Any]]] = None,
+        *,
+        report_date: str = "",
+        recorded_at: Optional[float] = None,
+    ) -> None:
+        self.entries: Dict[str, Dict[str, Any]] = dict(entries or {})
+        self.report_date = report_date
+        self.recorded_at = recorded_at
+        self.misses: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def record(self, url: str, params: Optional[Dict[str, Any]], response: requests.Response) -> None:
+        entry = {
+            "status": int(response.status_code),
+            "headers": {name: value for name, value in response.headers.items() if name.lower().startswith("x-")},
+            "body": response.text,
+        }
+        with self._lock:
+            self.entries[build_request_key(url, params)] = entry
+
+    def lookup(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[requests.Response]:
+        key = build_request_key(url, params)
+        entry = self.entries.get(key)
+        if entry is None:
+            with self._lock:
+                self.misses.append(key)
+            return None
+        return _build_response(key, entry)
+
+    def recording_interceptor(self) -> http_client.RequestInterceptor:
+        def intercept(
+            send: Callable[..., requests.Response],
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+        ) -> requests.Response:
+            response = send(url, params, **kwargs)
+            self.record(url, params, response)
+            return response
+
+        return intercept
+
+    def replay_interceptor(self) -> http_client.RequestInterceptor:
+        def intercept(
+            send: Callable[..., requests.Response],
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            **kwargs: Any,
+        ) -> requests.Response:
+            response = self.lookup(url, params)
+            if response is None:
+                raise requests.ConnectionError(f"Request not found in slate snapshot: {build_request_key(url, params)}")
+            return response
+
+        return intercept
+
+    def save(self, path: Path | str) -> Path:
+        output_path = Path(path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "report_date": self.report_date,
+            "recorded_at": self.recorded_at if self.recorded_at is not None else time.time(),
+            "entries": self.entries,
+        }
+        temp_path = output_path.with_name(f"{output_path.name}.tmp")
+        with gzip.open(temp_path, "wt", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"), sort_keys=True)
+        temp_path.replace(output_path)
+        return output_path
+
+    @classmethod
+    def load(cls, path: Path | str) -> SlateSnapshot:
+        with gzip.open(Path(path), "rt", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if int(payload.get("version") or 0) != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported slate snapshot version in {path}: {payload.get('version')}")
+        return cls(
+            payload.get("entries") or {},
+            report_date=str(payload.get("report_date") or ""),
+            recorded_at=payload.get("recorded_at"),
+        )
+
+
+def split_snapshot_flags(raw_flags: Sequence[str]) -> Tuple[List[str], Optional[str], Optional[str]]:
+    remaining: List[str] = []
+    mode: Optional[str] = None
+    path: Optional[str] = None
+    for flag in raw_flags:
+        name, _, value = str(flag).partition("=")
+        if name == SNAPSHOT_RECORD_FLAG:
+            mode = SNAPSHOT_MODE_RECORD
+        elif name == SNAPSHOT_REPLAY_FLAG:
+            mode = SNAPSHOT_MODE_REPLAY
+        else:
+            remaining.append(str(flag))
+            continue
+        path = value or None
+    return remaining, mode, path
+
+
+@contextlib.contextmanager
+def _persistent_stores_disabled() -> Iterator[None]:
+    env_names = (
+        RESPONSE_CACHE_DISABLE_ENV,
+        PLATE_APPEARANCE_STORE_DISABLE_ENV,
+        LIVE_GAME_STATE_DISABLE_ENV,
+        PLAYER_DIRECTORY_DISABLE_ENV,
+        ODDS_KEY_POOL_DISABLE_ENV,
+        ODDS_HISTORY_DISABLE_ENV,
+    )
+    previous = {name: os.environ.get(name) for name in env_names}
+    for name in env_names:
+        os.environ[name] = "1"
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+@contextlib.contextmanager
+def use_slate_snapshot(
+    report_date: str,
+    mode: Optional[str],
+    path: Optional[Path | str] = None,
+) -> Iterator[Optional[SlateSnapshot]]:
+    if mode is None:
+        yield None
+        return
+
+    snapshot_path = Path(path) if path else default_snapshot_path(report_date)
+    if mode == SNAPSHOT_MODE_RECORD:
+        snapshot = SlateSnapshot(report_date=report_date, recorded_at=time.time())
+        interceptor = snapshot.recording_interceptor()
+    elif mode == SNAPSHOT_MODE_REPLAY:
+        snapshot = SlateSnapshot.load(snapshot_path)
+        interceptor = snapshot.replay_interceptor()
+        print(f"\033[94mReplaying {len(snapshot)} recorded responses from {snapshot_path}\033[0m")
+    else:
+        raise ValueError(f"Unknown slate snapshot mode: {mode}")
+
+    previous = http_client.set_request_interceptor(interceptor)
+    try:
+        with _persistent_stores_disabled():
+            yield snapshot
+    finally:
+        http_client.set_request_interceptor(previous)
+        if mode == SNAPSHOT_MODE_RECORD:
+            snapshot.save(snapshot_path)
+            print(f"\033[94mWrote slate snapshot with {len(snapshot)} responses to {snapshot_path}\033[0m")
+        elif snapshot.misses:
+            print(f"\033[93m{len(snapshot.misses)} requests were not found in the slate snapshot.\033[0m")
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from mlb_pitcher_report.shared import report_data
+
+SLATE_STATE_DIR = Path("report_state") / "incremental"
+SLATE_STATE_VERSION = 1
+INCREMENTAL_FLAG = "--incremental"
+LIVE_GAME_STATUS = "In Progress"
+
+
+def default_slate_state_path(variant: str, report_date: str) -> Path:
+    return SLATE_STATE_DIR / f"{variant}-{report_date.replace('/', '')}.pickle"
+
+
+def source_fingerprint(source_files: Sequence[Path | str]) -> str:
+    digest = hashlib.sha256(str(SLATE_STATE_VERSION).encode("utf-8"))
+    shared_sources = sorted(Path(report_data.__file__).parent.glob("*.py"))
+    for source_file in [*source_files, *shared_sources]:
+        try:
+            digest.update(Path(source_file).read_bytes())
+        except OSError:
+            digest.update(str(source_file).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _espn_lineup_names(espn_summary: Optional[Dict[str, Any]]) -> Dict[str, List[str]]:
+    if not espn_summary:
+        return {}
+    lineups: Dict[str, List[str]] = {}
+    for roster_block in espn_summary.get("rosters") or []:
+        team_abbrev = str((roster_block.get("team") or {}).get("abbreviation") or "").strip().upper()
+        if not team_abbrev:
+            continue
+        lineups[team_abbrev] = [
+            str(entry.get("name") or "")
+            for entry in report_data.extract_confirmed_espn_lineup(espn_summary, team_abbrev)
+        ]
+    return lineups
+
+
+def build_game_state_components(
+    game: Dict[str, Any],
+    event_snapshot: Optional[Dict[str, Any]],
+    espn_summary: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    snapshot = event_snapshot or {}
+    away_score = snapshot.get("away_score")
+    home_score = snapshot.get("home_score")
+    return {
+        "status": str(game.get("status") or "").strip(),
+        "away_probable_pitcher": str(game.get("away_probable_pitcher") or "").strip(),
+        "home_probable_pitcher": str(game.get("home_probable_pitcher") or "").strip(),
+        "away_score": report_data.to_int(away_score if away_score is not None else game.get("away_score")),
+        "home_score": report_data.to_int(home_score if home_score is not None else game.get("home_score")),
+        "game_total": report_data.extract_espn_game_total(espn_summary),
+        "lineups": _espn_lineup_names(espn_summary),
+    }
+
+
+def build_game_state_signature(
+    game: Dict[str, Any],
+    event_snapshot: Optional[Dict[str, Any]],
+    espn_summary: Optional[Dict[str, Any]],
+) -> str:
+    state = build_game_state_components(game, event_snapshot, espn_summary)
+    payload = json.dumps(state, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def fetch_slate_espn_state(
+    schedule: Sequence[Dict[str, Any]],
+    report_date: str,
+) -> Dict[int, Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]]:
+    event_snapshots = report_data.build_espn_event_snapshot_lookup(report_date)
+    game_snapshots: List[Tuple[int, Dict[str, Any], Dict[str, Any]]] = []
+    for game in schedule:
+        game_id = report_data.to_int(game.get("game_id"))
+        if game_id is None:
+            continue
+        key = (
+            report_data.normalize_team_name(game.get("away_name")),
+            report_data.normalize_team_name(game.get("home_name")),
+        )
+        game_snapshots.append((int(game_id), game, event_snapshots.get(key) or {}))
+
+    event_ids = sorted(
+        {
+            str(snapshot.get("event_id") or "").strip()
+            for _, _, snapshot in game_snapshots
+            if str(snapshot.get("event_id") or "").strip()
+        }
+    )
+    summaries: Dict[str, Optional[Dict[str, Any]]] = {}
+    if event_ids:
+        with ThreadPoolExecutor(max_workers=min(8, len(event_ids))) as executor:
+            summaries = dict(zip(event_ids, executor.map(report_data.fetch_espn_summary, event_ids)))
+
+    return {
+        game_id: (game, snapshot, summaries.get(str(snapshot.get("event_id") or "").strip()))
+        for game_id, game, snapshot in game_snapshots
+    }
+
+
+def build_slate_signatures(schedule: Sequence[Dict[str, Any]], report_date: str) -> Dict[int, str]:
+    # Live box-score counters (hits, at-bats, strikeouts) move without touching the
+    # signature inputs, so in-progress games get no signature and are always rebuilt.
+    return {
+        game_id: build_game_state_signature(game, snapshot, summary)
+        for game_id, (game, snapshot, summary) in fetch_slate_espn_state(schedule, report_date).items()
+        if str(game.get("status") or "").strip() != LIVE_GAME_STATUS
+    }
+
+
+class IncrementalSlateCache:
+    def __init__(
+        self,
+        variant: str,
+        report_date: str,
+        signatures: Dict[int, str],
+        *,
+        fingerprint: str = "",
+        path: Optional[Path | str] = None,
+    ) -> None:
+        self.variant = variant
+        self.report_date = report_date
+        self.signatures = dict(signatures)
+        self.fingerprint = fingerprint
+        self.path = Path(path) if path else default_slate_state_path(variant, report_date)
+        self.hits = 0
+        self.misses = 0
+        self._previous = self._load()
+        self._current: Dict[int, Tuple[str, Any]] = {}
+
+    def _load(self) -> Dict[int, Tuple[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            payload = pickle.loads(self.path.read_bytes())
+        except Exception:
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        if payload.get("version") != SLATE_STATE_VERSION or payload.get("fingerprint") != self.fingerprint:
+            return {}
+        if payload.get("report_date") != self.report_date:
+            return {}
+        games = payload.get("games")
+        return games if isinstance(games, dict) else {}
+
+    def is_fresh(self, game_id: Optional[int]) -> bool:
+        if game_id is None or game_id not in self.signatures:
+            return False
+        previous = self._previous.get(int(game_id))
+        return previous is not None and previous[0] == self.signatures[int(game_id)]
+
+    def stale_games(self, schedule: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [game for game in schedule if not self.is_fresh(report_data.to_int(game.get("game_id")))]
+
+    def get(self, game_id: Optional[int]) -> Optional[Any]:
+        if not self.is_fresh(game_id):
+            self.misses += 1
+            return None
+        signature, value = self._previous[int(game_id)]
+        self._current[int(game_id)] = (signature, value)
+        self.hits += 1
+        return value
+
+    def put(self, game_id: Optional[int], value: Any) -> None:
+        if game_id is None or int(game_id) not in self.signatures:
+            return
+        self._current[int(game_id)] = (self.signatures[int(game_id)], value)
+
+    def save(self) -> None:
+        payload = {
+            "version": SLATE_STATE_VERSION,
+            "fingerprint": self.fingerprint,
+            "report_date": self.report_date,
+            "games": self._current,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+        temp_path.write_bytes(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+        temp_path.replace(self.path)
+        print(f"Incremental {self.variant}: reused {self.hits} games, rebuilt {self.misses}.")
+
+
+def open_incremental_cache(
+    variant: str,
+    schedule: Sequence[Dict[str, Any]],
+    report_date: str,
+    *,
+    source_files: Sequence[Path | str],
+) -> IncrementalSlateCache:
+    return IncrementalSlateCache(
+        variant,
+        report_date,
+        build_slate_signatures(schedule, report_date),
+        fingerprint=source_fingerprint(source_files),
+    )
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Hashable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+STAT_LINE_FIELDS = ("PA", "AB", "H", "BB", "HBP", "SF", "TB", "K", "HR", "RBI")
+GAME_LOG_FIELDS = (
+    "plateAppearances",
+    "atBats",
+    "hits",
+    "walks",
+    "hitByPitch",
+    "sacFlies",
+    "totalBases",
+    "strikeOuts",
+    "homeRuns",
+    "rbi",
+)
+SPLIT_STAT_FIELDS = (
+    "plateAppearances",
+    "atBats",
+    "hits",
+    "baseOnBalls",
+    "hitByPitch",
+    "sacFlies",
+    "totalBases",
+    "strikeOuts",
+    "homeRuns",
+    "rbi",
+)
+RATE_FIELDS = ("AVG", "OBP", "SLG", "OPS", "K%")
+FIELD_INDEX = {name: index for index, name in enumerate(STAT_LINE_FIELDS)}
+PLAYER_TAG_SHIFT = 32
+
+
+def _to_count(value: Any) -> int:
+    if value is None or value == "":
+        return 0
+    try:
+        numeric = float(value)
+    except (TypeError, ValueError):
+        return 0
+    if numeric != numeric:
+        return 0
+    return int(numeric)
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / np.where(denominator > 0, denominator, 1), np.nan)
+
+
+class StatLineArray:
+    __slots__ = ("counts", "games")
+
+    def __init__(self, counts: np.ndarray, games: Optional[np.ndarray] = None) -> None:
+        self.counts = np.asarray(counts, dtype=np.int64).reshape(len(STAT_LINE_FIELDS), -1)
+        size = self.counts.shape[1]
+        self.games = np.zeros(size, dtype=np.int64) if games is None else np.asarray(games, dtype=np.int64).reshape(size)
+
+    @classmethod
+    def zeros(cls, size: int) -> StatLineArray:
+        return cls(np.zeros((len(STAT_LINE_FIELDS), size), dtype=np.int64))
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Sequence[Mapping[str, Any]],
+        fields: Sequence[str] = STAT_LINE_FIELDS,
+        *,
+        games_field: Optional[str] = "games",
+    ) -> StatLineArray:
+        counts = np.array(
+            [[_to_count(record.get(field)) for record in records] for field in fields],
+            dtype=np.int64,
+        ).reshape(len(fields), len(records))
+        games = None
+        if games_field is not None:
+            games = np.array([_to_count(record.get(games_field)) for record in records], dtype=np.int64)
+        return cls(counts, games)
+
+    def __len__(self) -> int:
+        return int(self.counts.shape[1])
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.counts[FIELD_INDEX[field]]
+
+    def total(self) -> StatLineArray:
+        return StatLineArray(self.counts.sum(axis=1, keepdims=True), self.games.sum(keepdims=True))
+
+    def group_sum(self, group_index: np.ndarray, group_count: int) -> StatLineArray:
+        group_index = np.asarray(group_index, dtype=np.int64)
+        counts = np.zeros((len(STAT_LINE_FIELDS), group_count), dtype=np.int64)
+        np.add.at(counts, (slice(None), group_index), self.counts)
+        games = np.bincount(group_index, weights=self.games, minlength=group_count).astype(np.int64)
+        return StatLineArray(counts, games)
+
+    def subtract(self, other: StatLineArray) -> StatLineArray:
+        return StatLineArray(np.maximum(self.counts - other.counts, 0), self.games)
+
+    def clipped(self) -> StatLineArray:
+        return StatLineArray(np.maximum(self.counts, 0), self.games)
+
+    def rates(self) -> Dict[str, np.ndarray]:
+        hits = self["H"]
+        at_bats = self["AB"]
+        on_base = hits + self["BB"] + self["HBP"]
+        avg = _safe_divide(hits, at_bats)
+        obp = _safe_divide(on_base, at_bats + self["BB"] + self["HBP"] + self["SF"])
+        slg = _safe_divide(self["TB"], at_bats)
+        return {
+            "AVG": avg,
+            "OBP": obp,
+            "SLG": slg,
+            "OPS": obp + slg,
+            "K%": _safe_divide(self["K"] * 100.0, self["PA"]),
+        }
+
+    def to_dicts(self, *, include_games: bool = True, include_rates: bool = True) -> List[Dict[str, Any]]:
+        columns = self.counts.T.tolist()
+        games = self.games.tolist()
+        rate_columns = {
+            name: [None if value != value else value for value in values.tolist()]
+            for name, values in (self.rates().items() if include_rates else ())
+        }
+        lines: List[Dict[str, Any]] = []
+        for index, counts in enumerate(columns):
+            line: Dict[str, Any] = {"games": games[index]} if include_games else {}
+            line.update(zip(STAT_LINE_FIELDS, counts))
+            for name in rate_columns:
+                line[name] = rate_columns[name][index]
+            lines.append(line)
+        return lines
+
+
+def aggregate_stat_line_groups(groups: Sequence[Sequence[Mapping[str, Any]]]) -> List[Dict[str, Any]]:
+    records = [line for group in groups for line in group]
+    owners = np.repeat(np.arange(len(groups), dtype=np.int64), [len(group) for group in groups])
+    return StatLineArray.from_records(records).group_sum(owners, len(groups)).to_dicts()
+
+
+class _RecordFields:
+    __slots__ = ()
+    FIELD_BY_KEY: ClassVar[Dict[str, str]] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        attribute = self.FIELD_BY_KEY.get(key)
+        return default if attribute is None else getattr(self, attribute)
+
+    def __getitem__(self, key: str) -> Any:
+        attribute = self.FIELD_BY_KEY.get(key)
+        if attribute is None:
+            raise KeyError(key)
+        return getattr(self, attribute)
+
+
+@dataclass(slots=True)
+class BatterGameLogRow(_RecordFields):
+    FIELD_BY_KEY: ClassVar[Dict[str, str]] = {
+        "date": "date",
+        "gamePk": "game_pk",
+        "atBats": "at_bats",
+        "hits": "hits",
+        "walks": "walks",
+        "hitByPitch": "hit_by_pitch",
+        "sacFlies": "sac_flies",
+        "plateAppearances": "plate_appearances",
+        "totalBases": "total_bases",
+        "strikeOuts": "strike_outs",
+        "homeRuns": "home_runs",
+        "rbi": "rbi",
+    }
+
+    date: dt.date
+    game_pk: int = 0
+    at_bats: int = 0
+    hits: int = 0
+    walks: int = 0
+    hit_by_pitch: int = 0
+    sac_flies: int = 0
+    plate_appearances: int = 0
+    total_bases: int = 0
+    strike_outs: int = 0
+    home_runs: int = 0
+    rbi: int = 0
+
+
+@dataclass(slots=True)
+class PitcherGameLogRow(_RecordFields):
+    FIELD_BY_KEY: ClassVar[Dict[str, str]] = {
+        "date": "date",
+        "gamePk": "game_pk",
+        "gamesStarted": "games_started",
+        "outs": "outs",
+        "earnedRuns": "earned_runs",
+        "hits": "hits",
+        "walks": "walks",
+        "strikeOuts": "strike_outs",
+        "atBats": "at_bats",
+        "battersFaced": "batters_faced",
+    }
+
+    date: dt.date
+    game_pk: int = 0
+    games_started: int = 0
+    outs: int = 0
+    earned_runs: int = 0
+    hits: int = 0
+    walks: int = 0
+    strike_outs: int = 0
+    at_bats: int = 0
+    batters_faced: int = 0
+
+
+class GameLog(Sequence):
+    __slots__ = ("rows", "ordinals", "prefix", "_batted_prefix", "_hitless_positions")
+
+    def __init__(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        dated = [row for row in rows if isinstance(row.get("date"), dt.date)]
+        self.rows = sorted(dated, key=lambda row: (row["date"], _to_count(row.get("gamePk"))), reverse=True)
+        ascending = self.rows[::-1]
+        self.ordinals = np.array([row["date"].toordinal() for row in ascending], dtype=np.int64)
+        counts = StatLineArray.from_records(ascending, GAME_LOG_FIELDS, games_field=None).counts
+        self.prefix = np.zeros((len(STAT_LINE_FIELDS), len(ascending) + 1), dtype=np.int64)
+        np.cumsum(counts, axis=1, out=self.prefix[:, 1:])
+        batted = counts[FIELD_INDEX["AB"]] > 0
+        self._batted_prefix = np.concatenate(([0], np.cumsum(batted)))
+        self._hitless_positions = np.flatnonzero(batted & (counts[FIELD_INDEX["H"]] == 0))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.rows[index]
+
+    def _end_before(self, report_date: dt.date) -> int:
+        return int(np.searchsorted(self.ordinals, report_date.toordinal(), side="left"))
+
+    def window_counts(
+        self,
+        report_date: dt.date,
+        *,
+        max_games: Optional[int] = None,
+        window_days: Optional[int] = None,
+    ) -> Tuple[np.ndarray, int]:
+        end = self._end_before(report_date)
+        start = 0
+        if window_days is not None:
+            cutoff = report_date.toordinal() - int(window_days)
+            start = int(np.searchsorted(self.ordinals, cutoff, side="left"))
+        if max_games is not None:
+            start = max(start, end - int(max_games))
+        start = min(start, end)
+        return self.prefix[:, end] - self.prefix[:, start], end - start
+
+    def hit_streak(self, report_date: dt.date) -> int:
+        end = self._end_before(report_date)
+        position = int(np.searchsorted(self._hitless_positions, end, side="left"))
+        start = int(self._hitless_positions[position - 1]) + 1 if position else 0
+        return int(self._batted_prefix[end] - self._batted_prefix[start])
+
+
+def as_game_log(game_logs: Sequence[Mapping[str, Any]]) -> GameLog:
+    return game_logs if isinstance(game_logs, GameLog) else GameLog(game_logs)
+
+
+def compute_window_metrics(
+    game_logs_by_player: Mapping[Hashable, Sequence[Mapping[str, Any]]],
+    report_date: dt.date,
+    windows: Mapping[str, Mapping[str, Optional[int]]],
+) -> Dict[Hashable, Dict[str, Dict[str, Any]]]:
+    player_keys = list(game_logs_by_player)
+    game_logs = [as_game_log(game_logs_by_player[key]) for key in player_keys]
+    results: Dict[Hashable, Dict[str, Dict[str, Any]]] = {key: {} for key in player_keys}
+    if not game_logs:
+        return results
+
+    player_count = len(game_logs)
+    lengths = np.array([len(game_log) for game_log in game_logs], dtype=np.int64)
+    row_offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    prefix_offsets = row_offsets + np.arange(player_count, dtype=np.int64)
+    prefix = np.concatenate([game_log.prefix for game_log in game_logs], axis=1)
+    # Each log's ordinals are ascending, so tagging them with the player index in the high bits
+    # yields one sorted array that a single searchsorted probes for every player at once.
+    player_tags = np.arange(player_count, dtype=np.int64) << PLAYER_TAG_SHIFT
+    tagged_ordinals = np.repeat(player_tags, lengths) + np.concatenate([game_log.ordinals for game_log in game_logs])
+
+    def positions_before(ordinal: int) -> np.ndarray:
+        return np.searchsorted(tagged_ordinals, player_tags + int(ordinal), side="left") - row_offsets
+
+    end = positions_before(report_date.toordinal())
+    for window_name, window in windows.items():
+        start = np.zeros(player_count, dtype=np.int64)
+        if window.get("window_days") is not None:
+            start = positions_before(report_date.toordinal() - int(window["window_days"]))
+        if window.get("max_games") is not None:
+            start = np.maximum(start, end - int(window["max_games"]))
+        start = np.minimum(start, end)
+        counts = prefix[:, prefix_offsets + end] - prefix[:, prefix_offsets + start]
+        for key, line in zip(player_keys, StatLineArray(counts, end - start).to_dicts()):
+            results[key][window_name] = line
+    return results
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from mlb_pitcher_report.reports import pitchers
+from mlb_pitcher_report.run_slate import build_report_steps
+from mlb_pitcher_report.shared import live_games, pitcher_profiles, report_data
+from mlb_pitcher_report.shared.slate_state import build_game_state_components, fetch_slate_espn_state
+
+SOURCE_SCHEDULE = "schedule"
+SOURCE_ESPN = "espn"
+SOURCE_ODDS = "odds"
+DEFAULT_SOURCE_INTERVALS = {
+    SOURCE_SCHEDULE: 60.0,
+    SOURCE_ESPN: 120.0,
+    SOURCE_ODDS: 900.0,
+}
+INTERVAL_FLAG_PREFIX = "--interval-"
+ALL_REPORTS = ("pitchers", "batters", "matchups")
+COMPONENT_REPORTS = {
+    "status": ALL_REPORTS,
+    "away_probable_pitcher": ALL_REPORTS,
+    "home_probable_pitcher": ALL_REPORTS,
+    "away_score": ALL_REPORTS,
+    "home_score": ALL_REPORTS,
+    "lineups": ALL_REPORTS,
+    "game_total": ("matchups",),
+}
+MIN_SLEEP_SECONDS = 1.0
+
+
+def changed_reports(
+    previous: Optional[Dict[int, Dict[str, Any]]],
+    current: Dict[int, Dict[str, Any]],
+) -> Set[str]:
+    if previous is None or set(previous) != set(current):
+        return set(ALL_REPORTS)
+    reports: Set[str] = set()
+    for game_id, components in current.items():
+        before = previous[game_id]
+        for name, value in components.items():
+            if before.get(name) != value:
+                reports.update(COMPONENT_REPORTS.get(name, ALL_REPORTS))
+    return reports
+
+
+class SlateWatcher:
+    def __init__(
+        self,
+        date_input: str,
+        odds: str,
+        *,
+        intervals: Optional[Dict[str, float]] = None,
+        allow_roll_forward: bool = True,
+        write_root: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.date_input = date_input
+        self.odds = odds
+        self.intervals = {**DEFAULT_SOURCE_INTERVALS, **(intervals or {})}
+        self.allow_roll_forward = allow_roll_forward
+        self.write_root = write_root
+        self.clock = clock
+        self.report_date: Optional[str] = None
+        self.schedule: List[Dict[str, Any]] = []
+        self.espn_state: Dict[int, Tuple[Dict[str, Any], Optional[Dict[str, Any]]]] = {}
+        self.rendered_components: Optional[Dict[int, Dict[str, Any]]] = None
+        self.last_polled: Dict[str, float] = {}
+
+    def due_sources(self, now: float) -> List[str]:
+        sources = [SOURCE_SCHEDULE, SOURCE_ESPN]
+        if self.odds == "y":
+            sources.append(SOURCE_ODDS)
+        return [
+            source
+            for source in sources
+            if source not in self.last_polled or now - self.last_polled[source] >= self.intervals[source]
+        ]
+
+    def seconds_until_due(self, now: float) -> float:
+        waits = [
+            self.intervals[source] - (now - polled_at)
+            for source, polled_at in self.last_polled.items()
+        ]
+        return max(MIN_SLEEP_SECONDS, min(waits, default=0.0))
+
+    def _poll_schedule(self) -> bool:
+        report_date, schedule = report_data.resolve_effective_report_date_and_schedule(
+            report_data.resolve_date_input(self.date_input),
+            allow_roll_forward=self.allow_roll_forward,
+        )
+        date_changed = report_date != self.report_date
+        if date_changed and self.report_date is not None:
+            print(f"\033[94mWatch slate moved from {self.report_date} to {report_date}.\033[0m")
+            report_data.clear_process_caches(report_data.ESPN_STATE_CACHES)
+            report_data.clear_process_caches(report_data.LIVE_STATE_CACHES)
+            report_data.clear_process_caches((pitcher_profiles.PITCHER_PROFILE_CACHE,))
+            pitchers.clear_pitcher_odds_caches()
+            live_games.get_live_game_poller().clear()
+            self.espn_state = {}
+        self.report_date = report_date
+        self.schedule = schedule
+        return date_changed
+
+    def _poll_espn(self) -> None:
+        report_data.clear_process_caches(report_data.ESPN_STATE_CACHES)
+        self.espn_state = {
+            game_id: (snapshot, summary)
+            for game_id, (_, snapshot, summary) in fetch_slate_espn_state(self.schedule, self.report_date).items()
+        }
+
+    def _current_components(self) -> Dict[int, Dict[str, Any]]:
+        components: Dict[int, Dict[str, Any]] = {}
+        for game in self.schedule:
+            game_id = report_data.to_int(game.get("game_id"))
+            if game_id is None:
+                continue
+            snapshot, summary = self.espn_state.get(int(game_id), ({}, None))
+            components[int(game_id)] = build_game_state_components(game, snapshot, summary)
+        return components
+
+    def poll(self) -> Set[str]:
+        now = self.clock()
+        due = self.due_sources(now)
+        reports: Set[str] = set()
+        if SOURCE_SCHEDULE in due or self.report_date is None:
+            if self._poll_schedule():
+                due = sorted({*due, SOURCE_ESPN})
+                reports.update(ALL_REPORTS)
+        if SOURCE_ESPN in due:
+            self._poll_espn()
+        if SOURCE_ODDS in due:
+            pitchers.clear_pitcher_odds_caches()
+            if SOURCE_ODDS in self.last_polled:
+                reports.add("pitchers")
+        for source in due:
+            self.last_polled[source] = now
+
+        components = self._current_components()
+        reports.update(changed_reports(self.rendered_components, components))
+        self.rendered_components = components
+        return reports
+
+    def render(self, reports: Set[str]) -> List[str]:
+        report_data.clear_process_caches(report_data.LIVE_STATE_CACHES)
+        report_data.clear_process_caches((pitcher_profiles.PITCHER_PROFILE_CACHE,))
+        failed_reports: List[str] = []
+        steps = build_report_steps(
+            self.report_date,
+            self.schedule,
+            self.odds,
+            write_root=self.write_root,
+            incremental=True,
+        )
+        for report_name, render in steps:
+            if report_name not in reports:
+                continue
+            started = time.perf_counter()
+            try:
+                render()
+            except Exception as exc:
+                print(f"\033[91mFailed to build {report_name} report: {exc}\033[0m")
+                failed_reports.append(report_name)
+                continue
+            print(f"Built {report_name} report in {time.perf_counter() - started:.1f}s")
+        return failed_reports
+
+    def run_once(self) -> Set[str]:
+        reports = self.poll()
+        if reports:
+            print(
+                f"\033[94m[{dt.datetime.now().strftime('%H:%M:%S')}] "
+                f"Re-rendering {', '.join(sorted(reports))} for {self.report_date}\033[0m"
+            )
+            failed = self.render(reports)
+            if failed:
+                self.rendered_components = None
+        return reports
+
+    def run(
+        self,
+        *,
+        max_cycles: Optional[int] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        cycles = 0
+        while max_cycles is None or cycles < max_cycles:
+            try:
+                self.run_once()
+            except Exception as exc:
+                print(f"\033[91mWatch cycle failed: {exc}\033[0m")
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+            sleep(self.seconds_until_due(self.clock()))
+
+
+def _parse_cli_args(argv: Sequence[str]) -> Tuple[str, str, bool, bool, Dict[str, float]]:
+    if len(argv) < 3:
+        print(
+            "Usage: python3 -m mlb_pitcher_report.watch "
+            "<today|tmrw|MM/DD|MM/DD/YYYY> <y|n> [--exact] [--no-root] "
+            "[--interval-schedule=SECONDS] [--interval-espn=SECONDS] [--interval-odds=SECONDS]"
+        )
+        sys.exit(1)
+
+    date_input = str(argv[1])
+    odds = str(argv[2]).lower()
+    if odds not in {"y", "n"}:
+        print("Second argument must be 'y' or 'n'.")
+        sys.exit(1)
+
+    intervals: Dict[str, float] = {}
+    unexpected_flags: List[str] = []
+    for flag in argv[3:]:
+        name, _, value = str(flag).partition("=")
+        source = name[len(INTERVAL_FLAG_PREFIX):] if name.startswith(INTERVAL_FLAG_PREFIX) else ""
+        if source in DEFAULT_SOURCE_INTERVALS:
+            try:
+                intervals[source] = max(MIN_SLEEP_SECONDS, float(value))
+            except ValueError:
+                unexpected_flags.append(str(flag))
+        elif name not in {"--exact", "--no-root"}:
+            unexpected_flags.append(str(flag))
+    if unexpected_flags:
+        print(f"Unsupported flags: {', '.join(unexpected_flags)}")
+        sys.exit(1)
+
+    return date_input, odds, "--exact" in argv[3:], "--no-root" in argv[3:], intervals
+
+
+if __name__ == "__main__":
+    date_input, odds, exact_mode, no_root, intervals = _parse_cli_args(sys.argv)
+    try:
+        report_data.resolve_date_input(date_input)
+    except ValueError as exc:
+        print(f"\033[91m{exc}\033[0m")
+        sys.exit(1)
+
+    print(f"\033[94mWatching slate from {dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\033[0m")
+    try:
+        SlateWatcher(
+            date_input,
+            odds,
+            intervals=intervals,
+            allow_roll_forward=not exact_mode,
+            write_root=not no_root,
+        ).run()
+    except KeyboardInterrupt:
+        print("\033[94mStopped watching.\033[0m")
@@ -132,16 +132,12 @@ file_in_list() {
 }
 
 run_root_generation() {
-  run_cmd python3 -m mlb_pitcher_report.reports.pitchers "$REPORT_DATE" "$INCLUDE_ODDS"
-  run_cmd python3 -m mlb_pitcher_report.reports.batters "$REPORT_DATE"
-  run_cmd python3 -m mlb_pitcher_report.reports.matchups "$REPORT_DATE"
+  run_cmd python3 -m mlb_pitcher_report.run_slate "$REPORT_DATE" "$INCLUDE_ODDS" --incremental
 }
 
 run_archive_generation() {
   local archive_date="$1"
-  run_cmd python3 -m mlb_pitcher_report.reports.pitchers "$archive_date" "$INCLUDE_ODDS" --exact --no-root
-  run_cmd python3 -m mlb_pitcher_report.reports.batters "$archive_date" --exact --no-root
-  run_cmd python3 -m mlb_pitcher_report.reports.matchups "$archive_date" --exact --no-root
+  run_cmd python3 -m mlb_pitcher_report.run_slate "$archive_date" "$INCLUDE_ODDS" --exact --no-root
 }
 
 stage_existing_files() {
@@ -1 +1,8 @@
+import os
 
+os.environ.setdefault("MLB_REPORT_DISABLE_RESPONSE_CACHE", "1")
+os.environ.setdefault("MLB_REPORT_DISABLE_PA_STORE", "1")
+os.environ.setdefault("MLB_REPORT_DISABLE_LIVE_GAME_STATE", "1")
+os.environ.setdefault("MLB_REPORT_DISABLE_PLAYER_DIRECTORY", "1")
+os.environ.setdefault("MLB_REPORT_DISABLE_ODDS_KEY_POOL", "1")
+os.environ.setdefault("MLB_REPORT_DISABLE_ODDS_HISTORY", "1")
@@ -25,7 +25,6 @@ from mlb_pitcher_report.reports.batters import (
     build_hot_streak_matchup_section,
     build_worst_starting_pitchers_section,
     compute_hit_streak,
-    compute_recent_metrics,
     extract_espn_game_total,
     format_home_run_focus_dataframe,
     format_report_dataframe,
@@ -40,7 +39,7 @@ from mlb_pitcher_report.reports.pitchers import (
     BVP_AVG_COLUMN as PITCHER_BVP_AVG_COLUMN,
     BVP_H_COLUMN as PITCHER_BVP_H_COLUMN,
 )
-from mlb_pitcher_report.shared.report_data import parse_vs_pitcher_stats
+from mlb_pitcher_report.shared.report_data import compute_recent_metrics, parse_vs_pitcher_stats
 
 
 class BattersLogicTests(unittest.TestCase):
@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+import statsapi
+
+from mlb_pitcher_report.shared import http_client
+from mlb_pitcher_report.shared.http_client import build_session, http_get, install_statsapi_session
+
+
+class HttpClientTests(unittest.TestCase):
+    def test_build_session_mounts_pooled_adapter_with_retry_policy(self) -> None:
+        session = build_session(pool_connections=4, pool_maxsize=12, retry_total=2)
+        adapter = session.get_adapter("https://statsapi.mlb.com/api/v1/people")
+
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 12)
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertNotIn(429, adapter.max_retries.status_forcelist)
+        session.close()
+
+    def test_get_session_returns_shared_instance(self) -> None:
+        self.assertIs(http_client.get_session(), http_client.get_session())
+
+    def test_http_get_applies_default_timeout(self) -> None:
+        session = MagicMock()
+        with patch.object(http_client, "get_session", return_value=session):
+            http_get("https://example.test/a", params={"x": 1})
+
+        session.get.assert_called_once_with(
+            "https://example.test/a",
+            params={"x": 1},
+            timeout=http_client.DEFAULT_TIMEOUT_SECONDS,
+        )
+
+    def test_statsapi_requests_are_routed_through_shared_session(self) -> None:
+        install_statsapi_session()
+        session = MagicMock()
+        with patch.object(http_client, "get_session", return_value=session):
+            statsapi.requests.get("https://statsapi.mlb.com/api/v1/teams/1")
+
+        session.get.assert_called_once()
+        self.assertIs(statsapi.requests.RequestException, requests.RequestException)
+
+
+if __name__ == "__main__":
+    unittest.main()
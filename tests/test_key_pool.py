@@ -0,0 +1,90 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+from mlb_pitcher_report.odds import oddapi
+from mlb_pitcher_report.odds.key_pool import ApiKeyPool, key_fingerprint
+
+
+def _response(status_code, remaining, used):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["X-Requests-Remaining"] = str(remaining)
+    response.headers["X-Requests-Used"] = str(used)
+    response._content = b"[]"
+    return response
+
+
+class ApiKeyPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = Path(self.temp_dir.name) / "odds-key-quota.json"
+        self.now = [1_000_000.0]
+
+    def _pool(self, keys=("key-a", "key-b", "key-c")):
+        return ApiKeyPool(keys, min_remaining=30, path=self.path, clock=lambda: self.now[0])
+
+    def test_pool_routes_to_most_headroom_and_persists_fingerprints(self) -> None:
+        pool = self._pool()
+        pool.record_response("key-a", {"X-Requests-Remaining": "120", "X-Requests-Used": "380"})
+        pool.record_response("key-b", {"X-Requests-Remaining": "450", "X-Requests-Used": "50"})
+        pool.record_response("key-c", {"X-Requests-Remaining": "12", "X-Requests-Used": "488"})
+
+        self.assertEqual(pool.choose(), "key-b")
+        self.assertEqual(pool.choose(exclude="key-b"), "key-a")
+        self.assertFalse(pool.has_headroom("key-c"))
+
+        stored = self.path.read_text(encoding="utf-8")
+        self.assertNotIn("key-b", stored)
+        self.assertIn(key_fingerprint("key-b"), stored)
+
+        reloaded = self._pool()
+        self.assertEqual(reloaded.remaining("key-b"), 450)
+        reloaded.mark_exhausted("key-b")
+        self.assertEqual(reloaded.choose(), "key-a")
+
+        self.now[0] += 2 * 24 * 3600
+        self.assertEqual(self._pool().choose(), "key-a")
+        self.assertIsNone(self._pool().remaining("key-b"))
+
+    def test_quota_file_is_written_on_rotation_or_flush_only(self) -> None:
+        pool = self._pool()
+        pool.record_response("key-a", {"X-Requests-Remaining": "120"})
+        pool.record_response("key-a", {"X-Requests-Remaining": "119"})
+        self.assertFalse(self.path.exists())
+        self.assertEqual(pool.remaining("key-a"), 119)
+
+        pool.flush()
+        self.assertEqual(self._pool().remaining("key-a"), 119)
+
+        pool.record_response("key-a", {"X-Requests-Remaining": "118"})
+        pool.record_response("key-b", {"X-Requests-Remaining": "30"})
+        reloaded = self._pool()
+        self.assertEqual((reloaded.remaining("key-a"), reloaded.remaining("key-b")), (118, 30))
+
+    def test_unknown_keys_are_used_without_probe_requests(self) -> None:
+        pool = self._pool(("key-a", "key-b"))
+        pool.record_response("key-a", {"X-Requests-Remaining": "31"})
+        self.assertEqual(pool.choose(), "key-b")
+
+        with patch.object(oddapi, "_key_pool", pool), patch.object(oddapi, "_cached_api_key", None), patch.object(
+            oddapi, "_events_cache", {}
+        ), patch.object(
+            oddapi, "http_get", side_effect=[_response(200, 25, 475), _response(200, 28, 472)]
+        ) as get_mock, patch("builtins.print"):
+            first_key = oddapi.get_api_key()
+            oddapi._fetch_events_for_date(first_key, "2026-07-12")
+            second_key = oddapi.get_api_key()
+
+        self.assertEqual((first_key, second_key), ("key-b", "key-a"))
+        get_mock.assert_called_once()
+        self.assertEqual(get_mock.call_args.kwargs["params"], {"apiKey": "key-b"})
+        self.assertEqual(pool.remaining("key-b"), 25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from mlb_pitcher_report.shared import live_games
+from mlb_pitcher_report.shared import report_data as report_data_module
+from mlb_pitcher_report.shared.live_games import JsonPatchError, LiveGamePoller, apply_json_patch
+
+
+def _feed(timecode: str, strikeouts: int, state: str = "Live"):
+    return {
+        "metaData": {"timeStamp": timecode},
+        "gameData": {"status": {"abstractGameState": state}},
+        "liveData": {
+            "plays": {"allPlays": []},
+            "boxscore": {
+                "teams": {
+                    "away": {
+                        "batters": [],
+                        "players": {
+                            "ID10": {
+                                "person": {"id": 10, "fullName": "Away Starter"},
+                                "stats": {"pitching": {"strikeOuts": strikeouts}},
+                            }
+                        },
+                    },
+                    "home": {"batters": [], "players": {}},
+                }
+            },
+        },
+    }
+
+
+class JsonPatchTests(unittest.TestCase):
+    def test_applies_standard_operations(self) -> None:
+        document = {"a": {"b": 1}, "list": [1, 2], "x~y": 0}
+        patched = apply_json_patch(
+            document,
+            [
+                {"op": "replace", "path": "/a/b", "value": 2},
+                {"op": "add", "path": "/list/-", "value": 3},
+                {"op": "add", "path": "/list/0", "value": 0},
+                {"op": "remove", "path": "/x~0y"},
+                {"op": "copy", "from": "/a", "path": "/c"},
+                {"op": "move", "from": "/c/b", "path": "/d"},
+                {"op": "test", "path": "/d", "value": 2},
+            ],
+        )
+        self.assertEqual(patched, {"a": {"b": 2}, "list": [0, 1, 2, 3], "c": {}, "d": 2})
+
+    def test_rejects_paths_missing_from_the_document(self) -> None:
+        with self.assertRaises(JsonPatchError):
+            apply_json_patch({"a": {}}, [{"op": "replace", "path": "/missing/b", "value": 1}])
+
+
+class LiveGamePollerTests(unittest.TestCase):
+    def test_polls_full_feed_once_then_applies_diffs(self) -> None:
+        responses = {
+            "game": [_feed("t1", 2)],
+            "game_diff": [
+                [],
+                [
+                    {
+                        "diff": [
+                            {"op": "replace", "path": "/metaData/timeStamp", "value": "t2"},
+                            {
+                                "op": "replace",
+                                "path": "/liveData/boxscore/teams/away/players/ID10/stats/pitching/strikeOuts",
+                                "value": 5,
+                            },
+                        ]
+                    }
+                ],
+            ],
+        }
+        calls = []
+
+        def fake_get(endpoint, params, **_kwargs):
+            calls.append((endpoint, dict(params)))
+            return responses[endpoint].pop(0)
+
+        poller = LiveGamePoller(refresh_seconds=0)
+        with patch("mlb_pitcher_report.shared.live_games.statsapi.get", side_effect=fake_get):
+            first = poller.feed(1)
+            unchanged = poller.feed(1)
+            updated = poller.feed(1)
+
+        self.assertEqual(first["metaData"]["timeStamp"], "t1")
+        self.assertEqual(unchanged["metaData"]["timeStamp"], "t1")
+        self.assertEqual(updated["metaData"]["timeStamp"], "t2")
+        self.assertEqual([endpoint for endpoint, _ in calls], ["game", "game_diff", "game_diff"])
+        self.assertEqual(calls[2][1]["startTimecode"], "t1")
+        self.assertEqual((poller.full_fetches, poller.diff_fetches), (1, 2))
+
+    def test_refetches_full_feed_when_a_diff_does_not_apply(self) -> None:
+        bad_diff = [{"diff": [{"op": "replace", "path": "/liveData/missing/x", "value": 1}]}]
+        responses = {"game": [_feed("t1", 1), _feed("t3", 4)], "game_diff": [bad_diff]}
+        poller = LiveGamePoller(refresh_seconds=0)
+        with patch(
+            "mlb_pitcher_report.shared.live_games.statsapi.get",
+            side_effect=lambda endpoint, _params, **_kwargs: responses[endpoint].pop(0),
+        ):
+            poller.feed(1)
+            feed = poller.feed(1)
+
+        self.assertEqual(feed["metaData"]["timeStamp"], "t3")
+        self.assertEqual(poller.full_fetches, 2)
+
+    def test_final_games_and_recent_checks_do_not_poll(self) -> None:
+        poller = LiveGamePoller(refresh_seconds=60)
+        with patch(
+            "mlb_pitcher_report.shared.live_games.statsapi.get", return_value=_feed("t1", 1)
+        ) as get_mock:
+            poller.feed(1)
+            poller.feed(1)
+        get_mock.assert_called_once()
+
+        final_poller = LiveGamePoller(refresh_seconds=0)
+        with patch(
+            "mlb_pitcher_report.shared.live_games.statsapi.get", return_value=_feed("t9", 8, state="Final")
+        ) as get_mock:
+            final_poller.feed(2)
+            final_poller.feed(2)
+        get_mock.assert_called_once()
+
+    def test_state_persists_across_pollers(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir, patch.dict(
+            "os.environ", {live_games.LIVE_GAME_STATE_DISABLE_ENV: "0"}
+        ):
+            with patch("mlb_pitcher_report.shared.live_games.statsapi.get", return_value=_feed("t1", 3)):
+                LiveGamePoller(temp_dir).feed(7)
+
+            with patch("mlb_pitcher_report.shared.live_games.statsapi.get", return_value=[]) as get_mock:
+                feed = LiveGamePoller(temp_dir).feed(7)
+
+        self.assertEqual(feed["metaData"]["timeStamp"], "t1")
+        self.assertEqual(get_mock.call_args.args[0], "game_diff")
+
+    def test_saved_final_feeds_are_not_kept_in_memory(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir, patch.dict(
+            "os.environ", {live_games.LIVE_GAME_STATE_DISABLE_ENV: "0"}
+        ):
+            poller = LiveGamePoller(temp_dir, refresh_seconds=0)
+            with patch(
+                "mlb_pitcher_report.shared.live_games.statsapi.get", return_value=_feed("t1", 2)
+            ):
+                poller.feed(5)
+            with patch(
+                "mlb_pitcher_report.shared.live_games.statsapi.get", return_value=_feed("t9", 8, state="Final")
+            ) as get_mock:
+                poller.feed(6)
+                poller.feed(6)
+                feed = poller.feed(6)
+            get_mock.assert_called_once()
+            self.assertEqual(feed["metaData"]["timeStamp"], "t9")
+            self.assertEqual(sorted(poller._feeds), [5])
+
+            poller.clear()
+            self.assertEqual(poller._feeds, {})
+
+    def test_clear_prunes_state_files_from_past_slates(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir, patch.dict(
+            "os.environ", {live_games.LIVE_GAME_STATE_DISABLE_ENV: "0"}
+        ):
+            poller = LiveGamePoller(temp_dir)
+            with patch("mlb_pitcher_report.shared.live_games.statsapi.get", side_effect=[_feed("t1", 1), _feed("t2", 2)]):
+                poller.feed(1)
+                poller.feed(2)
+            old_path = Path(temp_dir) / "1.json.gz"
+            stale = time.time() - live_games.LIVE_GAME_STATE_MAX_AGE_SECONDS - 60
+            os.utime(old_path, (stale, stale))
+
+            poller.clear()
+
+            self.assertFalse(old_path.exists())
+            self.assertTrue((Path(temp_dir) / "2.json.gz").exists())
+            self.assertEqual(poller._feeds, {})
+
+    def test_in_progress_report_lines_come_from_the_live_feed(self) -> None:
+        with patch.object(live_games, "_DEFAULT_POLLER", LiveGamePoller()), patch(
+            "mlb_pitcher_report.shared.live_games.statsapi.get", return_value=_feed("t1", 6)
+        ) as get_mock:
+            strikeouts = report_data_module.fetch_game_pitcher_strikeouts(3, completed=False)
+            plays = report_data_module.fetch_game_at_bat_plays(3, completed=False)
+
+        self.assertEqual(strikeouts, {10: {"name": "Away Starter", "strikeOuts": 6}})
+        self.assertEqual(plays, [])
+        get_mock.assert_called_once_with("game", {"gamePk": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
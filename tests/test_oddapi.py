@@ -1,8 +1,16 @@
+import os
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
+import pandas as pd
+import requests
+
 from mlb_pitcher_report.odds import oddapi
 
+RUN_BENCHMARKS_ENV = "MLB_REPORT_RUN_BENCHMARKS"
+
 
 class OddsApiTests(unittest.TestCase):
     def test_request_event_id_matches_athletics_alias(self) -> None:
@@ -24,6 +32,167 @@ class OddsApiTests(unittest.TestCase):
                 "game-123",
             )
 
+    def test_match_schedule_events_uses_both_teams_and_start_time(self) -> None:
+        schedule = [
+            {"game_id": 1, "away_name": "Oakland Athletics", "home_name": "Los Angeles Angels", "game_datetime": "2026-06-27T17:05:00Z"},
+            {"game_id": 2, "away_name": "Oakland Athletics", "home_name": "Los Angeles Angels", "game_datetime": "2026-06-27T23:10:00Z"},
+            {"game_id": 3, "away_name": "Texas Rangers", "home_name": "Houston Astros", "game_datetime": "2026-06-27T23:10:00Z"},
+        ]
+        events = [
+            {"id": "late", "away_team": "Athletics", "home_team": "Los Angeles Angels", "commence_time": "2026-06-27T23:10:00Z"},
+            {"id": "early", "away_team": "Athletics", "home_team": "Los Angeles Angels", "commence_time": "2026-06-27T17:05:00Z"},
+            {"id": "reverse", "away_team": "Houston Astros", "home_team": "Texas Rangers", "commence_time": "2026-06-27T23:10:00Z"},
+        ]
+
+        self.assertEqual(oddapi.match_schedule_events(schedule, events), {1: "early", 2: "late"})
+
+    def test_match_schedule_events_without_start_time_requires_the_slate_date(self) -> None:
+        schedule = [
+            {"game_id": 1, "away_name": "Texas Rangers", "home_name": "Houston Astros", "game_date": "2026-06-27"},
+            {"game_id": 2, "away_name": "New York Yankees", "home_name": "Boston Red Sox"},
+            {"game_id": 3, "away_name": "Oakland Athletics", "home_name": "Los Angeles Angels"},
+        ]
+        events = [
+            {"id": "tex-next", "away_team": "Texas Rangers", "home_team": "Houston Astros", "commence_time": "2026-06-28T18:10:00Z"},
+            {"id": "tex-late", "away_team": "Texas Rangers", "home_team": "Houston Astros", "commence_time": "2026-06-28T00:10:00Z"},
+            {"id": "nyy-next", "away_team": "New York Yankees", "home_team": "Boston Red Sox", "commence_time": "2026-06-28T17:05:00Z"},
+            {"id": "oak-1", "away_team": "Athletics", "home_team": "Los Angeles Angels", "commence_time": "2026-06-27T20:05:00Z"},
+            {"id": "oak-2", "away_team": "Athletics", "home_team": "Los Angeles Angels", "commence_time": "2026-06-28T02:05:00Z"},
+        ]
+
+        self.assertEqual(
+            oddapi.match_schedule_events(schedule, events, oddapi._parse_slate_date("06/27/2026")),
+            {1: "tex-late"},
+        )
+
+    def test_slate_odds_fetch_each_event_once(self) -> None:
+        schedule = [
+            {"game_id": 1, "away_name": "New York Yankees", "home_name": "Boston Red Sox"},
+            {"game_id": 2, "away_name": "Texas Rangers", "home_name": "Houston Astros"},
+        ]
+        events = [
+            {"id": "ev-1", "away_team": "New York Yankees", "home_team": "Boston Red Sox", "commence_time": "2026-06-27T23:05:00Z"},
+            {"id": "ev-2", "away_team": "Texas Rangers", "home_team": "Houston Astros", "commence_time": "2026-06-28T00:10:00Z"},
+        ]
+
+        def game_data(event_id, api_key):
+            if event_id == "ev-2" and api_key == "spent-key":
+                response = requests.Response()
+                response.status_code = 401
+                raise requests.HTTPError("quota reached", response=response)
+            pitcher = {"ev-1": "Carlos Rodón", "ev-2": "Framber Valdez"}[event_id]
+            return {
+                "bookmakers": [
+                    {
+                        "key": "fanduel",
+                        "title": "FanDuel",
+                        "markets": [
+                            {
+                                "key": "pitcher_strikeouts",
+                                "outcomes": [
+                                    {"description": pitcher, "name": "Over", "point": 6.5, "price": -120},
+                                    {"description": pitcher, "name": "Under", "point": 6.5, "price": 100},
+                                ]
+                            }
+                        ],
+                    }
+                ]
+            }
+
+        current_key = ["spent-key"]
+
+        def api_key(force_refresh=False):
+            if force_refresh:
+                current_key[0] = "fresh-key"
+            return current_key[0]
+
+        with patch.object(oddapi, "get_api_key", side_effect=api_key), patch.object(
+            oddapi, "_fetch_events_for_date", return_value=events
+        ) as events_mock, patch.object(oddapi, "fetch_game_data", side_effect=game_data) as game_mock, patch.object(
+            oddapi, "_event_pitcher_lines_cache", {}
+        ), patch("builtins.print"):
+            slate_lines = oddapi.get_slate_pitcher_lines(schedule, "2026-06-27")
+
+        events_mock.assert_called_once()
+        self.assertEqual(
+            sorted((call.args[0], call.args[1]) for call in game_mock.call_args_list if call.args[0] == "ev-2"),
+            [("ev-2", "fresh-key"), ("ev-2", "spent-key")],
+        )
+        self.assertEqual(sorted(slate_lines), ["carlos rodon", "framber valdez"])
+        self.assertEqual(list(slate_lines["carlos rodon"]), ["FanDuel"])
+
+    def test_slate_odds_report_failed_events(self) -> None:
+        schedule = [{"game_id": 1, "away_name": "New York Yankees", "home_name": "Boston Red Sox"}]
+        events = [
+            {"id": "ev-1", "away_team": "New York Yankees", "home_team": "Boston Red Sox", "commence_time": "2026-06-27T23:05:00Z"}
+        ]
+
+        with patch.object(oddapi, "get_api_key", return_value="key"), patch.object(
+            oddapi, "_fetch_events_for_date", return_value=events
+        ), patch.object(oddapi, "fetch_game_data", side_effect=requests.ConnectionError("reset")), patch.object(
+            oddapi, "_event_pitcher_lines_cache", {}
+        ), patch("builtins.print") as print_mock:
+            self.assertEqual(oddapi.get_slate_pitcher_lines(schedule, "06/27/2026"), {})
+
+        printed = " ".join(str(call.args[0]) for call in print_mock.call_args_list)
+        self.assertIn("Odds request failed for event ev-1", printed)
+        self.assertIn("Odds unavailable for 1 of 1 events", printed)
+
+    def test_token_bucket_allows_a_burst_then_paces_requests(self) -> None:
+        now = [100.0]
+        limiter = oddapi.TokenBucketRateLimiter(2.0, 2, 4, clock=lambda: now[0], sleep=lambda seconds: None)
+
+        self.assertEqual([limiter.reserve() for _ in range(4)], [0.0, 0.0, 0.5, 1.0])
+        now[0] += 1.5
+        self.assertEqual(limiter.reserve(), 0.0)
+
+        limiter.record_rate_limited(3.0)
+        self.assertEqual(limiter.reserve(), 3.0)
+        self.assertEqual(limiter.reserve(), 3.5)
+        self.assertEqual(
+            limiter.metrics(),
+            {"requests": 7, "waits": 4, "wait_seconds": 8.0, "rate_limited": 1, "retries": 0},
+        )
+
+    def test_token_bucket_caps_in_flight_requests(self) -> None:
+        limiter = oddapi.TokenBucketRateLimiter(1000.0, 100, 2)
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def work() -> None:
+            with limiter.slot():
+                with lock:
+                    active[0] += 1
+                    active[1] = max(active[1], active[0])
+                threading.Event().wait(0.01)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(active[1], 2)
+
+    def test_request_with_backoff_honours_retry_after(self) -> None:
+        limited = requests.Response()
+        limited.status_code = 429
+        limited.headers["Retry-After"] = "2"
+        ok = requests.Response()
+        ok.status_code = 200
+        sleeps = []
+        limiter = oddapi.TokenBucketRateLimiter(100.0, 1, 1, clock=lambda: 0.0, sleep=sleeps.append)
+
+        with patch.object(oddapi, "_rate_limiter", limiter), patch.object(
+            oddapi, "http_get", side_effect=[limited, ok]
+        ), patch("builtins.print"):
+            self.assertIs(oddapi._request_with_backoff("https://example.test"), ok)
+
+        self.assertEqual(sleeps, [2.0])
+        self.assertEqual(limiter.metrics()["rate_limited"], 1)
+        self.assertEqual(limiter.metrics()["retries"], 1)
+
     def test_process_bookmaker_outcomes_includes_betonlineag(self) -> None:
         bookmaker = {
             "key": "betonlineag",
@@ -55,5 +224,74 @@ class OddsApiTests(unittest.TestCase):
         )
 
 
+def _full_slate_payloads(games=15, books=8, points=(4.5, 5.5, 6.5, 7.5)):
+    payloads = []
+    for game in range(games):
+        bookmakers = []
+        for book in range(books):
+            outcomes = []
+            for pitcher in (f"Away Pitcher {game}", f"Home Pitcher {game}"):
+                for offset, point in enumerate(points):
+                    outcomes.append({"description": pitcher, "name": "Over", "point": point, "price": -160 + 40 * offset + book})
+                    outcomes.append({"description": pitcher, "name": "Under", "point": point, "price": 140 - 40 * offset - book})
+            bookmakers.append(
+                {"key": f"book{book}", "title": f"Book {book}", "markets": [{"key": "pitcher_strikeouts", "outcomes": outcomes}]}
+            )
+        payloads.append({"id": f"ev-{game}", "bookmakers": bookmakers})
+    return payloads
+
+
+def _full_slate_events():
+    return [
+        [entry for bookmaker in payload["bookmakers"] for entry in oddapi.process_bookmaker_outcomes(bookmaker, set())]
+        for payload in _full_slate_payloads()
+    ]
+
+
+def _pivot_table_frame(data):
+    df = pd.DataFrame(data)
+    if df.empty or "pitcher" not in df.columns:
+        return pd.DataFrame()
+    return df.pivot_table(index="pitcher", aggfunc="first").reset_index()
+
+
+class OddsPivotTests(unittest.TestCase):
+    def test_dict_pivot_matches_pivot_table(self) -> None:
+        data = [
+            entry
+            for payload in _full_slate_payloads(games=3)
+            for bookmaker in payload["bookmakers"]
+            for entry in oddapi.process_bookmaker_outcomes(bookmaker, set())
+        ]
+        data.append({"pitcher": "Away Pitcher 0", "book0": "duplicate line"})
+
+        pd.testing.assert_frame_equal(oddapi.build_event_odds_dataframe(data), _pivot_table_frame(data))
+        pd.testing.assert_frame_equal(
+            oddapi.build_dataframe(data, "Away Pitcher 1"),
+            _pivot_table_frame([entry for entry in data if entry["pitcher"] == "Away Pitcher 1"]),
+        )
+
+    def test_dict_pivot_matches_pivot_table_for_every_event_on_a_full_slate(self) -> None:
+        for data in _full_slate_events():
+            with self.subTest(pitcher=data[0]["pitcher"]):
+                pd.testing.assert_frame_equal(oddapi.build_event_odds_dataframe(data), _pivot_table_frame(data))
+
+    @unittest.skipUnless(os.environ.get(RUN_BENCHMARKS_ENV), f"set {RUN_BENCHMARKS_ENV}=1 to run timing benchmarks")
+    def test_dict_pivot_benchmark_over_full_slate(self) -> None:
+        events = _full_slate_events()
+
+        def best_of(func, repeats=5):
+            timings = []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - started)
+            return min(timings)
+
+        pivot_seconds = best_of(lambda: [_pivot_table_frame(data) for data in events])
+        dict_seconds = best_of(lambda: [oddapi.build_pitcher_book_lines(data) for data in events])
+        self.assertLess(dict_seconds * 10, pivot_seconds)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,92 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from mlb_pitcher_report.odds import oddapi
+from mlb_pitcher_report.odds import odds_history as odds_history_module
+from mlb_pitcher_report.odds.odds_history import OddsHistoryStore
+
+
+def _payload(point, over_price, under_price, alt_point=None):
+    outcomes = [
+        {"name": "Over", "description": "Carlos Rodón", "point": point, "price": over_price},
+        {"name": "Under", "description": "Carlos Rodón", "point": point, "price": under_price},
+    ]
+    if alt_point is not None:
+        outcomes += [
+            {"name": "Over", "description": "Carlos Rodón", "point": alt_point, "price": 180},
+            {"name": "Under", "description": "Carlos Rodón", "point": alt_point, "price": -240},
+        ]
+    return {
+        "id": "ev-1",
+        "commence_time": "2026-07-12T23:05:00Z",
+        "bookmakers": [
+            {
+                "key": "fanduel",
+                "title": "FanDuel",
+                "markets": [
+                    {"key": "pitcher_strikeouts", "outcomes": outcomes},
+                    {"key": "h2h", "outcomes": [{"name": "New York Yankees", "price": -130}]},
+                ],
+            }
+        ],
+    }
+
+
+class OddsHistoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.now = [1_000.0]
+        self.store = OddsHistoryStore(Path(self.temp_dir.name) / "odds-history.sqlite3", clock=lambda: self.now[0])
+        self.addCleanup(self.store.close)
+        patches = [
+            patch.object(oddapi, "get_odds_history_store", return_value=self.store),
+            patch.object(oddapi, "_event_data_cache", {}),
+        ]
+        for active_patch in patches:
+            active_patch.start()
+            self.addCleanup(active_patch.stop)
+
+    def test_stored_snapshot_rebuilds_the_same_bookmaker_lines(self) -> None:
+        payload = _payload(6.5, -120, 100, alt_point=7.5)
+        self.store.record_event("ev-1", payload)
+
+        stored = self.store.latest_payload("ev-1")
+        self.assertEqual(
+            oddapi.process_bookmaker_outcomes(stored["bookmakers"][0], set()),
+            oddapi.process_bookmaker_outcomes(payload["bookmakers"][0], set()),
+        )
+
+    def test_fetch_game_data_serves_fresh_snapshots_without_api_calls(self) -> None:
+        with patch.object(oddapi, "_request_with_backoff") as request_mock:
+            request_mock.return_value.json.return_value = _payload(6.5, -120, 100)
+            oddapi.fetch_game_data("ev-1", "fake-key")
+            oddapi._event_data_cache.clear()
+            self.now[0] += 300
+            oddapi.fetch_game_data("ev-1", "fake-key")
+            self.assertEqual(request_mock.call_count, 1)
+
+            oddapi._event_data_cache.clear()
+            self.now[0] += 900
+            request_mock.return_value.json.return_value = _payload(7.5, -105, -115)
+            oddapi.fetch_game_data("ev-1", "fake-key")
+            self.assertEqual(request_mock.call_count, 2)
+
+
+    def test_snapshots_for_long_finished_events_are_pruned(self) -> None:
+        self.now[0] = 1_783_900_000.0  # 2026-07-12T23:46:40Z
+        self.store.record_event("ev-1", _payload(6.5, -120, 100))
+        current = _payload(5.5, -110, -110)
+        current["commence_time"] = "2026-07-18T23:05:00Z"
+        self.store.record_event("ev-2", current)
+
+        self.now[0] += (odds_history_module.ODDS_HISTORY_RETENTION_DAYS + 1) * 24 * 3600
+        self.assertEqual(self.store.prune(), 1)
+        self.assertIsNone(self.store.latest_payload("ev-1", max_age_seconds=float("inf")))
+        self.assertIsNotNone(self.store.latest_payload("ev-2", max_age_seconds=float("inf")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import datetime as dt
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from mlb_pitcher_report.shared import pitcher_profiles as pitcher_profiles_module
+from mlb_pitcher_report.shared import report_data as report_data_module
+from mlb_pitcher_report.shared.pitcher_profiles import get_pitcher_profile, get_pitcher_profile_by_name
+from mlb_pitcher_report.shared.response_cache import ResponseCache, build_cache_key
+
+
+def _person():
+    return {
+        "id": 30,
+        "fullName": "Ace Pitcher",
+        "pitchHand": {"code": "L"},
+        "mlbDebutDate": "2021-05-02",
+        "stats": [
+            {
+                "type": {"displayName": "season"},
+                "splits": [{"stat": {"gamesStarted": 2, "inningsPitched": "12.0", "strikeOuts": 14}}],
+            },
+            {
+                "type": {"displayName": "gameLog"},
+                "splits": [
+                    {"date": "2026-07-01", "game": {"gamePk": 1}, "stat": {"gamesStarted": 1, "outs": 18, "strikeOuts": 6}},
+                    {"date": "2026-07-07", "game": {"gamePk": 2}, "stat": {"gamesStarted": 1, "outs": 18, "strikeOuts": 8}},
+                    {"date": "2026-07-12", "game": {"gamePk": 3}, "stat": {"gamesStarted": 1, "outs": 21, "strikeOuts": 9}},
+                ],
+            },
+        ],
+    }
+
+
+class PitcherProfileTests(unittest.TestCase):
+    def setUp(self) -> None:
+        patches = [
+            patch.object(report_data_module, "PITCHER_ID_CACHE", {}),
+            patch.object(report_data_module, "PITCHER_LOOKUP_CACHE", {}),
+            patch.object(report_data_module, "PEOPLE_STATS_CACHE", {}),
+            patch.object(pitcher_profiles_module, "PITCHER_PROFILE_CACHE", {}),
+        ]
+        for active_patch in patches:
+            active_patch.start()
+            self.addCleanup(active_patch.stop)
+
+    def test_one_hydrated_people_request_serves_every_pitcher_lookup(self) -> None:
+        report_date = dt.date(2026, 7, 12)
+        with patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.lookup_player",
+            return_value=[{"id": 30, "fullName": "Ace Pitcher"}],
+        ) as lookup_mock, patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.get",
+            return_value={"people": [_person()]},
+        ) as get_mock:
+            profile = get_pitcher_profile_by_name("Ace Pitcher", 2026, report_date)
+            context = report_data_module.fetch_pitcher_context("Ace Pitcher", 2026)
+            splits = report_data_module.fetch_pitcher_game_log_splits(30, 2026)
+            debut_year = report_data_module.fetch_pitcher_debut_year(30, 2026)
+            again = get_pitcher_profile(30, 2026, report_date)
+
+        lookup_mock.assert_called_once_with("Ace Pitcher")
+        get_mock.assert_called_once()
+        self.assertEqual(get_mock.call_args.args[1]["hydrate"], "stats(group=[pitching],type=[season,gameLog],season=2026)")
+        self.assertIs(again, profile)
+        self.assertEqual(context, {"id": 30, "name": "Ace Pitcher", "hand": "L"})
+        self.assertEqual(len(splits), 3)
+        self.assertEqual((debut_year, profile["debut_year"], profile["hand"]), (2021, 2021, "L"))
+        self.assertEqual(profile["season_stat"]["strikeOuts"], 14)
+        self.assertEqual((profile["season"]["Games"], profile["recent"]["Starts"]), (2, 2))
+        self.assertAlmostEqual(profile["recent"]["K/9"], 14 * 27 / 36)
+
+    def test_pitcher_context_is_cached_per_season(self) -> None:
+        with patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.lookup_player",
+            return_value=[{"id": 30, "fullName": "Ace Pitcher"}],
+        ), patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.get",
+            return_value={"people": [_person()]},
+        ) as get_mock:
+            report_data_module.fetch_pitcher_context("Ace Pitcher", 2025)
+            report_data_module.fetch_pitcher_context("Ace Pitcher", 2026)
+            report_data_module.fetch_pitcher_context("Ace Pitcher", 2026)
+
+        self.assertEqual(
+            [call.args[1]["hydrate"] for call in get_mock.call_args_list],
+            [
+                "stats(group=[pitching],type=[season,gameLog],season=2025)",
+                "stats(group=[pitching],type=[season,gameLog],season=2026)",
+            ],
+        )
+        self.assertEqual(set(report_data_module.PITCHER_LOOKUP_CACHE), {("ace pitcher", 2025), ("ace pitcher", 2026)})
+
+    def test_unknown_pitchers_resolve_to_no_profile(self) -> None:
+        with patch("mlb_pitcher_report.shared.report_data.statsapi.lookup_player", return_value=[]), patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.get"
+        ) as get_mock:
+            self.assertIsNone(get_pitcher_profile_by_name("Nobody", 2026, dt.date(2026, 7, 12)))
+            self.assertIsNone(report_data_module.fetch_pitcher_context("Nobody", 2026))
+        get_mock.assert_not_called()
+
+    def test_completed_season_people_are_stored_without_expiry(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        cache = ResponseCache(Path(temp_dir.name) / "cache.sqlite3")
+        self.addCleanup(cache.close)
+        past_season = dt.date.today().year - 1
+
+        with patch.object(report_data_module, "get_response_cache", return_value=cache), patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.get",
+            side_effect=lambda _endpoint, params, **_kwargs: {
+                "people": [{"id": int(person_id)} for person_id in params["personIds"].split(",")]
+            },
+        ):
+            report_data_module.fetch_pitcher_people([30], past_season)
+            report_data_module.fetch_pitcher_people([30], past_season + 1)
+
+        def expires_at(season):
+            hydrate = report_data_module.build_pitcher_person_hydrate(season)
+            key = build_cache_key("people_stats", {"hydrate": hydrate, "id": 30})
+            return cache._connect().execute("SELECT expires_at FROM responses WHERE key = ?", (key,)).fetchone()[0]
+
+        self.assertIsNone(expires_at(past_season))
+        self.assertIsNotNone(expires_at(past_season + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
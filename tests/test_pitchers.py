@@ -8,6 +8,9 @@ import pandas as pd
 from bs4 import BeautifulSoup
 
 from mlb_pitcher_report.reports import pitchers as pitchers_module
+from mlb_pitcher_report.shared import live_games
+from mlb_pitcher_report.shared import report_data as report_data_module
+from mlb_pitcher_report.shared.live_games import LiveGamePoller
 from mlb_pitcher_report.reports.pitchers import (
     BEST_K_ODDS_COLUMN,
     BVP_AB_COLUMN,
@@ -24,6 +27,7 @@ from mlb_pitcher_report.reports.pitchers import (
     OPP_LAST_10_K_COLUMN,
     OPP_LAST_5_K_COLUMN,
     PA_GP_COLUMN,
+    PLAYER_ID_COLUMN,
     RECENT_PITCHER_GAMES_COLUMN,
     START_TIME_COLUMN,
     _classify_best_odds_point,
@@ -38,6 +42,7 @@ from mlb_pitcher_report.reports.pitchers import (
     build_opponent_hand_k_lookup,
     calculate_additional_metrics,
     fetch_pitcher_recent_game_lines,
+    fetch_pitcher_stats_batch,
     get_opp_data,
     prepare_team_batting_df,
     resolve_effective_report_date_and_schedule,
@@ -581,7 +586,7 @@ class PitchersRenderTests(unittest.TestCase):
             "mlb_pitcher_report.reports.pitchers._fetch_previous_lineup_player_ids",
             return_value=lineup_ids,
         ), patch(
-            "mlb_pitcher_report.reports.pitchers.fetch_hitter_people_stats_map",
+            "mlb_pitcher_report.reports.pitchers.fetch_hitter_vs_pitcher_map",
             return_value=people,
         ) as fetch_people:
             result = _previous_lineup_k_percent(158, 2026, dt.date(2026, 7, 12), 999)
@@ -597,7 +602,6 @@ class PitchersRenderTests(unittest.TestCase):
         fetch_people.assert_called_once_with(
             lineup_ids,
             2026,
-            None,
             999,
             stats_end_date=dt.date(2026, 7, 11),
         )
@@ -834,8 +838,13 @@ class PitchersRenderTests(unittest.TestCase):
             ]
         )
 
-        with patch("mlb_pitcher_report.reports.pitchers.get_strikeouts_by_player_name", return_value=7):
-            result = calculate_additional_metrics("06/27/2026", pitchers)
+        schedule = [{"game_id": 1, "status": "Final"}]
+        with patch(
+            "mlb_pitcher_report.reports.pitchers.build_slate_pitcher_strikeouts",
+            return_value={55: {"name": "Bravo Ball", "strikeOuts": 7}},
+        ) as strikeouts_mock:
+            result = calculate_additional_metrics(pitchers, schedule)
+        strikeouts_mock.assert_called_once_with(schedule)
 
         alpha_row = result.loc[result["Name"] == "Alpha Ace"].iloc[0]
         bravo_row = result.loc[result["Name"] == "Bravo Ball"].iloc[0]
@@ -848,6 +857,96 @@ class PitchersRenderTests(unittest.TestCase):
         self.assertEqual(alpha_row["r"], 1)
         self.assertEqual(bravo_row["r"], 6)
 
+    def test_slate_pitcher_strikeouts_fetch_each_started_boxscore_once(self) -> None:
+        def boxscore(endpoint, params, **_kwargs):
+            pitcher_id = 100 + int(params["gamePk"])
+            box = {
+                "teams": {
+                    "away": {
+                        "players": {
+                            f"ID{pitcher_id}": {
+                                "person": {"id": pitcher_id, "fullName": f"Pitcher {pitcher_id}"},
+                                "stats": {"pitching": {"strikeOuts": int(params["gamePk"]) + 4}},
+                            },
+                            "ID9": {"person": {"id": 9, "fullName": "Hitter"}, "stats": {"pitching": {}}},
+                        }
+                    },
+                    "home": {"players": {}},
+                }
+            }
+            if endpoint == "game":
+                return {
+                    "metaData": {"timeStamp": "20260627_200000"},
+                    "gameData": {"status": {"abstractGameState": "Live"}},
+                    "liveData": {"boxscore": box},
+                }
+            self.assertEqual(endpoint, "game_boxscore")
+            return box
+
+        schedule = [
+            {"game_id": 1, "status": "Final"},
+            {"game_id": 2, "status": "In Progress"},
+            {"game_id": 3, "status": "Scheduled"},
+        ]
+        pitchers = pd.DataFrame(
+            [
+                {"Name": "Pitcher 101", "Status": "Final", PLAYER_ID_COLUMN: 101},
+                {"Name": "Pitcher 102", "Status": "In Progress", PLAYER_ID_COLUMN: 102},
+                {"Name": "Pitcher 103", "Status": "Scheduled", PLAYER_ID_COLUMN: 103},
+            ]
+        )
+        with patch.dict(report_data_module.GAME_PITCHER_STRIKEOUT_CACHE, clear=True), patch.object(
+            live_games, "_DEFAULT_POLLER", LiveGamePoller()
+        ), patch("mlb_pitcher_report.shared.report_data.statsapi.get", side_effect=boxscore) as get_mock:
+            result = calculate_additional_metrics(pitchers, schedule)
+
+        self.assertEqual(sorted(call.args[1]["gamePk"] for call in get_mock.call_args_list), [1, 2])
+        ks_by_name = dict(zip(result["Name"], result["Ks"]))
+        self.assertEqual(ks_by_name, {"Pitcher 101": 5, "Pitcher 102": 6, "Pitcher 103": ""})
+
+    def test_pitcher_stats_come_from_one_batched_people_request(self) -> None:
+        def person(person_id: int, strikeouts: int):
+            return {
+                "id": person_id,
+                "stats": [
+                    {
+                        "type": {"displayName": "season"},
+                        "splits": [
+                            {
+                                "stat": {
+                                    "gamesPlayed": 10,
+                                    "battersFaced": 240,
+                                    "strikeOuts": strikeouts,
+                                    "avg": ".221",
+                                    "strikeoutsPer9Inn": "9.75",
+                                }
+                            }
+                        ],
+                    }
+                ],
+            }
+
+        tasks = [
+            ("Away Ace", "Boston Red Sox", "New York Yankees", "Pre-Game", "7:05p"),
+            ("Home Ace", "New York Yankees", "Boston Red Sox", "Pre-Game", "7:05p"),
+            ("Unknown Arm", "Tampa Bay Rays", "Toronto Blue Jays", "Pre-Game", "7:10p"),
+        ]
+        pitcher_ids = {"Away Ace": 11, "Home Ace": 22, "Unknown Arm": None}
+        with patch.object(report_data_module, "PEOPLE_STATS_CACHE", {}), patch.object(
+            pitchers_module, "resolve_pitcher_id", side_effect=pitcher_ids.get
+        ), patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.get",
+            return_value={"people": [person(11, 60), person(22, 55)]},
+        ) as get_mock:
+            results = fetch_pitcher_stats_batch(tasks, 2026)
+
+        get_mock.assert_called_once()
+        self.assertEqual(get_mock.call_args.args[1]["personIds"], "11,22")
+        self.assertEqual([row.get("K") for row in results], [60, 55, None])
+        self.assertEqual(results[0][PLAYER_ID_COLUMN], 11)
+        self.assertEqual((results[0]["BF"], results[0]["AVG"], results[0]["K/9"]), (240, ".221", "9.75"))
+        self.assertEqual(results[2]["Error"], "Player Unknown Arm not found")
+
 
 if __name__ == "__main__":
     unittest.main()
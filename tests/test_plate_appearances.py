@@ -0,0 +1,172 @@
+import datetime as dt
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from mlb_pitcher_report.shared import plate_appearances as plate_appearances_module
+from mlb_pitcher_report.shared import report_data as report_data_module
+from mlb_pitcher_report.shared.plate_appearances import (
+    PlateAppearanceIndex,
+    PlateAppearanceStore,
+    extract_plate_appearance_records,
+)
+from mlb_pitcher_report.shared.report_data import (
+    extract_batter_vs_pitcher_stat_lines_from_plays,
+    fetch_pitcher_historical_batter_vs_pitcher_stat_lines,
+)
+
+
+def _play(batter_id, pitcher_id, event_type, rbi=0):
+    return {
+        "result": {"type": "atBat", "eventType": event_type, "rbi": rbi},
+        "matchup": {"batter": {"id": batter_id}, "pitcher": {"id": pitcher_id}},
+    }
+
+
+class PlateAppearanceStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = PlateAppearanceStore(Path(self.temp_dir.name) / "pa.sqlite3")
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def test_extract_records_skips_non_at_bats_and_missing_ids(self) -> None:
+        plays = [
+            _play(10, 20, "single"),
+            {"result": {"type": "action", "eventType": "stolen_base_2b"}, "matchup": {}},
+            {"result": {"type": "atBat", "eventType": "walk"}, "matchup": {"batter": {}, "pitcher": {"id": 20}}},
+        ]
+
+        self.assertEqual(extract_plate_appearance_records(plays), [(10, 20, "single", 0)])
+
+    def test_ingest_marks_games_and_index_slices_by_date_cutoff(self) -> None:
+        self.store.ingest_game(
+            1,
+            dt.date(2025, 5, 1),
+            extract_plate_appearance_records([_play(10, 20, "home_run", 2), _play(10, 20, "walk", 1), _play(11, 21, "walk")]),
+        )
+        index = self.store.index()
+        self.store.ingest_game(2, dt.date(2026, 5, 1), extract_plate_appearance_records([_play(10, 20, "strikeout")]))
+
+        self.assertEqual(self.store.missing_game_ids([1, 2, 3]), [3])
+        self.assertEqual(len(index), 3)
+        self.assertEqual(len(self.store.index()), 4)
+        self.assertEqual(
+            self.store.index().stat_totals(20, dt.date(2026, 5, 1)),
+            {10: {"PA": 2, "AB": 1, "H": 1, "BB": 1, "HBP": 0, "SF": 0, "TB": 4, "K": 0, "HR": 1, "RBI": 3}},
+        )
+        self.assertEqual(self.store.index().stat_totals(20, dt.date(2026, 5, 2), [10, 99])[10]["K"], 1)
+        self.assertEqual(self.store.index().stat_totals(21, dt.date(2025, 5, 1)), {})
+
+    def test_index_picks_up_games_written_by_another_store(self) -> None:
+        self.store.ingest_game(1, dt.date(2025, 5, 1), extract_plate_appearance_records([_play(10, 20, "walk")]))
+        self.assertEqual(len(self.store.index()), 1)
+
+        other = PlateAppearanceStore(self.store.path)
+        self.addCleanup(other.close)
+        other.ingest_game(2, dt.date(2025, 5, 2), extract_plate_appearance_records([_play(10, 20, "single")]))
+        self.store.ingest_game(3, dt.date(2025, 5, 3), extract_plate_appearance_records([_play(10, 20, "strikeout")]))
+
+        self.assertEqual(len(self.store.index()), 3)
+        self.assertEqual(self.store.index().stat_totals(20, dt.date(2025, 5, 4))[10]["PA"], 3)
+
+    def test_reingested_game_replaces_its_index_rows(self) -> None:
+        self.store.ingest_game(1, dt.date(2025, 5, 1), extract_plate_appearance_records([_play(10, 20, "walk")]))
+        self.store.index()
+        self.store.ingest_game(1, dt.date(2025, 5, 1), extract_plate_appearance_records([_play(10, 20, "single")]))
+
+        self.assertEqual(len(self.store.index()), 1)
+        self.assertEqual(self.store.index().stat_totals(20, dt.date(2025, 5, 2))[10]["H"], 1)
+
+    def test_empty_play_by_play_is_retried_later_and_never_stored_as_a_game(self) -> None:
+        now = [1_000_000.0]
+        store = PlateAppearanceStore(self.store.path, clock=lambda: now[0])
+        self.addCleanup(store.close)
+        responses = [[], [_play(10, 20, "single")]]
+
+        with patch(
+            "mlb_pitcher_report.shared.report_data.fetch_game_at_bat_plays",
+            side_effect=lambda game_id, completed=False: responses.pop(0),
+        ) as plays_mock:
+            ingest = report_data_module.ingest_completed_games_into_plate_appearance_store
+            self.assertEqual(ingest(store, [100], {100: dt.date(2025, 5, 1)}), 0)
+            self.assertEqual(ingest(store, [100], {100: dt.date(2025, 5, 1)}), 0)
+            self.assertEqual(plays_mock.call_count, 1)
+            self.assertEqual(store.stored_game_ids([100]), set())
+
+            now[0] += plate_appearances_module.EMPTY_GAME_RETRY_SECONDS + 1
+            self.assertEqual(ingest(store, [100], {100: dt.date(2025, 5, 1)}), 1)
+
+        self.assertEqual(plays_mock.call_count, 2)
+        self.assertEqual(store.index().stat_totals(20, dt.date(2025, 5, 2))[10]["H"], 1)
+        self.assertEqual(store.recently_empty_game_ids([100]), set())
+
+    def test_index_matches_play_by_play_aggregation(self) -> None:
+        event_types = [
+            "single", "double", "triple", "home_run", "walk", "intent_walk", "hit_by_pitch",
+            "sac_fly", "sac_bunt", "catcher_interf", "strikeout", "strikeout_double_play",
+            "field_out", "grounded_into_double_play", "field_error",
+        ]
+        plays = [_play(10 + (i % 3), 20, event_type, i % 2) for i, event_type in enumerate(event_types * 2)]
+        index = PlateAppearanceIndex.from_rows(
+            [
+                (pitcher_id, batter_id, dt.date(2025, 6, 1), event_type, rbi)
+                for batter_id, pitcher_id, event_type, rbi in extract_plate_appearance_records(plays)
+            ]
+        )
+
+        expected = extract_batter_vs_pitcher_stat_lines_from_plays(plays, 20)
+        self.assertEqual(index.stat_totals(20, dt.date(2025, 6, 2)), expected)
+
+    def test_historical_bvp_reads_store_and_fetches_each_game_once(self) -> None:
+        game_logs_by_season = {
+            2025: [{"date": "2025-09-01", "game": {"gamePk": 100}}],
+            2026: [
+                {"date": "2026-07-11", "game": {"gamePk": 101}},
+                {"date": "2026-07-12", "game": {"gamePk": 102}},
+            ],
+        }
+        plays_by_game = {
+            100: [_play(10, 30, "double", 1), _play(11, 30, "strikeout"), _play(10, 31, "single")],
+            101: [_play(10, 30, "walk"), _play(10, 30, "home_run", 2)],
+            102: [_play(10, 30, "triple")],
+        }
+        fetched = []
+
+        def fake_plays(game_id, completed=False):
+            fetched.append(game_id)
+            return plays_by_game[game_id]
+
+        with patch.object(report_data_module, "PITCHER_HISTORICAL_BVP_CACHE", {}), patch(
+            "mlb_pitcher_report.shared.report_data.get_plate_appearance_store",
+            return_value=self.store,
+        ), patch(
+            "mlb_pitcher_report.shared.report_data.fetch_pitcher_debut_year",
+            return_value=2025,
+        ), patch(
+            "mlb_pitcher_report.shared.report_data.fetch_pitcher_game_log_splits",
+            side_effect=lambda pitcher_id, season: game_logs_by_season.get(season, []),
+        ), patch(
+            "mlb_pitcher_report.shared.report_data.fetch_game_at_bat_plays",
+            side_effect=fake_plays,
+        ):
+            stats = fetch_pitcher_historical_batter_vs_pitcher_stat_lines(30, dt.date(2026, 7, 12))
+            report_data_module.PITCHER_HISTORICAL_BVP_CACHE.clear()
+            fetch_pitcher_historical_batter_vs_pitcher_stat_lines(30, dt.date(2026, 7, 12))
+
+        expected = report_data_module.aggregate_stat_lines(
+            [
+                extract_batter_vs_pitcher_stat_lines_from_plays(plays_by_game[100], 30)[10],
+                extract_batter_vs_pitcher_stat_lines_from_plays(plays_by_game[101], 30)[10],
+            ]
+        )
+        self.assertEqual(sorted(fetched), [100, 101])
+        self.assertEqual(stats[10], expected)
+        self.assertEqual(stats[11]["K"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import datetime as dt
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from mlb_pitcher_report.odds import oddapi as oddapi_module
+from mlb_pitcher_report.shared import player_directory as player_directory_module
+from mlb_pitcher_report.shared import report_data as report_data_module
+from mlb_pitcher_report.shared.player_directory import PlayerDirectory, get_player_directory
+
+
+def _person(person_id, full_name, team_id, position_type="Pitcher", pitch_hand="R", **extra):
+    return {
+        "id": person_id,
+        "fullName": full_name,
+        "firstLastName": full_name,
+        "currentTeam": {"id": team_id},
+        "primaryPosition": {"type": position_type},
+        "pitchHand": {"code": pitch_hand},
+        "batSide": {"code": "L"},
+        "active": True,
+        **extra,
+    }
+
+
+PEOPLE = [
+    _person(1, "Luis García", 120, pitch_hand="R"),
+    _person(2, "Luis Garcia", 117, position_type="Infielder"),
+    _person(3, "Cameron Smith", 117, position_type="Outfielder", useName="Cam", lastName="Smith"),
+]
+
+
+class PlayerDirectoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = Path(self.temp_dir.name) / "player-directory.json.gz"
+        patches = [
+            patch.dict(
+                "os.environ",
+                {
+                    player_directory_module.PLAYER_DIRECTORY_DISABLE_ENV: "0",
+                    player_directory_module.PLAYER_DIRECTORY_PATH_ENV: str(self.path),
+                },
+            ),
+            patch.object(player_directory_module, "_DEFAULT_DIRECTORY", None),
+            patch.object(player_directory_module, "_REFRESH_ATTEMPTED_ON", None),
+        ]
+        for active_patch in patches:
+            active_patch.start()
+            self.addCleanup(active_patch.stop)
+
+    def test_find_uses_normalized_names_team_and_position(self) -> None:
+        directory = PlayerDirectory.from_people(PEOPLE, season=2026, refreshed_on="2026-07-12")
+
+        self.assertEqual(directory.find("luis garcia", position_type="Pitcher")["id"], 1)
+        self.assertEqual(directory.find("Luis Garcia", team_id=117)["id"], 2)
+        self.assertEqual(directory.find("Cam Smith")["id"], 3)
+        self.assertIsNone(directory.find("Luis Garcia", team_id=999))
+        self.assertIsNone(directory.find("Nobody"))
+        self.assertIsNone(directory.find("Cam Smith", position_type="Pitcher"))
+
+    def test_pitcher_lookups_skip_same_name_hitters(self) -> None:
+        directory = PlayerDirectory.from_people(PEOPLE[1:], season=2026, refreshed_on=dt.date.today().isoformat())
+        pitcher = {"id": 1, "fullName": "Luis Garcia", "currentTeam": {"id": 120}}
+        with patch.object(player_directory_module, "_DEFAULT_DIRECTORY", directory), patch.object(
+            report_data_module, "PITCHER_ID_CACHE", {}
+        ), patch.object(oddapi_module, "_pitcher_team_cache", {}), patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.lookup_player", return_value=[pitcher]
+        ) as lookup_mock, patch(
+            "mlb_pitcher_report.odds.oddapi.statsapi.get", return_value={"teams": [{"name": "Washington Nationals"}]}
+        ) as team_mock:
+            pitcher_id = report_data_module.resolve_pitcher_id("Luis Garcia")
+            team_name = oddapi_module.get_pitcher_team("Luis Garcia")
+
+        self.assertEqual(lookup_mock.call_count, 2)
+        self.assertEqual(pitcher_id, 1)
+        self.assertEqual(team_mock.call_args.args[1], {"teamId": 120})
+        self.assertEqual(team_name, "Washington Nationals")
+
+    def test_directory_is_fetched_once_per_day_and_persisted(self) -> None:
+        with patch(
+            "mlb_pitcher_report.shared.player_directory.statsapi.get", return_value={"people": PEOPLE}
+        ) as get_mock:
+            first = get_player_directory(dt.date(2026, 7, 12))
+            second = get_player_directory(dt.date(2026, 7, 12))
+        self.assertIs(first, second)
+        get_mock.assert_called_once_with("sports_players", {"sportId": 1, "season": 2026})
+
+        player_directory_module._DEFAULT_DIRECTORY = None
+        with patch("mlb_pitcher_report.shared.player_directory.statsapi.get") as get_mock:
+            reloaded = get_player_directory(dt.date(2026, 7, 12))
+        get_mock.assert_not_called()
+        self.assertEqual(reloaded.find("Luis Garcia", team_id=120)["pitch_hand"], "R")
+
+        with patch(
+            "mlb_pitcher_report.shared.player_directory.statsapi.get", side_effect=RuntimeError("down")
+        ) as get_mock:
+            stale = get_player_directory(dt.date(2026, 7, 13))
+            get_player_directory(dt.date(2026, 7, 13))
+        get_mock.assert_called_once()
+        self.assertEqual(stale.refreshed_on, "2026-07-12")
+
+    def test_name_resolution_is_a_directory_hit(self) -> None:
+        directory = PlayerDirectory.from_people(PEOPLE, season=2026, refreshed_on=dt.date.today().isoformat())
+        with patch.object(player_directory_module, "_DEFAULT_DIRECTORY", directory), patch.object(
+            report_data_module, "PITCHER_ID_CACHE", {}
+        ), patch.object(report_data_module, "PITCHER_LOOKUP_CACHE", {}), patch.object(
+            report_data_module, "LINEUP_NAME_LOOKUP_CACHE", {}
+        ), patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.lookup_player"
+        ) as lookup_mock, patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.get"
+        ) as get_mock:
+            pitcher_id = report_data_module.resolve_pitcher_id("Luis Garcia")
+            context = report_data_module.fetch_pitcher_context("Luis Garcia", 2026)
+            lineup_ids = report_data_module.resolve_lineup_player_ids([{"name": "Cam Smith"}], [], 117)
+
+        lookup_mock.assert_not_called()
+        get_mock.assert_not_called()
+        self.assertEqual(pitcher_id, 1)
+        self.assertEqual(context, {"id": 1, "name": "Luis García", "hand": "R"})
+        self.assertEqual(lineup_ids, [3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,12 +2,17 @@ import datetime as dt
 import unittest
 from unittest.mock import patch
 
+import requests
+
 from mlb_pitcher_report.shared import report_data as report_data_module
 from mlb_pitcher_report.shared.report_data import (
+    build_people_base_hydrate,
     extract_batter_vs_pitcher_stat_lines_from_plays,
     fetch_pitcher_historical_batter_vs_pitcher_stat_lines,
+    fetch_people_stats_batch,
     fetch_people_stats_map,
     parse_vs_pitcher_stats,
+    plan_people_chunks,
     resolve_effective_report_date_and_schedule,
 )
 
@@ -97,8 +102,10 @@ class ReportDataDateResolutionTests(unittest.TestCase):
         self.assertEqual(stats["RBI"], 1)
         self.assertAlmostEqual(stats["AVG"], 1 / 3, places=6)
 
-    def test_fetch_people_stats_map_includes_end_date_in_hydrate(self) -> None:
-        with patch("mlb_pitcher_report.shared.report_data.statsapi.get", return_value={"people": [{"id": 123}]}) as get_mock:
+    def test_fetch_people_stats_map_splits_player_and_matchup_hydrates(self) -> None:
+        with patch.dict(report_data_module.PEOPLE_STATS_CACHE, clear=True), patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.get", return_value={"people": [{"id": 123}]}
+        ) as get_mock:
             fetch_people_stats_map(
                 [123],
                 season=2026,
@@ -107,10 +114,108 @@ class ReportDataDateResolutionTests(unittest.TestCase):
                 stats_end_date=dt.date(2026, 7, 10),
             )
 
-        params = get_mock.call_args.args[1]
-        self.assertIn("endDate=2026-07-10", params["hydrate"])
-        self.assertIn("sitCodes=[vr]", params["hydrate"])
-        self.assertIn("opposingPlayerId=456", params["hydrate"])
+        hydrates = sorted((call.args[1]["hydrate"] for call in get_mock.call_args_list), key=len)
+        self.assertEqual(len(hydrates), 2)
+        vs_hydrate, base_hydrate = hydrates
+        self.assertIn("endDate=2026-07-10", base_hydrate)
+        self.assertIn("sitCodes=[vr]", base_hydrate)
+        self.assertIn("type=[season,gameLog,statSplits]", base_hydrate)
+        self.assertNotIn("opposingPlayerId", base_hydrate)
+        self.assertIn("type=[vsPlayer]", vs_hydrate)
+        self.assertIn("opposingPlayerId=456", vs_hydrate)
+        self.assertIn("endDate=2026-07-10", vs_hydrate)
+
+    def test_fetch_people_stats_batch_coalesces_offenses_sharing_a_hydrate(self) -> None:
+        def people_payload(_endpoint, params, **_kwargs):
+            return {"people": [{"id": int(person_id)} for person_id in params["personIds"].split(",")]}
+
+        with patch.dict(report_data_module.PEOPLE_STATS_CACHE, clear=True), patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.get", side_effect=people_payload
+        ) as get_mock:
+            fetch_people_stats_batch(
+                [
+                    ([1, 2, 3], 2026, "R", None, dt.date(2026, 7, 10)),
+                    ([3, 4], 2026, "R", None, dt.date(2026, 7, 10)),
+                    ([5], 2026, "L", None, dt.date(2026, 7, 10)),
+                ]
+            )
+            cached = fetch_people_stats_map([1, 2, 3, 4], 2026, "R", None, dt.date(2026, 7, 10))
+
+        self.assertEqual(get_mock.call_count, 2)
+        requested = sorted(call.args[1]["personIds"] for call in get_mock.call_args_list)
+        self.assertEqual(requested, ["1,2,3,4", "5"])
+        self.assertEqual(sorted(cached), [1, 2, 3, 4])
+
+    def test_player_blocks_are_shared_across_opposing_pitchers(self) -> None:
+        def people_payload(_endpoint, params, **_kwargs):
+            block_type = "vsPlayer" if "vsPlayer" in params["hydrate"] else "season"
+            return {
+                "people": [
+                    {"id": int(person_id), "stats": [{"type": {"displayName": block_type}, "splits": []}]}
+                    for person_id in params["personIds"].split(",")
+                ]
+            }
+
+        end_date = dt.date(2026, 7, 10)
+        with patch.dict(report_data_module.PEOPLE_STATS_CACHE, clear=True), patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.get", side_effect=people_payload
+        ) as get_mock:
+            first = fetch_people_stats_map([1, 2], 2026, "R", 456, end_date)
+            second = fetch_people_stats_map([1, 2], 2026, "R", 789, end_date)
+
+        self.assertEqual(get_mock.call_count, 3)
+        base_calls = [call for call in get_mock.call_args_list if "vsPlayer" not in call.args[1]["hydrate"]]
+        self.assertEqual(len(base_calls), 1)
+        for people in (first, second):
+            self.assertEqual(
+                [block["type"]["displayName"] for block in people[1]["stats"]],
+                ["season", "vsPlayer"],
+            )
+
+    def test_plan_people_chunks_respects_id_and_url_limits(self) -> None:
+        hydrate = build_people_base_hydrate(2026, "R", dt.date(2026, 7, 10))
+        person_ids = list(range(600000, 600100))
+
+        by_count = plan_people_chunks(person_ids, hydrate, max_ids=30)
+        self.assertEqual([len(chunk) for chunk in by_count], [30, 30, 30, 10])
+
+        by_url = plan_people_chunks(person_ids, hydrate, max_ids=100, max_url_length=400)
+        self.assertEqual([person_id for chunk in by_url for person_id in chunk], person_ids)
+        self.assertGreater(len(by_url), 1)
+        for chunk in by_url:
+            url = f"{report_data_module.PEOPLE_ENDPOINT_URL}?personIds={','.join(map(str, chunk))}&hydrate={hydrate}"
+            self.assertLessEqual(len(url), 400)
+
+    def test_oversized_people_chunk_is_split_and_retried(self) -> None:
+        too_large = requests.Response()
+        too_large.status_code = 414
+
+        def people_payload(_endpoint, params, **_kwargs):
+            person_ids = params["personIds"].split(",")
+            if len(person_ids) > 2:
+                raise requests.HTTPError("URI too long", response=too_large)
+            return {"people": [{"id": int(person_id)} for person_id in person_ids]}
+
+        with patch.dict(report_data_module.PEOPLE_STATS_CACHE, clear=True), patch.object(
+            report_data_module, "PEOPLE_CHUNK_SIZE", 8
+        ), patch("mlb_pitcher_report.shared.report_data.statsapi.get", side_effect=people_payload):
+            people = fetch_people_stats_map([1, 2, 3, 4, 5], 2026, None, None)
+            chunk_size = report_data_module.PEOPLE_CHUNK_SIZE
+
+        self.assertEqual(sorted(people), [1, 2, 3, 4, 5])
+        self.assertEqual(chunk_size, 8)
+
+    def test_transient_people_failures_are_not_split(self) -> None:
+        unavailable = requests.Response()
+        unavailable.status_code = 503
+        errors = [requests.ConnectionError("reset"), requests.HTTPError("unavailable", response=unavailable)]
+        for error in errors:
+            with self.subTest(error=error), patch.dict(report_data_module.PEOPLE_STATS_CACHE, clear=True), patch(
+                "mlb_pitcher_report.shared.report_data.statsapi.get", side_effect=error
+            ) as get_mock:
+                with self.assertRaises(type(error)):
+                    fetch_people_stats_map([1, 2, 3, 4, 5], 2026, None, None)
+                self.assertEqual(get_mock.call_count, 1)
 
     def test_parse_vs_pitcher_stats_can_skip_same_day_subtraction_for_dated_splits(self) -> None:
         indexed_blocks = {
@@ -329,7 +434,7 @@ class ReportDataDateResolutionTests(unittest.TestCase):
             side_effect=lambda pitcher_id, season: game_logs_by_season.get(season, []),
         ), patch(
             "mlb_pitcher_report.shared.report_data.fetch_game_batter_vs_pitcher_stat_lines",
-            side_effect=lambda game_id, pitcher_id: game_lines.get(game_id, {}),
+            side_effect=lambda game_id, pitcher_id, **_kwargs: game_lines.get(game_id, {}),
         ) as game_bvp_mock:
             stats = fetch_pitcher_historical_batter_vs_pitcher_stat_lines(
                 30,
@@ -0,0 +1,126 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from mlb_pitcher_report.shared import response_cache as response_cache_module
+from mlb_pitcher_report.shared import report_data as report_data_module
+from mlb_pitcher_report.shared.response_cache import ResponseCache, build_cache_key, cached_fetch
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(Path(self.temp_dir.name) / "cache.sqlite3")
+
+    def tearDown(self) -> None:
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def _use_cache(self):
+        return patch.object(response_cache_module, "get_response_cache", return_value=self.cache)
+
+    def test_cache_key_ignores_param_order(self) -> None:
+        self.assertEqual(
+            build_cache_key("people", {"personIds": 1, "hydrate": "x"}),
+            build_cache_key("people", {"hydrate": "x", "personIds": 1}),
+        )
+        self.assertNotEqual(build_cache_key("people", {"personIds": 1}), build_cache_key("team", {"personIds": 1}))
+
+    def test_ttl_entries_expire_and_immutable_entries_do_not(self) -> None:
+        self.cache.put("team", {"teamId": 1}, {"teams": [1]}, ttl_seconds=60, now=1000)
+        self.cache.put("game", {"gamePk": 2}, {"final": True}, ttl_seconds=None, now=1000)
+
+        self.assertEqual(self.cache.get("team", {"teamId": 1}, now=1059), {"teams": [1]})
+        self.assertIs(self.cache.get("team", {"teamId": 1}, now=1061), response_cache_module._MISSING)
+        self.assertEqual(self.cache.get("game", {"gamePk": 2}, now=10**12), {"final": True})
+        self.assertEqual(self.cache.purge_expired(now=1061), 1)
+
+    def test_cached_fetch_survives_new_cache_instance(self) -> None:
+        calls = []
+
+        def fetcher():
+            calls.append(1)
+            return {"allPlays": [1, 2]}
+
+        with self._use_cache():
+            first = cached_fetch("game_playByPlay", {"gamePk": 5}, fetcher, immutable=True)
+        self.cache.close()
+        self.cache = ResponseCache(self.cache.path)
+        with self._use_cache():
+            second = cached_fetch("game_playByPlay", {"gamePk": 5}, fetcher, immutable=True)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(calls), 1)
+
+    def test_cached_fetch_skips_values_rejected_by_should_store(self) -> None:
+        payloads = iter([{"people": []}, {"people": [{"id": 1}]}])
+        with self._use_cache():
+            for _ in range(2):
+                value = cached_fetch(
+                    "people",
+                    {"personIds": 1},
+                    lambda: next(payloads),
+                    ttl_seconds=60,
+                    should_store=lambda payload: bool(payload["people"]),
+                )
+
+        self.assertEqual(value, {"people": [{"id": 1}]})
+
+    def test_completed_game_play_by_play_is_fetched_once_across_processes(self) -> None:
+        payload = {
+            "allPlays": [
+                {
+                    "result": {"type": "atBat", "eventType": "single", "rbi": 0, "description": "long text"},
+                    "matchup": {"batter": {"id": 10, "fullName": "A"}, "pitcher": {"id": 20}},
+                    "playEvents": [{"details": {}}],
+                }
+            ]
+        }
+        with self._use_cache(), patch(
+            "mlb_pitcher_report.shared.report_data.statsapi.get",
+            return_value=payload,
+        ) as get_mock:
+            with patch.object(report_data_module, "GAME_BVP_LINE_CACHE", {}):
+                first = report_data_module.fetch_game_batter_vs_pitcher_stat_lines(1, 20, completed=True)
+            with patch.object(report_data_module, "GAME_BVP_LINE_CACHE", {}):
+                second = report_data_module.fetch_game_batter_vs_pitcher_stat_lines(1, 20, completed=True)
+
+        self.assertEqual(get_mock.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(first[10]["H"], 1)
+
+    def test_cache_is_disabled_by_environment(self) -> None:
+        with patch.dict(os.environ, {response_cache_module.RESPONSE_CACHE_DISABLE_ENV: "1"}):
+            self.assertIsNone(response_cache_module.get_response_cache())
+
+
+    def test_failed_store_open_is_remembered_without_touching_the_environment(self) -> None:
+        opened = []
+
+        def open_store(path):
+            opened.append(path)
+            raise sqlite3.OperationalError("unable to open database file")
+
+        singleton = response_cache_module.PersistentStoreSingleton(
+            "Test store",
+            open_store,
+            default_path=Path(self.temp_dir.name) / "missing" / "store.sqlite3",
+            path_env="MLB_REPORT_TEST_STORE_PATH",
+            disable_env="MLB_REPORT_DISABLE_TEST_STORE",
+        )
+        with patch.dict(os.environ, {}, clear=False), patch("builtins.print"):
+            self.assertIsNone(singleton.get())
+            self.assertIsNone(singleton.get())
+            self.assertFalse(singleton.enabled())
+            self.assertNotIn("MLB_REPORT_DISABLE_TEST_STORE", os.environ)
+        self.assertEqual(len(opened), 1)
+
+        singleton.reset()
+        self.assertTrue(singleton.enabled())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import patch
+
+from mlb_pitcher_report import run_slate as run_slate_module
+
+
+class RunSlateTests(unittest.TestCase):
+    def test_run_slate_resolves_schedule_once_and_renders_every_report(self) -> None:
+        schedule = [{"status": "Scheduled", "away_id": 1, "home_id": 2}]
+        with patch.object(
+            run_slate_module,
+            "resolve_effective_report_date_and_schedule",
+            return_value=("07/12/2026", schedule),
+        ) as resolve_mock, patch.object(run_slate_module, "prefetch_slate") as prefetch_mock, patch.object(
+            run_slate_module.pitchers, "render_report"
+        ) as pitchers_mock, patch.object(run_slate_module.batters, "render_report") as batters_mock, patch.object(
+            run_slate_module.matchups, "render_report"
+        ) as matchups_mock:
+            failed = run_slate_module.run_slate("07/12/2026", "n", write_root=False)
+
+        self.assertEqual(failed, [])
+        resolve_mock.assert_called_once()
+        prefetch_mock.assert_called_once()
+        pitchers_mock.assert_called_once_with("07/12/2026", schedule, "n", write_root=False)
+        batters_mock.assert_called_once_with(
+            "07/12/2026", schedule, write_root=False, prefetch=False, incremental=False
+        )
+        matchups_mock.assert_called_once_with(
+            "07/12/2026", schedule, write_root=False, prefetch=False, incremental=False
+        )
+
+    def test_run_slate_keeps_rendering_after_a_report_failure(self) -> None:
+        with patch.object(
+            run_slate_module,
+            "resolve_effective_report_date_and_schedule",
+            return_value=("07/12/2026", []),
+        ), patch.object(run_slate_module, "prefetch_slate"), patch.object(
+            run_slate_module.pitchers, "render_report", side_effect=RuntimeError("boom")
+        ), patch.object(run_slate_module.batters, "render_report") as batters_mock, patch.object(
+            run_slate_module.matchups, "render_report"
+        ) as matchups_mock:
+            failed = run_slate_module.run_slate("07/12/2026", "y")
+
+        self.assertEqual(failed, ["pitchers"])
+        batters_mock.assert_called_once()
+        matchups_mock.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
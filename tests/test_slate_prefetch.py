@@ -0,0 +1,98 @@
+import datetime as dt
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from mlb_pitcher_report.shared.slate_prefetch import prefetch_slate
+
+SCHEDULE = [
+    {
+        "away_id": 1,
+        "home_id": 2,
+        "away_name": "Away One",
+        "home_name": "Home Two",
+        "away_probable_pitcher": "Pitcher A",
+        "home_probable_pitcher": "Pitcher B",
+    },
+    {
+        "away_id": 3,
+        "home_id": 4,
+        "away_name": "Away Three",
+        "home_name": "Home Four",
+        "away_probable_pitcher": "Pitcher C",
+        "home_probable_pitcher": "",
+    },
+]
+
+
+class SlatePrefetchTests(unittest.TestCase):
+    def test_prefetch_fans_out_dependency_chains_with_bounded_concurrency(self) -> None:
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        people_batches = []
+
+        def slow(result):
+            def wrapper(*args, **kwargs):
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                time.sleep(0.02)
+                with lock:
+                    state["active"] -= 1
+                return result(*args) if callable(result) else result
+
+            return wrapper
+
+        def people_stats_batch(people_requests):
+            people_batches.append(
+                [
+                    (tuple(person_ids), pitch_hand, pitcher_id, stats_end_date)
+                    for person_ids, _season, pitch_hand, pitcher_id, stats_end_date in people_requests
+                ]
+            )
+
+        roster = [{"person": {"id": 10}, "position": {"type": "Outfielder"}, "status": {"code": "A"}}]
+        with patch.multiple(
+            "mlb_pitcher_report.shared.report_data",
+            build_espn_event_snapshot_lookup=slow({("away one", "home two"): {"event_id": "e1"}}),
+            fetch_espn_summary=slow({}),
+            fetch_team_meta=slow({}),
+            fetch_team_roster=slow(roster),
+            fetch_pitcher_context=slow(lambda name, season: {"id": ord(name[-1]), "hand": "R"}),
+            fetch_people_stats_batch=slow(people_stats_batch),
+        ):
+            prefetcher = prefetch_slate(
+                SCHEDULE,
+                "07/12/2026",
+                concurrency=3,
+                people_stats_end_dates=[dt.date(2026, 7, 11)],
+            )
+
+        self.assertLessEqual(state["peak"], 3)
+        self.assertGreater(state["peak"], 1)
+        self.assertEqual(prefetcher.failures, [])
+        self.assertEqual(len(people_batches), 1)
+        self.assertEqual(len(people_batches[0]), 4)
+        self.assertIn(((10,), "R", ord("B"), dt.date(2026, 7, 11)), people_batches[0])
+        self.assertIn(((10,), None, None, dt.date(2026, 7, 11)), people_batches[0])
+
+    def test_prefetch_failures_are_recorded_not_raised(self) -> None:
+        def boom(*_args, **_kwargs):
+            raise RuntimeError("offline")
+
+        with patch.multiple(
+            "mlb_pitcher_report.shared.report_data",
+            build_espn_event_snapshot_lookup=boom,
+            fetch_team_meta=boom,
+            fetch_team_roster=boom,
+            fetch_pitcher_context=boom,
+        ):
+            prefetcher = prefetch_slate(SCHEDULE, "07/12/2026", people_stats_end_dates=[None])
+
+        self.assertIn(("espn_scoreboard", "07/12/2026"), prefetcher.failures)
+        self.assertIn(("team_roster", 1), prefetcher.failures)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+from mlb_pitcher_report.shared import http_client
+from mlb_pitcher_report.shared.plate_appearances import PLATE_APPEARANCE_STORE_DISABLE_ENV
+from mlb_pitcher_report.shared.slate_snapshot import (
+    SNAPSHOT_MODE_RECORD,
+    SNAPSHOT_MODE_REPLAY,
+    SlateSnapshot,
+    build_request_key,
+    split_snapshot_flags,
+    use_slate_snapshot,
+)
+
+
+def _response(body: str, status: int = 200, headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body.encode("utf-8")
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    return response
+
+
+class SlateSnapshotTests(unittest.TestCase):
+    def test_request_key_merges_query_and_params_and_drops_api_keys(self) -> None:
+        inline = build_request_key("https://example.test/odds?markets=k&apiKey=secret", {"regions": "us"})
+        separate = build_request_key("https://example.test/odds", {"regions": "us", "markets": "k", "apiKey": "other"})
+
+        self.assertEqual(inline, separate)
+        self.assertNotIn("secret", inline)
+
+    def test_record_then_replay_round_trips_through_compressed_file(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "slate.json.gz"
+            session_get = patch.object(
+                http_client,
+                "_session_get",
+                return_value=_response('{"dates": []}', headers={"x-requests-remaining": "42", "Server": "x"}),
+            )
+            with session_get as get_mock:
+                with use_slate_snapshot("07/12/2026", SNAPSHOT_MODE_RECORD, path) as snapshot:
+                    http_client.http_get("https://statsapi.test/schedule", params={"date": "07/12/2026"})
+                self.assertEqual(len(snapshot), 1)
+                get_mock.assert_called_once()
+
+            with patch.object(http_client, "_session_get", side_effect=AssertionError("network used")):
+                with use_slate_snapshot("07/12/2026", SNAPSHOT_MODE_REPLAY, path) as replay:
+                    response = http_client.http_get("https://statsapi.test/schedule", params={"date": "07/12/2026"})
+                    with self.assertRaises(requests.ConnectionError):
+                        http_client.http_get("https://statsapi.test/people/1")
+
+            self.assertEqual(response.json(), {"dates": []})
+            self.assertEqual(response.headers["x-requests-remaining"], "42")
+            self.assertNotIn("Server", response.headers)
+            self.assertEqual(len(replay.misses), 1)
+            self.assertIsNone(http_client._REQUEST_INTERCEPTOR)
+
+    def test_snapshot_session_disables_persistent_stores_and_restores_environment(self) -> None:
+        with patch.dict(os.environ, {PLATE_APPEARANCE_STORE_DISABLE_ENV: "0"}):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                with use_slate_snapshot("07/12/2026", SNAPSHOT_MODE_RECORD, Path(temp_dir) / "s.json.gz"):
+                    self.assertEqual(os.environ[PLATE_APPEARANCE_STORE_DISABLE_ENV], "1")
+            self.assertEqual(os.environ[PLATE_APPEARANCE_STORE_DISABLE_ENV], "0")
+
+    def test_load_rejects_unknown_version(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = SlateSnapshot({}).save(Path(temp_dir) / "s.json.gz")
+            with patch("mlb_pitcher_report.shared.slate_snapshot.SNAPSHOT_FORMAT_VERSION", 99):
+                with self.assertRaises(ValueError):
+                    SlateSnapshot.load(path)
+
+    def test_split_snapshot_flags(self) -> None:
+        self.assertEqual(
+            split_snapshot_flags(["--exact", "--from-snapshot=/tmp/a.json.gz"]),
+            (["--exact"], SNAPSHOT_MODE_REPLAY, "/tmp/a.json.gz"),
+        )
+        self.assertEqual(split_snapshot_flags(["--snapshot"]), ([], SNAPSHOT_MODE_RECORD, None))
+        self.assertEqual(split_snapshot_flags(["--no-root"]), (["--no-root"], None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from mlb_pitcher_report import run_slate as run_slate_module
+from mlb_pitcher_report.shared import slate_state
+from mlb_pitcher_report.shared.slate_state import IncrementalSlateCache, build_game_state_signature
+
+
+def _summary_with_lineup(names):
+    return {
+        "rosters": [
+            {
+                "team": {"abbreviation": "BOS"},
+                "roster": [
+                    {"athlete": {"fullName": name}, "batOrder": index + 1, "starter": True}
+                    for index, name in enumerate(names)
+                ],
+            }
+        ]
+    }
+
+
+class SlateStateTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = {
+            "game_id": 1,
+            "status": "Pre-Game",
+            "away_probable_pitcher": "A Pitcher",
+            "home_probable_pitcher": "H Pitcher",
+        }
+        self.lineup = [f"Batter {index}" for index in range(9)]
+
+    def test_signature_tracks_status_pitchers_scores_and_lineups(self) -> None:
+        base = build_game_state_signature(self.game, {}, _summary_with_lineup(self.lineup))
+
+        self.assertEqual(base, build_game_state_signature(dict(self.game), {}, _summary_with_lineup(self.lineup)))
+        self.assertNotEqual(base, build_game_state_signature({**self.game, "status": "In Progress"}, {}, _summary_with_lineup(self.lineup)))
+        self.assertNotEqual(base, build_game_state_signature({**self.game, "home_probable_pitcher": "X"}, {}, _summary_with_lineup(self.lineup)))
+        self.assertNotEqual(base, build_game_state_signature(self.game, {"away_score": 1}, _summary_with_lineup(self.lineup)))
+        self.assertNotEqual(base, build_game_state_signature(self.game, {}, _summary_with_lineup(self.lineup[::-1])))
+        self.assertNotEqual(base, build_game_state_signature(self.game, {}, None))
+
+    def test_cache_reuses_only_games_whose_signature_is_unchanged(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "batters.pickle"
+            first = IncrementalSlateCache("batters", "07/12/2026", {1: "a", 2: "b"}, fingerprint="f", path=path)
+            self.assertIsNone(first.get(1))
+            first.put(1, [{"Player": "One"}])
+            first.put(2, [{"Player": "Two"}])
+            first.save()
+
+            second = IncrementalSlateCache("batters", "07/12/2026", {1: "a", 2: "changed", 3: "c"}, fingerprint="f", path=path)
+            schedule = [{"game_id": 1}, {"game_id": 2}, {"game_id": 3}]
+            self.assertEqual([game["game_id"] for game in second.stale_games(schedule)], [2, 3])
+            self.assertEqual(second.get(1), [{"Player": "One"}])
+            self.assertIsNone(second.get(2))
+            self.assertEqual((second.hits, second.misses), (1, 1))
+
+            other_code = IncrementalSlateCache("batters", "07/12/2026", {1: "a"}, fingerprint="g", path=path)
+            self.assertIsNone(other_code.get(1))
+
+    def test_in_progress_games_are_rebuilt_even_when_the_score_is_unchanged(self) -> None:
+        live_game = {**self.game, "game_id": 2, "status": "In Progress"}
+        schedule = [self.game, live_game]
+
+        def slate_state_with_hits(hits):
+            summary = _summary_with_lineup(self.lineup)
+            return {
+                1: (self.game, {}, summary),
+                2: (live_game, {"away_score": 1, "home_score": 0, "away_hits": hits}, summary),
+            }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "batters.pickle"
+            with patch.object(slate_state, "fetch_slate_espn_state", return_value=slate_state_with_hits(3)):
+                first = IncrementalSlateCache(
+                    "batters", "07/12/2026", slate_state.build_slate_signatures(schedule, "07/12/2026"), path=path
+                )
+            first.put(1, [{"Player": "One"}])
+            first.put(2, [{"Player": "Live", "H": 1}])
+            first.save()
+
+            with patch.object(slate_state, "fetch_slate_espn_state", return_value=slate_state_with_hits(5)):
+                second = IncrementalSlateCache(
+                    "batters", "07/12/2026", slate_state.build_slate_signatures(schedule, "07/12/2026"), path=path
+                )
+
+        self.assertEqual(second.get(1), [{"Player": "One"}])
+        self.assertIsNone(second.get(2))
+        self.assertEqual([game["game_id"] for game in second.stale_games(schedule)], [2])
+
+    def test_save_drops_games_not_used_in_the_current_run(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "matchups.pickle"
+            first = IncrementalSlateCache("matchups", "07/12/2026", {1: "a", 2: "b"}, path=path)
+            first.put(1, "one")
+            first.put(2, "two")
+            first.save()
+
+            second = IncrementalSlateCache("matchups", "07/12/2026", {1: "a", 2: "b"}, path=path)
+            second.get(1)
+            second.save()
+
+            third = IncrementalSlateCache("matchups", "07/12/2026", {1: "a", 2: "b"}, path=path)
+            self.assertEqual(third.get(1), "one")
+            self.assertIsNone(third.get(2))
+
+    def test_source_fingerprint_changes_with_source_contents(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "report.py"
+            source.write_text("A = 1\n", encoding="utf-8")
+            before = slate_state.source_fingerprint([source])
+            source.write_text("A = 2\n", encoding="utf-8")
+            self.assertNotEqual(before, slate_state.source_fingerprint([source]))
+
+    def test_incremental_run_slate_leaves_prefetch_to_each_report(self) -> None:
+        schedule = [{"status": "Scheduled", "away_id": 1, "home_id": 2}]
+        with patch.object(
+            run_slate_module,
+            "resolve_effective_report_date_and_schedule",
+            return_value=("07/12/2026", schedule),
+        ), patch.object(run_slate_module, "prefetch_slate") as prefetch_mock, patch.object(
+            run_slate_module.pitchers, "render_report"
+        ), patch.object(run_slate_module.batters, "render_report") as batters_mock, patch.object(
+            run_slate_module.matchups, "render_report"
+        ):
+            run_slate_module.run_slate("07/12/2026", "n", incremental=True)
+
+        prefetch_mock.assert_not_called()
+        batters_mock.assert_called_once_with("07/12/2026", schedule, write_root=True, prefetch=True, incremental=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import re
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+RUN_BENCHMARKS_ENV = "MLB_REPORT_RUN_BENCHMARKS"
+STARTUP_BUDGET_ENV = "MLB_REPORT_STARTUP_BUDGET_SECONDS"
+DEFAULT_STARTUP_BUDGET_SECONDS = 3.0
+ENTRY_POINTS = (
+    "mlb_pitcher_report.reports.pitchers",
+    "mlb_pitcher_report.reports.batters",
+    "mlb_pitcher_report.reports.matchups",
+)
+DEFERRED_MODULES = ("pybaseball", "bs4", "mlb_pitcher_report.odds.oddapi")
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def _loaded_deferred_modules(module_name: str):
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; import {module_name}; "
+            f"print('\\n'.join(name for name in {DEFERRED_MODULES!r} if name in sys.modules))",
+        ],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+def _import_times(module_name: str):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    cumulative_us = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match:
+            cumulative_us[match.group(4)] = int(match.group(2))
+    return cumulative_us
+
+
+class StartupTests(unittest.TestCase):
+    def test_report_entry_points_keep_optional_imports_out_of_sys_modules(self) -> None:
+        for entry_point in ENTRY_POINTS:
+            with self.subTest(entry_point=entry_point):
+                self.assertEqual(_loaded_deferred_modules(entry_point), [])
+
+    @unittest.skipUnless(os.environ.get(RUN_BENCHMARKS_ENV), f"set {RUN_BENCHMARKS_ENV}=1 to run timing benchmarks")
+    def test_report_entry_points_fit_the_startup_budget(self) -> None:
+        budget_seconds = float(os.environ.get(STARTUP_BUDGET_ENV) or DEFAULT_STARTUP_BUDGET_SECONDS)
+        for entry_point in ENTRY_POINTS:
+            with self.subTest(entry_point=entry_point):
+                cumulative_us = _import_times(entry_point)
+                self.assertLess(cumulative_us[entry_point] / 1_000_000, budget_seconds)
+
+
+if __name__ == "__main__":
+    unittest.main()
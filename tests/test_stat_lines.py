@@ -0,0 +1,219 @@
+import datetime as dt
+import tracemalloc
+import unittest
+
+import numpy as np
+
+from mlb_pitcher_report.shared.report_data import (
+    aggregate_stat_lines,
+    aggregate_stat_lines_batch,
+    build_pitcher_form_from_game_logs,
+    compute_hit_streak,
+    compute_recent_metrics,
+    compute_recent_metrics_batch,
+    extract_game_logs,
+    parse_team_split_stats,
+)
+from mlb_pitcher_report.shared.stat_lines import BatterGameLogRow, GameLog, PitcherGameLogRow, StatLineArray
+
+SLATE_TEAMS = 30
+ROSTER_SIZE = 26
+SEASON_GAMES = 162
+
+
+def _log(day: int, game_pk: int, *, at_bats: int, hits: int, strike_outs: int = 0):
+    return {
+        "date": dt.date(2026, 7, day),
+        "gamePk": game_pk,
+        "plateAppearances": at_bats + 1,
+        "atBats": at_bats,
+        "hits": hits,
+        "walks": 1,
+        "hitByPitch": 0,
+        "sacFlies": 0,
+        "totalBases": hits,
+        "strikeOuts": strike_outs,
+        "homeRuns": 0,
+        "rbi": 0,
+    }
+
+
+class StatLineArrayTests(unittest.TestCase):
+    def test_sum_subtract_and_rates_are_vectorized(self) -> None:
+        lines = StatLineArray.from_records(
+            [
+                {"PA": 5, "AB": 4, "H": 2, "BB": 1, "TB": 3, "K": 1},
+                {"PA": 4, "AB": 0, "BB": 4},
+            ]
+        )
+        np.testing.assert_array_equal(lines["PA"], [5, 4])
+        rates = lines.rates()
+        self.assertAlmostEqual(rates["AVG"][0], 0.5)
+        self.assertTrue(np.isnan(rates["AVG"][1]))
+        self.assertAlmostEqual(rates["OBP"][1], 1.0)
+        self.assertAlmostEqual(rates["K%"][0], 20.0)
+
+        total = lines.total()
+        np.testing.assert_array_equal(total["BB"], [5])
+        adjusted = total.subtract(StatLineArray.from_records([{"PA": 20, "H": 1}]))
+        np.testing.assert_array_equal(adjusted["PA"], [0])
+        np.testing.assert_array_equal(adjusted["H"], [1])
+
+    def test_aggregate_stat_lines_keeps_dict_shape(self) -> None:
+        aggregated = aggregate_stat_lines([{"games": 2, "PA": 4, "AB": 4, "H": 1, "TB": 4}, {"games": 1}])
+        self.assertEqual(aggregated["games"], 3)
+        self.assertEqual(aggregated["AVG"], 0.25)
+        self.assertEqual(aggregated["OPS"], 0.25 + 1.0)
+        self.assertIsNone(aggregate_stat_lines([])["AVG"])
+        self.assertIsInstance(aggregated["PA"], int)
+
+    def test_batched_aggregates_match_per_group_aggregates(self) -> None:
+        groups = [
+            [{"PA": 4, "AB": 3, "H": 1, "BB": 1}, {"PA": 3, "AB": 3, "H": 2, "TB": 5}],
+            [],
+            [{"PA": 5, "AB": 5, "K": 3}],
+        ]
+        self.assertEqual(aggregate_stat_lines_batch(groups), [aggregate_stat_lines(group) for group in groups])
+
+    def test_batched_recent_metrics_match_single_player_windows(self) -> None:
+        report_date = dt.date(2026, 7, 20)
+        logs_by_player = {
+            1: [_log(day, 100 + day, at_bats=4, hits=day % 3, strike_outs=1) for day in range(1, 21)],
+            2: [_log(19, 5, at_bats=3, hits=1), _log(19, 4, at_bats=4, hits=0), _log(2, 1, at_bats=2, hits=2)],
+            3: [],
+        }
+        windows = {"season": {}, "recent7": {"max_games": 7}, "recent14": {"window_days": 14}}
+        batched = compute_recent_metrics_batch(logs_by_player, report_date, windows)
+
+        for player_id, logs in logs_by_player.items():
+            for name, window in windows.items():
+                with self.subTest(player_id=player_id, window=name):
+                    self.assertEqual(batched[player_id][name], compute_recent_metrics(logs, report_date, **window))
+        self.assertEqual(batched[1]["recent7"]["games"], 7)
+        self.assertEqual(batched[1]["season"]["games"], 19)
+        self.assertEqual(batched[3]["season"]["games"], 0)
+
+    def test_parse_team_split_stats_reads_statsapi_names(self) -> None:
+        parsed = parse_team_split_stats({"plateAppearances": "10", "atBats": "8", "hits": "2", "baseOnBalls": "2"})
+        self.assertEqual((parsed["PA"], parsed["BB"]), (10, 2))
+        self.assertEqual(parsed["OBP"], 0.4)
+
+
+class GameLogTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.report_date = dt.date(2026, 7, 20)
+        self.game_log = GameLog(
+            [
+                _log(18, 3, at_bats=4, hits=1),
+                _log(20, 9, at_bats=4, hits=0),
+                _log(10, 1, at_bats=3, hits=0),
+                _log(19, 4, at_bats=0, hits=0),
+                _log(15, 2, at_bats=4, hits=2),
+                {"date": None, "atBats": 9, "hits": 9},
+            ]
+        )
+
+    def test_rows_are_newest_first_and_undated_rows_dropped(self) -> None:
+        self.assertEqual([row["gamePk"] for row in self.game_log], [9, 4, 3, 2, 1])
+
+    def test_windows_come_from_prefix_sum_differences(self) -> None:
+        counts, games = self.game_log.window_counts(self.report_date)
+        self.assertEqual((games, counts[1], counts[2]), (4, 11, 3))
+
+        counts, games = self.game_log.window_counts(self.report_date, max_games=2)
+        self.assertEqual((games, counts[1], counts[2]), (2, 4, 1))
+
+        counts, games = self.game_log.window_counts(self.report_date, window_days=5)
+        self.assertEqual((games, counts[1], counts[2]), (3, 8, 3))
+
+        self.assertEqual(
+            compute_recent_metrics(self.game_log, self.report_date, max_games=2),
+            compute_recent_metrics(list(self.game_log), self.report_date, max_games=2),
+        )
+
+    def test_hit_streak_skips_hitless_games_without_at_bats(self) -> None:
+        self.assertEqual(self.game_log.hit_streak(self.report_date), 2)
+        self.assertEqual(compute_hit_streak(self.game_log, dt.date(2026, 7, 16)), 1)
+        self.assertEqual(compute_hit_streak(self.game_log, dt.date(2026, 7, 11)), 0)
+        self.assertEqual(compute_hit_streak(list(self.game_log), self.report_date), 2)
+
+
+def _traced_bytes(build):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        value = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del value
+    return after - before
+
+
+class GameLogRowTests(unittest.TestCase):
+    def test_batter_rows_keep_statsapi_key_access(self) -> None:
+        person = {
+            "stats": [
+                {
+                    "type": {"displayName": "gameLog"},
+                    "splits": [
+                        {
+                            "date": "2026-07-18",
+                            "game": {"gamePk": 5},
+                            "stat": {"atBats": 4, "hits": 2, "baseOnBalls": 1, "homeRuns": 1},
+                        }
+                    ],
+                }
+            ]
+        }
+        row = extract_game_logs(person)[0]
+
+        self.assertIsInstance(row, BatterGameLogRow)
+        self.assertEqual((row.game_pk, row.walks, row.home_runs), (5, 1, 1))
+        self.assertEqual((row["date"], row.get("hits"), row.get("homeRuns")), (dt.date(2026, 7, 18), 2, 1))
+        self.assertIsNone(row.get("missing"))
+        with self.assertRaises(KeyError):
+            row["missing"]
+        with self.assertRaises(AttributeError):
+            row.extra = 1
+
+    def test_pitcher_form_sums_slotted_rows(self) -> None:
+        splits = [
+            {"date": "2026-07-10", "game": {"gamePk": 1}, "stat": {"gamesStarted": 1, "inningsPitched": "6.1", "strikeOuts": 7}},
+            {"date": "2026-07-15", "game": {"gamePk": 2}, "stat": {"gamesStarted": 0, "outs": 3, "strikeOuts": 1}},
+            {"date": "2026-07-20", "game": {"gamePk": 3}, "stat": {"gamesStarted": 1, "outs": 18}},
+        ]
+        form = build_pitcher_form_from_game_logs(splits, dt.date(2026, 7, 20))
+
+        self.assertEqual((form["Games"], form["Starts"]), (2, 1))
+        self.assertAlmostEqual(form["IP"], 22 / 3)
+        self.assertAlmostEqual(form["K/9"], 8 * 27 / 22)
+
+    def test_slate_footprint_is_a_fraction_of_dict_rows(self) -> None:
+        dates = [dt.date(2026, 4, 1) + dt.timedelta(days=day) for day in range(SEASON_GAMES)]
+        keys = list(BatterGameLogRow.FIELD_BY_KEY)
+
+        def dict_rows():
+            return [
+                dict(zip(keys, (game_date, index, 4, 1, 0, 0, 0, 4, 1, 1, 0, 0)))
+                for _ in range(ROSTER_SIZE)
+                for index, game_date in enumerate(dates)
+            ]
+
+        def slotted_rows():
+            return [
+                BatterGameLogRow(game_date, index, 4, 1, 0, 0, 0, 4, 1, 1, 0, 0)
+                for _ in range(ROSTER_SIZE)
+                for index, game_date in enumerate(dates)
+            ]
+
+        dict_slate_bytes = _traced_bytes(dict_rows) * SLATE_TEAMS
+        slotted_slate_bytes = _traced_bytes(slotted_rows) * SLATE_TEAMS
+
+        self.assertLess(slotted_slate_bytes, dict_slate_bytes * 0.4)
+        self.assertLess(slotted_slate_bytes, 32 * 1024 * 1024)
+        self.assertFalse(hasattr(PitcherGameLogRow(dates[0]), "__dict__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
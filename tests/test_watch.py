@@ -0,0 +1,154 @@
+import unittest
+from unittest.mock import patch
+
+from mlb_pitcher_report import watch as watch_module
+from mlb_pitcher_report.odds import oddapi as oddapi_module
+from mlb_pitcher_report.reports import pitchers as pitchers_module
+from mlb_pitcher_report.shared import report_data as report_data_module
+from mlb_pitcher_report.watch import SOURCE_ESPN, SOURCE_ODDS, SOURCE_SCHEDULE, SlateWatcher, changed_reports
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _game(status: str = "Pre-Game", away_pitcher: str = "A Pitcher"):
+    return {
+        "game_id": 1,
+        "status": status,
+        "away_name": "Boston Red Sox",
+        "home_name": "New York Yankees",
+        "away_probable_pitcher": away_pitcher,
+        "home_probable_pitcher": "H Pitcher",
+    }
+
+
+class WatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.schedule = [_game()]
+        self.snapshot = {"event_id": "", "away_score": None, "home_score": None}
+        self.rendered = []
+        self.schedule_calls = 0
+        self.espn_calls = 0
+
+        def resolve(report_date, *, allow_roll_forward):
+            del allow_roll_forward
+            self.schedule_calls += 1
+            return report_date, [dict(game) for game in self.schedule]
+
+        def espn_state(schedule, report_date):
+            del report_date
+            self.espn_calls += 1
+            return {int(game["game_id"]): (game, dict(self.snapshot), None) for game in schedule}
+
+        def report_steps(report_date, schedule, odds, *, write_root, incremental):
+            del report_date, schedule, odds, write_root
+            self.assertTrue(incremental)
+            return [
+                (name, lambda name=name: self.rendered.append(name))
+                for name in ("pitchers", "batters", "matchups")
+            ]
+
+        patches = [
+            patch.object(report_data_module, "resolve_effective_report_date_and_schedule", side_effect=resolve),
+            patch.object(watch_module, "fetch_slate_espn_state", side_effect=espn_state),
+            patch.object(watch_module, "build_report_steps", side_effect=report_steps),
+        ]
+        for active_patch in patches:
+            active_patch.start()
+            self.addCleanup(active_patch.stop)
+
+        self.watcher = SlateWatcher(
+            "07/12/2026",
+            "y",
+            intervals={SOURCE_SCHEDULE: 60, SOURCE_ESPN: 120, SOURCE_ODDS: 600},
+            clock=self.clock,
+        )
+
+    def test_first_cycle_renders_everything_and_quiet_cycles_render_nothing(self) -> None:
+        self.assertEqual(self.watcher.run_once(), {"pitchers", "batters", "matchups"})
+        self.rendered.clear()
+
+        self.clock.now = 30
+        self.assertEqual(self.watcher.run_once(), set())
+        self.assertEqual((self.schedule_calls, self.espn_calls), (1, 1))
+
+        self.clock.now = 60
+        self.assertEqual(self.watcher.run_once(), set())
+        self.assertEqual((self.schedule_calls, self.espn_calls), (2, 1))
+        self.assertEqual(self.rendered, [])
+
+    def test_each_source_is_polled_on_its_own_interval(self) -> None:
+        self.watcher.run_once()
+        self.assertEqual(self.watcher.due_sources(59), [])
+        self.assertEqual(self.watcher.due_sources(60), [SOURCE_SCHEDULE])
+        self.assertEqual(self.watcher.due_sources(120), [SOURCE_SCHEDULE, SOURCE_ESPN])
+        self.assertEqual(self.watcher.due_sources(600), [SOURCE_SCHEDULE, SOURCE_ESPN, SOURCE_ODDS])
+        self.assertEqual(self.watcher.seconds_until_due(10), 50)
+
+    def test_probable_pitcher_change_rerenders_all_pages(self) -> None:
+        self.watcher.run_once()
+        self.rendered.clear()
+
+        self.schedule = [_game(away_pitcher="New Pitcher")]
+        self.clock.now = 60
+        self.assertEqual(self.watcher.run_once(), {"pitchers", "batters", "matchups"})
+        self.assertEqual(self.rendered, ["pitchers", "batters", "matchups"])
+
+    def test_odds_interval_rerenders_only_pitchers_with_fresh_odds(self) -> None:
+        self.watcher.run_once()
+        self.rendered.clear()
+        pitchers_module.SLATE_ODDS_CACHE["07/12/2026"] = None
+
+        self.clock.now = 600
+        with patch.object(oddapi_module, "clear_event_odds_caches") as clear_mock:
+            self.assertEqual(self.watcher.run_once(), {"pitchers"})
+        self.assertEqual(self.rendered, ["pitchers"])
+        self.assertEqual(pitchers_module.SLATE_ODDS_CACHE, {})
+        clear_mock.assert_called_once()
+
+    def test_espn_state_is_refetched_with_cleared_process_caches(self) -> None:
+        self.watcher.run_once()
+        report_data_module.ESPN_SCOREBOARD_CACHE["07/12/2026"] = []
+        self.snapshot = {**self.snapshot, "away_score": 2}
+
+        self.clock.now = 120
+        self.assertEqual(self.watcher.run_once(), {"pitchers", "batters", "matchups"})
+        self.assertNotIn("07/12/2026", report_data_module.ESPN_SCOREBOARD_CACHE)
+
+    def test_slate_rollover_clears_the_live_game_poller(self) -> None:
+        self.watcher.run_once()
+        self.watcher.date_input = "07/13/2026"
+
+        self.clock.now = 60
+        with patch.object(watch_module.live_games, "get_live_game_poller") as poller_mock, patch("builtins.print"):
+            self.watcher.run_once()
+        self.assertEqual(self.watcher.report_date, "07/13/2026")
+        poller_mock.return_value.clear.assert_called_once()
+
+    def test_game_total_change_only_affects_matchups(self) -> None:
+        previous = {1: {"status": "Pre-Game", "game_total": 8.5}}
+        self.assertEqual(changed_reports(previous, {1: {"status": "Pre-Game", "game_total": 9.0}}), {"matchups"})
+        self.assertEqual(changed_reports(previous, {2: {"status": "Pre-Game", "game_total": 8.5}}), {"pitchers", "batters", "matchups"})
+
+    def test_run_sleeps_until_next_source_is_due(self) -> None:
+        sleeps = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            self.clock.now += seconds
+
+        self.watcher.run(max_cycles=3, sleep=fake_sleep)
+
+        self.assertEqual(sleeps, [60, 60])
+        self.assertEqual(self.schedule_calls, 3)
+        self.assertEqual(self.espn_calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()